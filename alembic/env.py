@@ -16,6 +16,9 @@ from app.models.doc_model import Document
 from app.models.doc_category_model import DocumentCategory
 from app.models.doc_request_model import DocumentRequest
 from app.models.doc_permission_model import DocumentPermission
+from app.models.calculation_workspace_model import CalculationWorkspace, CalculationNode, CalculationEdge
+from app.models.yield_curve_model import YieldCurve
+from app.models.fixed_asset_model import FixedAsset, DepreciationScheduleEntry
 
 cmd_kwargs = context.get_x_argument(as_dictionary=True)
 if "ENV" in cmd_kwargs:
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.core.exceptions import ServiceUnavailableError
+
+def warm_worker():
+    # Runs once per worker process, so requests never pay for the scientific stack imports.
+    import numpy  # noqa: F401
+    import scipy.optimize  # noqa: F401
+    import app.services.calculators.depreciation_calculator  # noqa: F401
+    import app.services.calculators.goal_seeking_weighted_average  # noqa: F401
+    import app.services.calculators.present_value_calculator  # noqa: F401
+
+def worker_pid(_: int = 0) -> int:
+    return os.getpid()
+
+class ComputePool:
+    # Work below `threshold` (roughly the number of matrix cells a request touches)
+    # stays on the threadpool like any sync route. Larger work goes to worker processes,
+    # and at most `max_pending` such jobs are admitted at once; beyond that callers get
+    # a 503 with Retry-After instead of queueing behind each other.
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        threshold: int = 200_000,
+        retry_after: int = 5
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.threshold = threshold
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=warm_worker)
+            return self._executor
+
+    def warm(self):
+        list(self.executor.map(worker_pid, range(self.max_workers)))
+
+    def shutdown(self):
+        # Cancels queued jobs and waits for running ones; the next job starts a new pool.
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _acquire(self):
+        if not self._slots.acquire(blocking=False):
+            raise ServiceUnavailableError(
+                "Too many large calculations are running. Please retry later.",
+                headers={"Retry-After": str(self.retry_after)}
+            )
+
+    @contextmanager
+    def slot(self):
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    async def run(self, size: int, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if size < self.threshold:
+            return await run_in_threadpool(func, *args, **kwargs)
+        with self.slot():
+            return await asyncio.wrap_future(self.executor.submit(partial(func, *args, **kwargs)))
+
+    def stream(self, size: int, func: Callable[..., Any], chunks: Iterable[Tuple[Any, ...]]) -> AsyncIterator[Any]:
+        # For streamed responses: func(*chunk) runs once per chunk, in order. Admission
+        # is decided here, before the response starts, so a full pool still gets a 503;
+        # an admitted stream holds its slot until the last chunk is sent.
+        offload = size >= self.threshold
+        if offload:
+            self._acquire()
+
+        async def results() -> AsyncIterator[Any]:
+            try:
+                for chunk in chunks:
+                    if offload:
+                        yield await asyncio.wrap_future(self.executor.submit(partial(func, *chunk)))
+                    else:
+                        yield await run_in_threadpool(func, *chunk)
+            finally:
+                if offload:
+                    self._slots.release()
+        return results()
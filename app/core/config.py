@@ -62,6 +62,25 @@ class Configs(BaseSettings):
     PAGE_SIZE: int = 20
     ORDERING: str = "-id"
 
+    GOAL_SEEKING_SCENARIO_MAX: int = int(os.getenv("GOAL_SEEKING_SCENARIO_MAX", 1000))
+    GOAL_SEEKING_SCENARIO_TTL: int = int(os.getenv("GOAL_SEEKING_SCENARIO_TTL", 3600))
+    GOAL_SEEKING_UPLOAD_MAX_ROWS: int = int(os.getenv("GOAL_SEEKING_UPLOAD_MAX_ROWS", 500_000))
+    GOAL_SEEK_BRACKET_MAX: int = int(os.getenv("GOAL_SEEK_BRACKET_MAX", 1000))
+    ROLL_RATE_HISTORY_MAX: int = int(os.getenv("ROLL_RATE_HISTORY_MAX", 50))
+    ROLL_RATE_HISTORY_TTL: int = int(os.getenv("ROLL_RATE_HISTORY_TTL", 86400))
+    COMPUTE_POOL_WORKERS: int = int(os.getenv("COMPUTE_POOL_WORKERS", os.cpu_count() or 1))
+    COMPUTE_POOL_MAX_PENDING: int = int(os.getenv("COMPUTE_POOL_MAX_PENDING", 2 * (os.cpu_count() or 1)))
+    COMPUTE_POOL_THRESHOLD: int = int(os.getenv("COMPUTE_POOL_THRESHOLD", 200_000))
+    COMPUTE_POOL_RETRY_AFTER: int = int(os.getenv("COMPUTE_POOL_RETRY_AFTER", 5))
+    COMPUTE_POOL_WARM: bool = os.getenv("COMPUTE_POOL_WARM", "true").lower() == "true"
+    RESULT_CACHE_MAX: int = int(os.getenv("RESULT_CACHE_MAX", 10_000))
+    RESULT_CACHE_TTL: int = int(os.getenv("RESULT_CACHE_TTL", 3600))
+    RESULT_CACHE_VERSION: str = os.getenv("RESULT_CACHE_VERSION", "1")
+    YIELD_CURVE_CACHE_MAX: int = int(os.getenv("YIELD_CURVE_CACHE_MAX", 256))
+    YIELD_CURVE_CACHE_MAX_ELEMENTS: int = int(os.getenv("YIELD_CURVE_CACHE_MAX_ELEMENTS", 16_000_000))
+    SIMULATION_TIMEOUT: float = float(os.getenv("SIMULATION_TIMEOUT", 30))
+    SIMULATION_MAX_DRAWS: int = int(os.getenv("SIMULATION_MAX_DRAWS", 1_000_000))
+
     NGROK_AUTHTOKEN: str = os.getenv("NGROK_AUTHTOKEN", "secret")
     NGROK_DOMAIN: str = os.getenv('NGROK_DOMAIN', "http://localhost:8000")
 
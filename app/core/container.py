@@ -1,17 +1,31 @@
 from dependency_injector import containers, providers
 from app.core.config import configs
+from app.core.compute_pool import ComputePool
 from app.core.database import Database
+from app.core.result_cache import ResultCache
 from app.repositories.user_repo import UserRepository
+from app.repositories.calculation_workspace_repo import CalculationWorkspaceRepository
 from app.repositories.company_repo import CompanyRepository
 from app.repositories.docs_category_repo import DocsCategoryRepository
 from app.repositories.docs_request_repo import DocsRequestRepository
 from app.repositories.docs_repo import DocsRepository
+from app.repositories.yield_curve_repo import YieldCurveRepository
+from app.repositories.fixed_asset_repo import FixedAssetRepository
 from app.services.user_service import UserService
 from app.services.auth_service import AuthService
 from app.services.company_service import CompanyService
+from app.services.calculation_workspace_service import CalculationWorkspaceService
 from app.services.docs_manager.docs_category_service import DocsCategoryService
 from app.services.docs_manager.docs_request_service import DocsRequestService
 from app.services.docs_manager.docs_service import DocsService
+from app.services.yield_curve_service import YieldCurveService
+from app.services.fixed_asset_service import FixedAssetService
+from app.services.calculators.goal_seek import GoalSeekServices
+from app.services.calculators.goal_seeking_bulk import GoalSeekingBulk
+from app.services.calculators.goal_seeking_scenario import GoalSeekingScenarioStore
+from app.services.calculators.roll_rate_migration import RollRateHistoryStore
+from app.services.calculators.goal_seeking_simulation import GoalSeekingSimulation
+from app.services.calculators.yield_curve import YieldCurveServices
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
@@ -24,6 +38,9 @@ class Container(containers.DeclarativeContainer):
             "app.routes.endpoints.docs_category",
             "app.routes.endpoints.docs_request",
             "app.routes.endpoints.docs",
+            "app.routes.endpoints.calculation_workspace",
+            "app.routes.endpoints.yield_curve",
+            "app.routes.endpoints.fixed_asset",
             "app.core.dependencies",
         ]
     )
@@ -35,10 +52,61 @@ class Container(containers.DeclarativeContainer):
     docs_category_repository = providers.Factory(DocsCategoryRepository, session_factory=db.provided.session)
     docs_request_repository = providers.Factory(DocsRequestRepository, session_factory=db.provided.session)
     docs_repository = providers.Factory(DocsRepository, session_factory=db.provided.session)
+    calculation_workspace_repository = providers.Factory(CalculationWorkspaceRepository, session_factory=db.provided.session)
+    yield_curve_repository = providers.Factory(YieldCurveRepository, session_factory=db.provided.session)
+    fixed_asset_repository = providers.Factory(FixedAssetRepository, session_factory=db.provided.session)
 
     user_service = providers.Factory(UserService, user_repository=user_repository)
     auth_service = providers.Factory(AuthService, user_repository=user_repository)
     company_service = providers.Factory(CompanyService, company_repository=company_repository)
     docs_category_service = providers.Factory(DocsCategoryService, docs_category_repository=docs_category_repository)
     docs_request_service = providers.Factory(DocsRequestService, docs_req_repository=docs_request_repository, user_repository=user_repository)
-    docs_service = providers.Factory(DocsService, docs_repository=docs_repository, company_repository=company_repository)
\ No newline at end of file
+    docs_service = providers.Factory(DocsService, docs_repository=docs_repository, company_repository=company_repository)
+    fixed_asset_service = providers.Factory(FixedAssetService, fixed_asset_repository=fixed_asset_repository, company_repository=company_repository)
+    goal_seeking_scenario_store = providers.Singleton(
+        GoalSeekingScenarioStore,
+        max_scenarios=configs.GOAL_SEEKING_SCENARIO_MAX,
+        ttl_seconds=configs.GOAL_SEEKING_SCENARIO_TTL
+    )
+    goal_seeking_bulk = providers.Singleton(GoalSeekingBulk, max_rows=configs.GOAL_SEEKING_UPLOAD_MAX_ROWS)
+    goal_seek = providers.Singleton(GoalSeekServices, max_brackets=configs.GOAL_SEEK_BRACKET_MAX)
+    roll_rate_history_store = providers.Singleton(
+        RollRateHistoryStore,
+        max_items=configs.ROLL_RATE_HISTORY_MAX,
+        ttl_seconds=configs.ROLL_RATE_HISTORY_TTL
+    )
+    compute_pool = providers.Singleton(
+        ComputePool,
+        max_workers=configs.COMPUTE_POOL_WORKERS,
+        max_pending=configs.COMPUTE_POOL_MAX_PENDING,
+        threshold=configs.COMPUTE_POOL_THRESHOLD,
+        retry_after=configs.COMPUTE_POOL_RETRY_AFTER
+    )
+    result_cache = providers.Singleton(
+        ResultCache,
+        max_entries=configs.RESULT_CACHE_MAX,
+        ttl_seconds=configs.RESULT_CACHE_TTL,
+        version=configs.RESULT_CACHE_VERSION
+    )
+    goal_seeking_simulation = providers.Singleton(
+        GoalSeekingSimulation,
+        pool=compute_pool,
+        timeout_seconds=configs.SIMULATION_TIMEOUT,
+        max_draws=configs.SIMULATION_MAX_DRAWS
+    )
+    calculation_workspace_service = providers.Factory(
+        CalculationWorkspaceService,
+        calculation_workspace_repository=calculation_workspace_repository,
+        company_repository=company_repository,
+        result_cache=result_cache
+    )
+    yield_curves = providers.Singleton(
+        YieldCurveServices,
+        max_curves=configs.YIELD_CURVE_CACHE_MAX,
+        max_elements=configs.YIELD_CURVE_CACHE_MAX_ELEMENTS
+    )
+    yield_curve_service = providers.Factory(
+        YieldCurveService,
+        yield_curve_repository=yield_curve_repository,
+        yield_curves=yield_curves
+    )
@@ -4,9 +4,14 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import ValidationError
+from app.core.compute_pool import ComputePool
 from app.core.config import configs
 from app.core.container import Container
+from app.core.result_cache import ResultCache
 from app.schema.user_schema import FindUserByOptionsResponse, User
+from app.services.calculators.goal_seek import GoalSeekServices
+from app.services.calculators.goal_seeking_bulk import GoalSeekingBulk
+from app.services.calculators.goal_seeking_simulation import GoalSeekingSimulation
 from app.services.user_service import UserService
 
 @inject
@@ -58,4 +63,24 @@ def get_current_user(
             detail="User not found",
         )
 
-    return current_user
\ No newline at end of file
+    return current_user
+
+@inject
+def get_compute_pool(pool: ComputePool = Depends(Provide[Container.compute_pool])) -> ComputePool:
+    return pool
+
+@inject
+def get_result_cache(cache: ResultCache = Depends(Provide[Container.result_cache])) -> ResultCache:
+    return cache
+
+@inject
+def get_goal_seeking_simulation(simulation: GoalSeekingSimulation = Depends(Provide[Container.goal_seeking_simulation])) -> GoalSeekingSimulation:
+    return simulation
+
+@inject
+def get_goal_seeking_bulk(bulk: GoalSeekingBulk = Depends(Provide[Container.goal_seeking_bulk])) -> GoalSeekingBulk:
+    return bulk
+
+@inject
+def get_goal_seek(goal_seek: GoalSeekServices = Depends(Provide[Container.goal_seek])) -> GoalSeekServices:
+    return goal_seek
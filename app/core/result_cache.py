@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from fastapi import Request, Response, status
+
+class ResultCache:
+    # Results of pure calculator endpoints, keyed by a hash of the endpoint name, the
+    # parsed inputs and a version string (bump it when calculator output changes).
+    # The key doubles as the ETag, so an If-None-Match naming the key of a result
+    # still in the cache is answered with 304 without computing anything. Keys that
+    # were never computed (or failed validation) are never cached, and "*" does not
+    # short-circuit a calculation.
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: int = 3600, version: str = "1"):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, endpoint: str, inputs: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            {"version": self.version, "endpoint": endpoint, "inputs": inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() - entry[1] < self.ttl_seconds
+
+    def etag_matches(self, if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+    def respond(self, request: Request, response: Response, endpoint: str, inputs: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        key = self.key(endpoint, inputs)
+        etag = f'"{key}"'
+        if self.etag_matches(request.headers.get("if-none-match"), etag) and self.contains(key):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        result = self.get_or_compute(key, compute)
+        response.headers["ETag"] = etag
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
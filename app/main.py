@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 import ngrok
 import uvicorn
 from app.core.config import configs
@@ -8,7 +9,7 @@ from app.core.container import Container
 from app.core.middleware import register_middleware
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def ngrok_lifespan(app: FastAPI):
     if configs.ENV == "development":
         ngrok.set_auth_token(configs.NGROK_AUTHTOKEN)
         print(f"Setting up Ngrok Tunnel on {configs.NGROK_DOMAIN}")
@@ -22,6 +23,20 @@ async def lifespan(app: FastAPI):
         ngrok.disconnect()
 
 def create_app() -> FastAPI:
+    container = Container()
+    container.db()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Worker processes are started before the first request and stopped with the app.
+        compute_pool = container.compute_pool()
+        if configs.COMPUTE_POOL_WARM:
+            await run_in_threadpool(compute_pool.warm)
+        try:
+            yield
+        finally:
+            await run_in_threadpool(compute_pool.shutdown)
+
     app = FastAPI(
         title=configs.PROJECT_NAME,
         version="1.5.0",
@@ -29,12 +44,9 @@ def create_app() -> FastAPI:
         docs_url=f"{configs.API_PREFIX}/docs",
         redoc_url=f"{configs.API_PREFIX}/redoc",
         openapi_url=f"{configs.API_PREFIX}/openapi.json",
-        # lifespan=lifespan
+        lifespan=lifespan
     )
 
-    container = Container()
-    container.db()
-
     register_middleware(app)
 
     @app.get(f"{configs.API_PREFIX}/health", tags=["Health Check"])
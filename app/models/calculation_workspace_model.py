@@ -0,0 +1,43 @@
+import uuid
+from typing import Any, Dict, Optional
+from datetime import datetime
+from sqlalchemy import Column, DateTime, JSON, UniqueConstraint, func
+from sqlmodel import Field, Text
+from app.models.base_model import BaseModel
+
+class CalculationWorkspace(BaseModel, table=True):
+    __tablename__ = "calculation_workspaces"
+    __table_args__ = (UniqueConstraint("company_id", "year"),)
+
+    company_id: uuid.UUID = Field(foreign_key="companies.id", index=True)
+    year: int = Field()
+
+    created_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now()))
+    updated_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now(), onupdate=func.now()))
+
+class CalculationNode(BaseModel, table=True):
+    __tablename__ = "calculation_nodes"
+    __table_args__ = (UniqueConstraint("workspace_id", "name"),)
+
+    workspace_id: uuid.UUID = Field(foreign_key="calculation_workspaces.id", index=True)
+    name: str = Field(max_length=100)
+    calculator: str = Field(max_length=50)
+    inputs: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    input_hash: Optional[str] = Field(default=None, max_length=64)
+    output: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = Field(default=None, sa_column=Column(Text))
+
+    created_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now()))
+    updated_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now(), onupdate=func.now()))
+
+class CalculationEdge(BaseModel, table=True):
+    __tablename__ = "calculation_edges"
+    __table_args__ = (UniqueConstraint("target_node_id", "target_input"),)
+
+    workspace_id: uuid.UUID = Field(foreign_key="calculation_workspaces.id", index=True)
+    source_node_id: uuid.UUID = Field(foreign_key="calculation_nodes.id")
+    source_output: str = Field(max_length=100)
+    target_node_id: uuid.UUID = Field(foreign_key="calculation_nodes.id")
+    target_input: str = Field(max_length=100)
+
+    created_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now()))
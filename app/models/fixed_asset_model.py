@@ -0,0 +1,45 @@
+import uuid
+from typing import List, Optional
+from datetime import date, datetime
+from sqlalchemy import Column, Date, DateTime, Double, Index, JSON, Numeric, UniqueConstraint, func
+from sqlmodel import Field
+from app.models.base_model import BaseModel
+
+# Amounts are kept to the sen; FLOAT would round IDR values to about 7 digits.
+MONEY = Numeric(20, 2, asdecimal=False)
+
+class FixedAsset(BaseModel, table=True):
+    __tablename__ = "fixed_assets"
+    __table_args__ = (UniqueConstraint("company_id", "code"),)
+
+    company_id: uuid.UUID = Field(foreign_key="companies.id", index=True)
+    code: str = Field(max_length=50)
+    name: str = Field(max_length=200)
+    harga_perolehan: float = Field(sa_column=Column(MONEY, nullable=False))
+    estimasi_umur: float = Field(sa_column=Column(Double, nullable=False))
+    estimasi_nilai_sisa: float = Field(default=0, sa_column=Column(MONEY, nullable=False))
+    metode: str = Field(max_length=50)
+    tanggal_perolehan: date = Field(sa_column=Column(Date, nullable=False))
+    unit_per_tahun: Optional[List[float]] = Field(default=None, sa_column=Column(JSON))
+    estimasi_total_unit: Optional[float] = Field(default=None, sa_column=Column(Double))
+    input_hash: str = Field(max_length=64)
+
+    created_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now()))
+    updated_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now(), onupdate=func.now()))
+
+class DepreciationScheduleEntry(BaseModel, table=True):
+    # Materialized monthly schedule of each fixed asset, rewritten whenever the
+    # asset's inputs change. company_id is copied from the asset so period-end
+    # totals are one aggregate over the (company_id, period) index.
+    __tablename__ = "depreciation_schedules"
+    __table_args__ = (
+        UniqueConstraint("asset_id", "period"),
+        Index("ix_depreciation_schedules_company_id_period", "company_id", "period"),
+    )
+
+    asset_id: uuid.UUID = Field(foreign_key="fixed_assets.id")
+    company_id: uuid.UUID = Field(foreign_key="companies.id")
+    period: date = Field(sa_column=Column(Date, nullable=False))
+    depreciation: float = Field(sa_column=Column(MONEY, nullable=False))
+    accumulated_depreciation: float = Field(sa_column=Column(MONEY, nullable=False))
+    book_value: float = Field(sa_column=Column(MONEY, nullable=False))
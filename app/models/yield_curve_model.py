@@ -0,0 +1,18 @@
+from typing import List, Optional
+from datetime import datetime
+from sqlalchemy import Column, DateTime, JSON, UniqueConstraint, func
+from sqlmodel import Field, Text
+from app.models.base_model import BaseModel
+
+class YieldCurve(BaseModel, table=True):
+    __tablename__ = "yield_curves"
+    __table_args__ = (UniqueConstraint("name", "version"),)
+
+    name: str = Field(max_length=100, index=True)
+    version: int = Field()
+    interpolation: str = Field(max_length=20)
+    tenors: List[float] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    rates: List[float] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    description: Optional[str] = Field(default=None, sa_column=Column(Text))
+
+    created_at: Optional[datetime] = Field(sa_column=Column(DateTime(timezone=True), default=func.now()))
@@ -0,0 +1,144 @@
+from uuid import UUID
+from sqlmodel import Session, select
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Optional
+from app.models.calculation_workspace_model import CalculationEdge, CalculationNode, CalculationWorkspace
+from app.repositories.base_repo import BaseRepository
+from app.schema.calculation_workspace_schema import CalculationEdge as CalculationEdgeSchema, CalculationNode as CalculationNodeSchema, CalculationWorkspace as CalculationWorkspaceSchema
+
+class CalculationWorkspaceRepository(BaseRepository):
+    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+        self.session_factory = session_factory
+        super().__init__(session_factory, CalculationWorkspace)
+
+    def _as_schema(self, session: Session, workspace: CalculationWorkspace) -> CalculationWorkspaceSchema:
+        nodes = session.exec(
+            select(CalculationNode).where(CalculationNode.workspace_id == workspace.id).order_by(CalculationNode.created_at, CalculationNode.name)
+        ).all()
+        edges = session.exec(select(CalculationEdge).where(CalculationEdge.workspace_id == workspace.id)).all()
+        names = {node.id: node.name for node in nodes}
+        return CalculationWorkspaceSchema(
+            id=workspace.id,
+            company_id=workspace.company_id,
+            year=workspace.year,
+            nodes=[CalculationNodeSchema.model_validate(node, from_attributes=True) for node in nodes],
+            edges=[
+                CalculationEdgeSchema(
+                    id=edge.id,
+                    source=names[edge.source_node_id],
+                    output=edge.source_output,
+                    target=names[edge.target_node_id],
+                    input=edge.target_input,
+                )
+                for edge in edges
+            ],
+            created_at=workspace.created_at,
+            updated_at=workspace.updated_at,
+        )
+
+    def _save_nodes(self, session: Session, workspace_id: UUID, updates: Dict[str, Dict[str, Any]]) -> None:
+        if not updates:
+            return
+        nodes = session.exec(
+            select(CalculationNode).where(CalculationNode.workspace_id == workspace_id, CalculationNode.name.in_(list(updates)))
+        ).all()
+        for node in nodes:
+            for field in ("inputs", "input_hash", "output", "error"):
+                setattr(node, field, updates[node.name][field])
+            session.add(node)
+
+    def get_workspace(self, workspace_id: UUID) -> Optional[CalculationWorkspaceSchema]:
+        with self.session_factory() as session:
+            workspace = session.get(CalculationWorkspace, workspace_id)
+            if workspace is None:
+                return None
+            return self._as_schema(session, workspace)
+
+    def get_workspace_by_company_year(self, company_id: UUID, year: int) -> Optional[CalculationWorkspaceSchema]:
+        with self.session_factory() as session:
+            statement = select(CalculationWorkspace).where(CalculationWorkspace.company_id == company_id, CalculationWorkspace.year == year)
+            workspace = session.exec(statement).first()
+            if workspace is None:
+                return None
+            return self._as_schema(session, workspace)
+
+    def create_workspace(self, company_id: UUID, year: int) -> CalculationWorkspaceSchema:
+        with self.session_factory() as session:
+            workspace = CalculationWorkspace(company_id=company_id, year=year)
+
+            session.add(workspace)
+            session.commit()
+            session.refresh(workspace)
+
+            return self._as_schema(session, workspace)
+
+    def delete_workspace(self, workspace_id: UUID) -> bool:
+        with self.session_factory() as session:
+            workspace = session.get(CalculationWorkspace, workspace_id)
+            if workspace is None:
+                return False
+
+            for model in (CalculationEdge, CalculationNode):
+                for row in session.exec(select(model).where(model.workspace_id == workspace_id)).all():
+                    session.delete(row)
+                session.flush()
+            session.delete(workspace)
+            session.commit()
+            return True
+
+    def create_node(self, workspace_id: UUID, name: str, node: Dict[str, Any], updates: Dict[str, Dict[str, Any]]) -> None:
+        with self.session_factory() as session:
+            session.add(CalculationNode(
+                workspace_id=workspace_id,
+                name=name,
+                calculator=node["calculator"],
+                inputs=node["inputs"],
+                input_hash=node["input_hash"],
+                output=node["output"],
+                error=node["error"],
+            ))
+            self._save_nodes(session, workspace_id, updates)
+            session.commit()
+
+    def update_nodes(self, workspace_id: UUID, updates: Dict[str, Dict[str, Any]]) -> None:
+        with self.session_factory() as session:
+            self._save_nodes(session, workspace_id, updates)
+            session.commit()
+
+    def delete_node(self, workspace_id: UUID, node_id: UUID, updates: Dict[str, Dict[str, Any]]) -> None:
+        with self.session_factory() as session:
+            statement = select(CalculationEdge).where(
+                (CalculationEdge.source_node_id == node_id) | (CalculationEdge.target_node_id == node_id)
+            )
+            for edge in session.exec(statement).all():
+                session.delete(edge)
+            session.flush()
+            session.delete(session.get(CalculationNode, node_id))
+            self._save_nodes(session, workspace_id, updates)
+            session.commit()
+
+    def create_edge(
+        self,
+        workspace_id: UUID,
+        source_node_id: UUID,
+        source_output: str,
+        target_node_id: UUID,
+        target_input: str,
+        updates: Dict[str, Dict[str, Any]]
+    ) -> None:
+        with self.session_factory() as session:
+            session.add(CalculationEdge(
+                workspace_id=workspace_id,
+                source_node_id=source_node_id,
+                source_output=source_output,
+                target_node_id=target_node_id,
+                target_input=target_input,
+            ))
+            self._save_nodes(session, workspace_id, updates)
+            session.commit()
+
+    def delete_edge(self, workspace_id: UUID, edge_id: UUID, updates: Dict[str, Dict[str, Any]]) -> None:
+        with self.session_factory() as session:
+            session.delete(session.get(CalculationEdge, edge_id))
+            self._save_nodes(session, workspace_id, updates)
+            session.commit()
@@ -0,0 +1,84 @@
+from uuid import UUID
+from datetime import date
+from sqlmodel import Session, delete, func, insert, select, update
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from app.models.fixed_asset_model import DepreciationScheduleEntry, FixedAsset
+from app.repositories.base_repo import BaseRepository
+from app.schema.fixed_asset_schema import FixedAsset as FixedAssetSchema, FixedAssetDetail, PeriodDepreciation
+
+class FixedAssetRepository(BaseRepository):
+    DELETE_BATCH_SIZE = 1000
+
+    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+        self.session_factory = session_factory
+        super().__init__(session_factory, FixedAsset)
+
+    def get_asset(self, asset_id: UUID) -> Optional[FixedAssetDetail]:
+        with self.session_factory() as session:
+            asset = session.get(FixedAsset, asset_id)
+            if asset is None:
+                return None
+            schedule = session.exec(
+                select(DepreciationScheduleEntry).where(DepreciationScheduleEntry.asset_id == asset_id).order_by(DepreciationScheduleEntry.period)
+            ).all()
+            return FixedAssetDetail.model_validate({**asset.model_dump(), "schedule": [entry.model_dump() for entry in schedule]})
+
+    def list_assets(self, company_id: UUID) -> List[FixedAssetSchema]:
+        with self.session_factory() as session:
+            statement = select(FixedAsset).where(FixedAsset.company_id == company_id).order_by(FixedAsset.code)
+            return [FixedAssetSchema.model_validate(asset, from_attributes=True) for asset in session.exec(statement).all()]
+
+    def get_period_depreciation(self, company_id: UUID, period_start: date, period_end: date) -> List[PeriodDepreciation]:
+        with self.session_factory() as session:
+            statement = (
+                select(
+                    DepreciationScheduleEntry.period,
+                    func.sum(DepreciationScheduleEntry.depreciation),
+                    func.count(DepreciationScheduleEntry.id),
+                )
+                .where(
+                    DepreciationScheduleEntry.company_id == company_id,
+                    DepreciationScheduleEntry.period >= period_start,
+                    DepreciationScheduleEntry.period <= period_end,
+                )
+                .group_by(DepreciationScheduleEntry.period)
+                .order_by(DepreciationScheduleEntry.period)
+            )
+            return [
+                PeriodDepreciation(period=period, depreciation=total, asset_count=count)
+                for period, total, count in session.exec(statement).all()
+            ]
+
+    def save_assets(
+        self,
+        created: List[Dict[str, Any]],
+        updated: List[Dict[str, Any]],
+        replaced: List[UUID],
+        schedule: Iterable[List[Dict[str, Any]]]
+    ) -> None:
+        # One transaction: asset rows, then the schedules of the assets in replaced
+        # are dropped and the new schedule batches are inserted.
+        with self.session_factory() as session:
+            if created:
+                session.execute(insert(FixedAsset), created)
+            if updated:
+                session.execute(update(FixedAsset), updated)
+            for start in range(0, len(replaced), self.DELETE_BATCH_SIZE):
+                batch = replaced[start:start + self.DELETE_BATCH_SIZE]
+                session.execute(delete(DepreciationScheduleEntry).where(DepreciationScheduleEntry.asset_id.in_(batch)))
+            # Schedule rows go through a Core insert, skipping the ORM's per-row bookkeeping.
+            for rows in schedule:
+                if rows:
+                    session.execute(insert(DepreciationScheduleEntry.__table__), rows)
+            session.commit()
+
+    def delete_asset(self, asset_id: UUID) -> bool:
+        with self.session_factory() as session:
+            asset = session.get(FixedAsset, asset_id)
+            if asset is None:
+                return False
+            session.execute(delete(DepreciationScheduleEntry).where(DepreciationScheduleEntry.asset_id == asset_id))
+            session.delete(asset)
+            session.commit()
+            return True
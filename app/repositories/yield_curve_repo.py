@@ -0,0 +1,70 @@
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select
+from contextlib import AbstractContextManager
+from typing import Callable, List, Optional
+from app.models.yield_curve_model import YieldCurve
+from app.repositories.base_repo import BaseRepository
+from app.schema.yield_curve_schema import YieldCurve as YieldCurveSchema
+
+class YieldCurveRepository(BaseRepository):
+    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+        self.session_factory = session_factory
+        super().__init__(session_factory, YieldCurve)
+
+    def get_curve(self, name: str, version: Optional[int] = None) -> Optional[YieldCurveSchema]:
+        with self.session_factory() as session:
+            statement = select(YieldCurve).where(YieldCurve.name == name)
+            if version is None:
+                statement = statement.order_by(YieldCurve.version.desc())
+            else:
+                statement = statement.where(YieldCurve.version == version)
+            curve = session.exec(statement).first()
+            if curve is None:
+                return None
+            return YieldCurveSchema.model_validate(curve, from_attributes=True)
+
+    def list_curves(self) -> List[YieldCurveSchema]:
+        with self.session_factory() as session:
+            latest = select(YieldCurve.name, func.max(YieldCurve.version).label("version")).group_by(YieldCurve.name).subquery()
+            statement = (
+                select(YieldCurve)
+                .join(latest, (YieldCurve.name == latest.c.name) & (YieldCurve.version == latest.c.version))
+                .order_by(YieldCurve.name)
+            )
+            return [YieldCurveSchema.model_validate(curve, from_attributes=True) for curve in session.exec(statement).all()]
+
+    def list_versions(self, name: str) -> List[YieldCurveSchema]:
+        with self.session_factory() as session:
+            statement = select(YieldCurve).where(YieldCurve.name == name).order_by(YieldCurve.version)
+            return [YieldCurveSchema.model_validate(curve, from_attributes=True) for curve in session.exec(statement).all()]
+
+    def create_curve(
+        self,
+        name: str,
+        interpolation: str,
+        tenors: List[float],
+        rates: List[float],
+        description: Optional[str] = None
+    ) -> Optional[YieldCurveSchema]:
+        with self.session_factory() as session:
+            # The (name, version) unique constraint rejects a concurrent upload that
+            # picked the same version; that upload gets None back.
+            latest = session.exec(select(func.max(YieldCurve.version)).where(YieldCurve.name == name)).first()
+            curve = YieldCurve(
+                name=name,
+                version=(latest or 0) + 1,
+                interpolation=interpolation,
+                tenors=tenors,
+                rates=rates,
+                description=description,
+            )
+
+            session.add(curve)
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                return None
+            session.refresh(curve)
+
+            return YieldCurveSchema.model_validate(curve, from_attributes=True)
@@ -0,0 +1,125 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, status
+from dependency_injector.wiring import Provide
+from app.core.container import Container
+from app.core.middleware import inject
+from app.core.dependencies import get_current_user
+from app.schema.calculation_workspace_schema import CalculationWorkspaceResponse, CreateCalculationEdgeRequest, CreateCalculationNodeRequest, CreateCalculationWorkspaceRequest, DeleteCalculationWorkspaceResponse, UpdateCalculationNodeRequest
+from app.services.calculation_workspace_service import CalculationWorkspaceService
+
+router = APIRouter(prefix="/workspaces", tags=["Calculation Workspace"])
+
+@router.post("/",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_201_CREATED,
+    response_model_exclude_none=True)
+@inject
+def create_workspace(
+    request: CreateCalculationWorkspaceRequest,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.create_workspace(request.company_id, request.year)
+
+@router.get("/companies/{company_id}/{year}",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def get_workspace_by_company_year(
+    company_id: UUID,
+    year: int,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.get_workspace_by_company_year(company_id, year)
+
+@router.get("/{workspace_id}",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def get_workspace(
+    workspace_id: UUID,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.get_workspace(workspace_id)
+
+@router.delete("/{workspace_id}",
+    response_model=DeleteCalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def delete_workspace(
+    workspace_id: UUID,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.delete_workspace(workspace_id)
+
+@router.post("/{workspace_id}/nodes",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_201_CREATED,
+    response_model_exclude_none=True)
+@inject
+def add_node(
+    workspace_id: UUID,
+    request: CreateCalculationNodeRequest,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.add_node(workspace_id, request.name, request.calculator, request.inputs)
+
+@router.patch("/{workspace_id}/nodes/{name}",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def update_node(
+    workspace_id: UUID,
+    name: str,
+    request: UpdateCalculationNodeRequest,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.update_node(workspace_id, name, request.inputs)
+
+@router.delete("/{workspace_id}/nodes/{name}",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def delete_node(
+    workspace_id: UUID,
+    name: str,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.delete_node(workspace_id, name)
+
+@router.post("/{workspace_id}/edges",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_201_CREATED,
+    response_model_exclude_none=True)
+@inject
+def add_edge(
+    workspace_id: UUID,
+    request: CreateCalculationEdgeRequest,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.add_edge(workspace_id, request.source, request.output, request.target, request.input)
+
+@router.delete("/{workspace_id}/edges/{edge_id}",
+    response_model=CalculationWorkspaceResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def delete_edge(
+    workspace_id: UUID,
+    edge_id: UUID,
+    service: CalculationWorkspaceService = Depends(Provide[Container.calculation_workspace_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.delete_edge(workspace_id, edge_id)
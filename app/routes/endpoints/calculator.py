@@ -1,76 +1,405 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
-from typing import List
+import numpy as np
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from dependency_injector.wiring import Provide
+from app.core.compute_pool import ComputePool
+from app.core.container import Container
+from app.core.dependencies import get_compute_pool, get_current_user, get_goal_seek, get_result_cache
+from app.core.middleware import inject
+from app.core.result_cache import ResultCache
+from app.schema.calculator_schema import AmortizationRequest, DepreciationBatchRequest, DepreciationBatchResponse, DepreciationByYearResponse, DepreciationScheduleRequest, GoalSeekRequest, GoalSeekResponse, InternalRateOfReturnRequest, InternalRateOfReturnResponse, NetPresentValueRequest, NetPresentValueResponse, SensitivityRequest, SensitivityResponse, TimeValueOfMoneyRequest, TimeValueOfMoneyResponse
+from app.services.company_service import CompanyService
 from app.services.calculators.calculator_service import CalculatorServices
+from app.services.calculators.amortization_calculator import AmortizationServices
 from app.services.calculators.depreciation_calculator import PenyusutanCalculatorServices
+from app.services.calculators.depreciation_methods import DEPRECIATION_METHODS
+from app.services.calculators.fixed_point import DEFAULT_SCALE, from_minor, to_minor
+from app.services.calculators.goal_seek import GoalSeekServices
 from app.services.calculators.present_value_calculator import PresentValueServices
+from app.services.calculators.irr_calculator import InternalRateOfReturnServices
+from app.services.calculators.sensitivity import SensitivityServices
+from app.services.calculators.tvm_calculator import TimeValueOfMoneyServices
 from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
 
 router = APIRouter(prefix="/calculations", tags=["Calculator"])
 
 @router.post("/depreciation", status_code=status.HTTP_200_OK)
 def penyusutan(
+    request: Request,
+    response: Response,
     harga_perolehan: float = Query(..., description="Acquisition cost (must be > 0)"),
     estimasi_umur: float = Query(..., description="Estimated useful life in years (must be > 0)"),
     estimasi_nilai_sisa: float = Query(0, description="Residual value at the end of useful life (>= 0)"),
-    metode: str = Query(..., description="Depreciation method ('straight_line' or 'double_declining')"),
-    service: PenyusutanCalculatorServices = Depends()
+    metode: str = Query(..., description=f"Depreciation method ({', '.join(DEPRECIATION_METHODS)})"),
+    unit_per_tahun: Optional[List[float]] = Query(None, description="Units produced per year (units_of_production only)"),
+    estimasi_total_unit: Optional[float] = Query(None, description="Estimated total units over the useful life, defaults to the sum of unit_per_tahun"),
+    year: Optional[int] = Query(None, ge=1, description="Only return this year of the schedule (1 = first year)"),
+    year_to: Optional[int] = Query(None, ge=1, description="Last year of the requested range, defaults to year"),
+    exact: bool = Query(False, description="Exact mode: amounts as integer minor units, rounded half to even"),
+    scale: int = Query(DEFAULT_SCALE, ge=1, le=1_000_000, description="Minor units per currency unit in exact mode (100 = sen)"),
+    service: PenyusutanCalculatorServices = Depends(),
+    cache: ResultCache = Depends(get_result_cache)
 ):
-    try:
-        if metode not in ["straight_line", "double_declining"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, 
-                detail="Invalid method. Choose 'straight_line' or 'double_declining'."
-            )
-        
-        if metode == "straight_line":
-            biaya_per_bulan, biaya_per_tahun = service.straight_line(
-                harga_perolehan, estimasi_umur, estimasi_nilai_sisa
-            )
-            return {
-                "metode": metode,
-                "biaya_per_bulan": biaya_per_bulan,
-                "biaya_per_tahun": biaya_per_tahun,
-            }
-        else:
-            biaya_per_bulan_list, biaya_per_tahun_list = service.double_declining(
-                harga_perolehan, estimasi_umur, estimasi_nilai_sisa
+    def compute():
+        if year is not None and exact:
+            raise ValueError("Exact mode is not available for single-year lookups.")
+        if year is not None:
+            years, depreciation, book_value, errors = service.depreciation_by_year(
+                [harga_perolehan],
+                [estimasi_umur],
+                [estimasi_nilai_sisa],
+                [metode],
+                year,
+                year_to,
+                [unit_per_tahun] if unit_per_tahun is not None else None,
+                [estimasi_total_unit]
             )
+            if errors[0]:
+                raise ValueError(errors[0])
             return {
                 "metode": metode,
-                "biaya_per_bulan": biaya_per_bulan_list,
-                "biaya_per_tahun": biaya_per_tahun_list,
+                "tahun": years.tolist(),
+                "biaya_per_bulan": (depreciation[0] / 12).tolist(),
+                "biaya_per_tahun": depreciation[0].tolist(),
+                "nilai_buku": book_value[0].tolist(),
             }
+
+        biaya_per_bulan, biaya_per_tahun = service.calculate(
+            harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, estimasi_total_unit, exact=exact, scale=scale
+        )
+        result = {
+            "metode": metode,
+            "biaya_per_bulan": biaya_per_bulan,
+            "biaya_per_tahun": biaya_per_tahun,
+        }
+        if exact:
+            result["biaya_bulan_terakhir"] = service.monthly_charges(to_minor(biaya_per_tahun, scale), exact, scale, last_month=True).tolist()
+        return result
+
+    inputs = {
+        "harga_perolehan": harga_perolehan,
+        "estimasi_umur": estimasi_umur,
+        "estimasi_nilai_sisa": estimasi_nilai_sisa,
+        "metode": metode,
+        "unit_per_tahun": unit_per_tahun,
+        "estimasi_total_unit": estimasi_total_unit,
+        "year": year,
+        "year_to": year_to,
+        "exact": exact,
+        "scale": scale,
+    }
+    try:
+        return cache.respond(request, response, "depreciation", inputs, compute)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.post("/depreciation/batch", response_model=DepreciationBatchResponse, status_code=status.HTTP_200_OK)
+async def penyusutan_batch(
+    request: DepreciationBatchRequest,
+    exact: bool = Query(False, description="Exact mode: amounts as integer minor units, rounded half to even"),
+    scale: int = Query(DEFAULT_SCALE, ge=1, le=1_000_000, description="Minor units per currency unit in exact mode (100 = sen)"),
+    service: PenyusutanCalculatorServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        n_assets = len(request.harga_perolehan)
+        estimasi_nilai_sisa = request.estimasi_nilai_sisa if request.estimasi_nilai_sisa is not None else [0] * n_assets
+        metode = request.metode if len(request.metode) != 1 else request.metode * n_assets
+
+        size = n_assets * int(min(max(request.estimasi_umur), service.MAX_BATCH_YEARS))
+        offsets, biaya_per_tahun, errors = await pool.run(
+            size,
+            service.calculate_batch,
+            request.harga_perolehan,
+            request.estimasi_umur,
+            estimasi_nilai_sisa,
+            metode,
+            request.unit_per_tahun,
+            request.estimasi_total_unit,
+            exact=exact,
+            scale=scale
+        )
+        return {
+            "metode": metode,
+            "offsets": offsets.tolist(),
+            "biaya_per_tahun": (from_minor(biaya_per_tahun, scale) if exact else biaya_per_tahun).tolist(),
+            "biaya_per_bulan": service.monthly_charges(biaya_per_tahun, exact, scale).tolist(),
+            "biaya_bulan_terakhir": service.monthly_charges(biaya_per_tahun, exact, scale, last_month=True).tolist() if exact else None,
+            "errors": [{"index": i, "detail": error} for i, error in enumerate(errors) if error],
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/depreciation/batch/years", response_model=DepreciationByYearResponse, status_code=status.HTTP_200_OK)
+async def penyusutan_batch_by_year(
+    request: DepreciationBatchRequest,
+    year: int = Query(..., ge=1, description="First requested year of the schedule (1 = first year)"),
+    year_to: Optional[int] = Query(None, ge=1, description="Last year of the requested range, defaults to year"),
+    service: PenyusutanCalculatorServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        n_assets = len(request.harga_perolehan)
+        metode = request.metode if len(request.metode) != 1 else request.metode * n_assets
+
+        size = n_assets * (max(year_to or year, year) - year + 1)
+        years, depreciation, book_value, errors = await pool.run(
+            size,
+            service.depreciation_by_year,
+            request.harga_perolehan,
+            request.estimasi_umur,
+            request.estimasi_nilai_sisa if request.estimasi_nilai_sisa is not None else [0] * n_assets,
+            metode,
+            year,
+            year_to,
+            request.unit_per_tahun,
+            request.estimasi_total_unit
+        )
+        failed = np.array([error is not None for error in errors], dtype=bool)
+        return {
+            "metode": metode,
+            "tahun": years.tolist(),
+            "biaya_per_tahun": [np.where(failed, None, column).tolist() for column in depreciation.T],
+            "nilai_buku": [np.where(failed, None, column).tolist() for column in book_value.T],
+            "errors": [{"index": i, "detail": error} for i, error in enumerate(errors) if error],
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/depreciation/schedule", status_code=status.HTTP_200_OK)
+@inject
+def penyusutan_schedule(
+    request: DepreciationScheduleRequest,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="Output format ('ndjson' or 'csv')"),
+    service: PenyusutanCalculatorServices = Depends(),
+    company_service: CompanyService = Depends(Provide[Container.company_service]),
+):
+    period_start, period_end = request.period_start, request.period_end
+    if request.company_id:
+        company = company_service.get_company_by_options("id", request.company_id).result
+        if period_start is None and company.start_audit_period:
+            period_start = company.start_audit_period.date()
+        if period_end is None and company.end_audit_period:
+            period_end = company.end_audit_period.date()
+
+    try:
+        n_assets = len(request.harga_perolehan)
+        rows = service.monthly_schedule(
+            request.harga_perolehan,
+            request.estimasi_umur,
+            request.estimasi_nilai_sisa if request.estimasi_nilai_sisa is not None else [0] * n_assets,
+            request.metode if len(request.metode) != 1 else request.metode * n_assets,
+            request.tanggal_perolehan,
+            period_start=period_start,
+            period_end=period_end,
+            fmt=fmt,
+            unit_per_tahun=request.unit_per_tahun,
+            estimasi_total_unit=request.estimasi_total_unit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(rows, media_type=media_type)
+
 @router.post("/present-value", status_code=status.HTTP_200_OK)
 def present_value(
+    request: Request,
+    response: Response,
     future_value: float = Query(..., description="Future Value (must be > 0)"),
     rate: float = Query(..., description="Rate in %"),
     period: float = Query(0, description="Period times"),
-    service: PresentValueServices = Depends()
+    exact: bool = Query(False, description="Exact mode: amounts as integer minor units, rounded half to even"),
+    scale: int = Query(DEFAULT_SCALE, ge=1, le=1_000_000, description="Minor units per currency unit in exact mode (100 = sen)"),
+    service: PresentValueServices = Depends(),
+    cache: ResultCache = Depends(get_result_cache)
 ):
+    def compute():
+        return {
+            "present_value": service.present_value(future_value, rate, period, exact=exact, scale=scale),
+        }
+
+    inputs = {"future_value": future_value, "rate": rate, "period": period, "exact": exact, "scale": scale}
     try:      
-        present_value = service.present_value(future_value, rate, period)
+        return cache.respond(request, response, "present-value", inputs, compute)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+@router.post("/present-value/npv", response_model=NetPresentValueResponse, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def net_present_value(
+    request: NetPresentValueRequest,
+    exact: bool = Query(False, description="Exact mode: amounts as integer minor units, rounded half to even"),
+    scale: int = Query(DEFAULT_SCALE, ge=1, le=1_000_000, description="Minor units per currency unit in exact mode (100 = sen)"),
+    service: PresentValueServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        size = sum(len(row) for row in request.cash_flows)
+        npv, discount_factors = await pool.run(
+            size,
+            service.net_present_value,
+            request.cash_flows,
+            rate=request.rate,
+            rates=request.rates,
+            rate_curve=request.rate_curve,
+            start_period=request.start_period,
+            exact=exact,
+            scale=scale
+        )
         return {
-            "present_value": present_value,
+            "npv": npv.tolist(),
+            "discount_factors": discount_factors.tolist() if request.include_discount_factors else None,
         }
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
+@router.post("/amortization", status_code=status.HTTP_200_OK)
+async def amortization(
+    request: AmortizationRequest,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="Output format ('ndjson' or 'csv')"),
+    service: AmortizationServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        chunks = service.schedule_chunks(
+            request.principal,
+            request.rate,
+            request.tenor,
+            request.structure,
+            balloon=request.balloon,
+            periods_per_year=request.periods_per_year,
+            fmt=fmt,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    size = service.schedule_size(request.tenor, len(request.principal))
+    rendered = pool.stream(size, service.render_chunk, chunks)
+
+    async def rows():
+        if fmt == "csv":
+            yield "index,period,payment,interest,principal,balance\n"
+        async for text in rendered:
+            yield text
+
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(rows(), media_type=media_type)
+
+@router.post("/tvm", response_model=TimeValueOfMoneyResponse, status_code=status.HTTP_200_OK)
+async def time_value_of_money(
+    request: TimeValueOfMoneyRequest,
+    service: TimeValueOfMoneyServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        size = service.result_size(request.rate, request.nper, request.pmt, request.pv, request.fv, request.when)
+        result = await pool.run(
+            size,
+            service.solve,
+            request.solve_for,
+            rate=request.rate,
+            nper=request.nper,
+            pmt=request.pmt,
+            pv=request.pv,
+            fv=request.fv,
+            when=request.when,
+            guess=request.guess
+        )
+        return {
+            "solve_for": request.solve_for,
+            "shape": list(result.shape),
+            "result": np.where(np.isfinite(result), result, None).tolist(),
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/irr", response_model=InternalRateOfReturnResponse, status_code=status.HTTP_200_OK)
+async def internal_rate_of_return(
+    request: InternalRateOfReturnRequest,
+    service: InternalRateOfReturnServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        size = sum(len(row) for row in request.cash_flows)
+        irr, converged, errors = await pool.run(size, service.irr, request.cash_flows, request.dates, request.guess)
+        return {
+            "irr": [None if np.isnan(rate) else rate for rate in irr.tolist()],
+            "converged": converged.tolist(),
+            "errors": errors,
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/sensitivity", response_model=SensitivityResponse, status_code=status.HTTP_200_OK)
+async def sensitivity(
+    request: SensitivityRequest,
+    service: SensitivityServices = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        size = service.grid_size(request.base, request.x_axis.values, request.y_axis.values)
+        matrix = await pool.run(
+            size,
+            service.grid,
+            request.calculator,
+            request.base,
+            request.x_axis.name,
+            request.x_axis.values,
+            request.y_axis.name,
+            request.y_axis.values
+        )
+        return {
+            "calculator": request.calculator,
+            "output": service.CALCULATORS[request.calculator][0],
+            "x_axis": request.x_axis,
+            "y_axis": request.y_axis,
+            "matrix": np.where(np.isfinite(matrix), matrix, None).tolist(),
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/goal-seek", response_model=GoalSeekResponse, status_code=status.HTTP_200_OK)
+def goal_seek(request: GoalSeekRequest, service: GoalSeekServices = Depends(get_goal_seek)):
+    try:
+        result = service.seek(
+            request.calculator,
+            request.inputs,
+            request.variable,
+            request.output,
+            request.target,
+            guess=request.guess,
+            tolerance=request.tolerance,
+            max_evaluations=request.max_evaluations
+        )
+        return {
+            "calculator": request.calculator,
+            "variable": request.variable,
+            "output": request.output,
+            "target": request.target,
+            **result,
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 @router.post("/weighted-average", status_code=status.HTTP_200_OK)
 def weighted_average(
+    request: Request,
+    response: Response,
     n_total: float = Query(1, description="Total row of loss rate and weight"), 
     loss_rate_array: List[float] = Query(..., description="Lost rate value in %"),
     weight_array: List[float] = Query(..., description="Weight value in %"),
-    service: GoalSeekingWeightedAverage = Depends()
+    exact: bool = Query(False, description="Exact mode: amounts as integer minor units, rounded half to even"),
+    scale: int = Query(DEFAULT_SCALE, ge=1, le=1_000_000, description="Minor units per currency unit in exact mode (100 = sen)"),
+    service: GoalSeekingWeightedAverage = Depends(),
+    cache: ResultCache = Depends(get_result_cache)
 ):
-    try:      
+    def compute():
         if len(loss_rate_array) != n_total and len(weight_array) != n_total:
             raise ValueError("The length of loss_rate_array and weight_array must match n_total.")
 
-        normal_average = service.normal_average(loss_rate_array)
-        weighted_average = service.weighted_average(loss_rate_array, weight_array)
+        normal_average = service.normal_average(loss_rate_array, exact=exact)
+        weighted_average = service.weighted_average(loss_rate_array, weight_array, exact=exact, scale=scale)
 
         weight_difference = service.weight_difference(weight_array)
     
@@ -79,5 +408,16 @@ def weighted_average(
             "weighted_average": weighted_average,
             "weight_difference": weight_difference,
         }
+
+    inputs = {"n_total": n_total, "loss_rate_array": loss_rate_array, "weight_array": weight_array, "exact": exact, "scale": scale}
+    try:      
+        return cache.respond(request, response, "weighted-average", inputs, compute)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/cache/stats", status_code=status.HTTP_200_OK)
+def result_cache_stats(
+    cache: ResultCache = Depends(get_result_cache),
+    current_user = Depends(get_current_user)
+):
+    return cache.stats()
@@ -0,0 +1,88 @@
+from uuid import UUID
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from dependency_injector.wiring import Provide
+from app.core.container import Container
+from app.core.middleware import inject
+from app.core.dependencies import get_current_user
+from app.schema.fixed_asset_schema import FixedAssetListResponse, FixedAssetResponse, PeriodDepreciationResponse, SyncFixedAssetsRequest, SyncFixedAssetsResponse, UpdateFixedAssetRequest
+from app.services.fixed_asset_service import FixedAssetService
+
+router = APIRouter(prefix="/fixed-assets", tags=["Fixed Asset"])
+
+@router.put("/companies/{company_id}",
+    response_model=SyncFixedAssetsResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def sync_assets(
+    company_id: UUID,
+    request: SyncFixedAssetsRequest,
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.sync_assets(company_id, request.assets)
+
+@router.get("/companies/{company_id}",
+    response_model=FixedAssetListResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def list_assets(
+    company_id: UUID,
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.list_assets(company_id)
+
+@router.get("/companies/{company_id}/depreciation",
+    response_model=PeriodDepreciationResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def period_depreciation(
+    company_id: UUID,
+    period_start: date = Query(..., description="First month to total; any day of the month"),
+    period_end: Optional[date] = Query(None, description="Last month to total; defaults to period_start's month"),
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.period_depreciation(company_id, period_start, period_end)
+
+@router.get("/{asset_id}",
+    response_model=FixedAssetResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def get_asset(
+    asset_id: UUID,
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.get_asset(asset_id)
+
+@router.patch("/{asset_id}",
+    response_model=FixedAssetResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def update_asset(
+    asset_id: UUID,
+    request: UpdateFixedAssetRequest,
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.update_asset(asset_id, request.model_dump(exclude_unset=True))
+
+@router.delete("/{asset_id}",
+    response_model=FixedAssetResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def delete_asset(
+    asset_id: UUID,
+    service: FixedAssetService = Depends(Provide[Container.fixed_asset_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.delete_asset(asset_id)
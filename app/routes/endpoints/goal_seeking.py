@@ -1,45 +1,203 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
-from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, File, Query, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from dependency_injector.wiring import Provide
+from app.core.compute_pool import ComputePool
+from app.core.container import Container
+from app.core.dependencies import get_compute_pool, get_goal_seeking_bulk, get_goal_seeking_simulation, get_result_cache
+from app.core.middleware import inject
+from app.core.result_cache import ResultCache
+from app.schema.calculator_schema import CreateGoalSeekingScenarioRequest, CreateRollRateHistoryRequest, GoalSeekingBatchRequest, GoalSeekingBatchResponse, GoalSeekingScenarioResponse, GoalSeekingSimulationRequest, GoalSeekingSimulationResponse, RollRateHistoryResponse, RollRateSnapshotRequest, UpdateGoalSeekingScenarioRequest
+from app.services.calculators.goal_seeking_bulk import GoalSeekingBulk
+from app.services.calculators.goal_seeking_scenario import GoalSeekingScenarioStore
+from app.services.calculators.goal_seeking_simulation import GoalSeekingSimulation
 from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+from app.services.calculators.roll_rate_migration import RollRateHistoryStore
 
 router = APIRouter(prefix="/goal-seeking", tags=["Goal Seeking"])
 
 @router.post("/weighted-average", status_code=status.HTTP_200_OK)
 def goal_seeking(
+    request: Request,
+    response: Response,
     n_total: int = Query(1, description="Total row of loss rate and weight"),
     goal: float = Query(..., description="Target weighted average"),
     weight_array: List[float] = Query(..., description="Weight value in %"),
-    service: GoalSeekingWeightedAverage = Depends()
+    service: GoalSeekingWeightedAverage = Depends(),
+    cache: ResultCache = Depends(get_result_cache)
 ):
-    try:
+    def compute():
         if n_total != len(weight_array):
             raise ValueError("The length of weight_array must match n_total.")
 
-        weight_diffs = service.weight_difference(weight_array)
+        return service.goal_seek_weighted_average(weight_array, goal)
 
-        def weighted_avg_for_goal(initial_loss_rate, weights, weight_diffs):
-            loss_rates = service.calculate_loss_rates(initial_loss_rate, weight_diffs)
-            return service.weighted_average(loss_rates, weights)
+    inputs = {"n_total": n_total, "goal": goal, "weight_array": weight_array}
+    try:
+        return cache.respond(request, response, "goal-seeking/weighted-average", inputs, compute)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/weighted-average/export", status_code=status.HTTP_200_OK)
+def goal_seeking_export(
+    n_total: int = Query(1, description="Total row of loss rate and weight"),
+    goal: float = Query(..., description="Target weighted average"),
+    weight_array: List[float] = Query(..., description="Weight value in %"),
+    service: GoalSeekingWeightedAverage = Depends()
+):
+    try:
+        if n_total != len(weight_array):
+            raise ValueError("The length of weight_array must match n_total.")
 
-        initial_loss_rate = service.goal_seek(
-            func=weighted_avg_for_goal,
-            goal=goal,
-            args=(weight_array, weight_diffs)
+        result = service.goal_seek_weighted_average(weight_array, goal)
+        workbook = service.export_to_excel(
+            result["loss_rate_array"],
+            weight_array,
+            {
+                "Goal": goal,
+                "Initial Loss Rate": result["initial_loss_rate"],
+                "Normal Average": result["normal_average"],
+                "Weighted Average": result["weighted_average"],
+            },
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        service.iter_file(workbook),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": 'attachment; filename="Results.xlsx"'},
+    )
 
-        loss_rate_array = service.calculate_loss_rates(initial_loss_rate, weight_diffs)
+@router.post("/weighted-average/upload", status_code=status.HTTP_200_OK)
+async def goal_seeking_upload(
+    file: UploadFile = File(..., description="Workbook (.xlsx) or .csv with segment, goal and weight columns"),
+    service: GoalSeekingBulk = Depends(get_goal_seeking_bulk)
+):
+    try:
+        workbook = await run_in_threadpool(service.run, file.file, file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-        normal_average = service.normal_average(loss_rate_array)
-        weighted_average = service.weighted_average(loss_rate_array, weight_array)
-        
-        if any(rate >= 100 for rate in loss_rate_array[:-1]):
-            raise ValueError("Computed loss rates exceed 100 before the last period.")
+    return StreamingResponse(
+        service.service.iter_file(workbook),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": 'attachment; filename="Results.xlsx"'},
+    )
 
+@router.post("/weighted-average/batch", response_model=GoalSeekingBatchResponse, status_code=status.HTTP_200_OK)
+async def goal_seeking_batch(
+    request: GoalSeekingBatchRequest,
+    service: GoalSeekingWeightedAverage = Depends(),
+    pool: ComputePool = Depends(get_compute_pool)
+):
+    try:
+        size = sum(len(row) for row in request.weight_matrix)
+        results = await pool.run(size, service.goal_seek_batch, request.weight_matrix, request.goals)
         return {
-            "initial_loss_rate": initial_loss_rate,
-            "loss_rate_array": loss_rate_array,
-            "normal_average": normal_average,
-            "weighted_average": weighted_average,
+            "results": results,
         }
     except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/weighted-average/scenarios", response_model=GoalSeekingScenarioResponse, status_code=status.HTTP_201_CREATED)
+@inject
+def create_goal_seeking_scenario(
+    request: CreateGoalSeekingScenarioRequest,
+    store: GoalSeekingScenarioStore = Depends(Provide[Container.goal_seeking_scenario_store])
+):
+    try:
+        return store.create(request.weight_array, request.goal)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.patch("/weighted-average/scenarios/{scenario_id}", response_model=GoalSeekingScenarioResponse, status_code=status.HTTP_200_OK)
+@inject
+def update_goal_seeking_scenario(
+    scenario_id: UUID,
+    request: UpdateGoalSeekingScenarioRequest,
+    store: GoalSeekingScenarioStore = Depends(Provide[Container.goal_seeking_scenario_store])
+):
+    try:
+        return store.update(scenario_id, index=request.index, weight=request.weight, goal=request.goal)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/weighted-average/scenarios/{scenario_id}", status_code=status.HTTP_200_OK)
+@inject
+def delete_goal_seeking_scenario(
+    scenario_id: UUID,
+    store: GoalSeekingScenarioStore = Depends(Provide[Container.goal_seeking_scenario_store])
+):
+    store.delete(scenario_id)
+    return {
+        "message": "Goal seeking scenario deleted successfully",
+    }
+
+@router.post("/weighted-average/simulations", response_model=GoalSeekingSimulationResponse, status_code=status.HTTP_200_OK)
+async def simulate_goal_seeking(
+    request: GoalSeekingSimulationRequest,
+    simulation: GoalSeekingSimulation = Depends(get_goal_seeking_simulation)
+):
+    try:
+        return await simulation.simulate(
+            request.weight_array,
+            request.goal,
+            draws=request.draws,
+            weight_sd=request.weight_sd,
+            goal_sd=request.goal_sd,
+            seed=request.seed,
+            percentiles=request.percentiles,
+            bins=request.bins
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/roll-rates", response_model=RollRateHistoryResponse, status_code=status.HTTP_201_CREATED)
+@inject
+def create_roll_rate_history(
+    request: CreateRollRateHistoryRequest,
+    store: RollRateHistoryStore = Depends(Provide[Container.roll_rate_history_store])
+):
+    try:
+        return store.create(request.buckets)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.put("/roll-rates/{history_id}/snapshots", response_model=RollRateHistoryResponse, status_code=status.HTTP_200_OK)
+@inject
+def add_roll_rate_snapshot(
+    history_id: UUID,
+    request: RollRateSnapshotRequest,
+    months: Optional[int] = Query(None, ge=1, description="Only use the most recent N monthly transitions"),
+    store: RollRateHistoryStore = Depends(Provide[Container.roll_rate_history_store])
+):
+    try:
+        return store.add_snapshot(history_id, request.month, request.account_ids, request.buckets, request.balances, months)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/roll-rates/{history_id}", response_model=RollRateHistoryResponse, status_code=status.HTTP_200_OK)
+@inject
+def get_roll_rate_history(
+    history_id: UUID,
+    months: Optional[int] = Query(None, ge=1, description="Only use the most recent N monthly transitions"),
+    store: RollRateHistoryStore = Depends(Provide[Container.roll_rate_history_store])
+):
+    try:
+        return store.summary(history_id, months)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/roll-rates/{history_id}", status_code=status.HTTP_200_OK)
+@inject
+def delete_roll_rate_history(
+    history_id: UUID,
+    store: RollRateHistoryStore = Depends(Provide[Container.roll_rate_history_store])
+):
+    store.delete(history_id)
+    return {
+        "message": "Roll rate history deleted successfully",
+    }
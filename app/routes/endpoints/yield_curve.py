@@ -0,0 +1,79 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from dependency_injector.wiring import Provide
+from app.core.container import Container
+from app.core.middleware import inject
+from app.core.dependencies import get_current_user
+from app.schema.yield_curve_schema import CreateYieldCurveRequest, CurvePresentValueRequest, CurvePresentValueResponse, YieldCurveListResponse, YieldCurveResponse
+from app.services.yield_curve_service import YieldCurveService
+
+router = APIRouter(prefix="/yield-curves", tags=["Yield Curve"])
+
+@router.post("/",
+    response_model=YieldCurveResponse,
+    status_code=status.HTTP_201_CREATED,
+    response_model_exclude_none=True)
+@inject
+def create_curve(
+    request: CreateYieldCurveRequest,
+    service: YieldCurveService = Depends(Provide[Container.yield_curve_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.create_curve(request.name, request.tenors, request.rates, request.interpolation, request.description)
+
+@router.get("/",
+    response_model=YieldCurveListResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def list_curves(
+    service: YieldCurveService = Depends(Provide[Container.yield_curve_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.list_curves()
+
+@router.get("/{name}",
+    response_model=YieldCurveResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def get_curve(
+    name: str,
+    version: Optional[int] = Query(None, gt=0, description="Curve version; the latest when left out"),
+    service: YieldCurveService = Depends(Provide[Container.yield_curve_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.get_curve(name, version)
+
+@router.get("/{name}/versions",
+    response_model=YieldCurveListResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def list_versions(
+    name: str,
+    service: YieldCurveService = Depends(Provide[Container.yield_curve_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.list_versions(name)
+
+@router.post("/{name}/present-value",
+    response_model=CurvePresentValueResponse,
+    status_code=status.HTTP_200_OK,
+    response_model_exclude_none=True)
+@inject
+def present_value(
+    name: str,
+    request: CurvePresentValueRequest,
+    service: YieldCurveService = Depends(Provide[Container.yield_curve_service]),
+    current_user = Depends(get_current_user),
+):
+    return service.present_value(
+        name,
+        request.version,
+        request.cash_flows,
+        request.start_period,
+        request.future_value,
+        request.period,
+        request.periods_per_year
+    )
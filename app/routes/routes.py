@@ -7,6 +7,9 @@ from app.routes.endpoints.company import router as company_router
 from app.routes.endpoints.docs_category import router as docs_category_router
 from app.routes.endpoints.docs_request import router as docs_request_router
 from app.routes.endpoints.docs import router as docs_router
+from app.routes.endpoints.calculation_workspace import router as calculation_workspace_router
+from app.routes.endpoints.yield_curve import router as yield_curve_router
+from app.routes.endpoints.fixed_asset import router as fixed_asset_router
 
 routers = APIRouter()
 router_list = [
@@ -18,6 +21,9 @@ router_list = [
     docs_category_router, 
     docs_request_router, 
     docs_router,
+    calculation_workspace_router,
+    yield_curve_router,
+    fixed_asset_router,
 ]
 
 for router in router_list:
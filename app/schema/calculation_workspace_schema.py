@@ -0,0 +1,94 @@
+from uuid import UUID
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+class CalculationNode(BaseModel):
+    id: UUID
+    name: str
+    calculator: str
+    inputs: Dict[str, Any]
+    input_hash: Optional[str] = Field(None, exclude=True)
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+class CalculationEdge(BaseModel):
+    id: UUID
+    source: str
+    output: str
+    target: str
+    input: str
+
+class CalculationWorkspace(BaseModel):
+    id: UUID
+    company_id: UUID
+    year: int
+    nodes: List[CalculationNode]
+    edges: List[CalculationEdge]
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class RecomputeMeta(BaseModel):
+    recomputed: List[str]
+
+# Types of each calculator's node inputs. Every field is optional here: inputs fed
+# by an edge are absent from the request, and required ones are checked when the
+# node is resolved. Strict, so a string or a list never reaches a numeric input.
+class NodeInputs(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+class DepreciationNodeInputs(NodeInputs):
+    harga_perolehan: Optional[float] = None
+    estimasi_umur: Optional[float] = None
+    metode: Optional[str] = None
+    estimasi_nilai_sisa: Optional[float] = None
+    unit_per_tahun: Optional[List[float]] = None
+    estimasi_total_unit: Optional[float] = None
+
+class PresentValueNodeInputs(NodeInputs):
+    future_value: Optional[float] = None
+    rate: Optional[float] = None
+    period: Optional[float] = None
+
+class NetPresentValueNodeInputs(NodeInputs):
+    cash_flows: Optional[List[float]] = None
+    rate: Optional[float] = None
+    start_period: Optional[int] = None
+    factor: Optional[float] = None
+
+class GoalSeekingNodeInputs(NodeInputs):
+    weight_array: Optional[List[float]] = None
+    goal: Optional[float] = None
+
+class ProvisionNodeInputs(NodeInputs):
+    loss_rate_array: Optional[List[float]] = None
+    exposure: Optional[List[float]] = None
+
+class CreateCalculationWorkspaceRequest(BaseModel):
+    company_id: UUID
+    year: int = Field(..., gt=0)
+
+class CreateCalculationNodeRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    calculator: str = Field(..., description="depreciation, present_value, net_present_value, goal_seeking or provision")
+    inputs: Dict[str, Any] = Field({}, description="Literal inputs; inputs fed by an edge can be left out")
+
+class UpdateCalculationNodeRequest(BaseModel):
+    inputs: Dict[str, Any] = Field(..., description="Inputs to change; null removes an input")
+
+class CreateCalculationEdgeRequest(BaseModel):
+    source: str = Field(..., description="Name of the node whose output is consumed")
+    output: str = Field(..., description="Key of the source node's output")
+    target: str = Field(..., description="Name of the consuming node")
+    input: str = Field(..., description="Input of the target node that receives the output")
+
+class CalculationWorkspaceResponse(BaseModel):
+    message: str
+    result: Optional[CalculationWorkspace]
+    meta: Optional[RecomputeMeta]
+
+class DeleteCalculationWorkspaceResponse(BaseModel):
+    message: str
+    result: Optional[CalculationWorkspace]
+    meta: Optional[RecomputeMeta]
@@ -0,0 +1,199 @@
+from uuid import UUID
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, Field
+
+class GoalSeekingBatchRequest(BaseModel):
+    weight_matrix: List[List[float]] = Field(..., min_length=1, description="One weight array (in %) per scenario")
+    goals: List[float] = Field(..., min_length=1, description="Target weighted average per scenario, or a single goal for every scenario")
+
+class GoalSeekingBatchResult(BaseModel):
+    initial_loss_rate: Optional[float]
+    loss_rate_array: Optional[List[float]]
+    normal_average: Optional[float]
+    weighted_average: Optional[float]
+    error: Optional[str]
+
+class GoalSeekingBatchResponse(BaseModel):
+    results: List[GoalSeekingBatchResult]
+
+class CreateGoalSeekingScenarioRequest(BaseModel):
+    weight_array: List[float] = Field(..., min_length=1, description="Weight value in %")
+    goal: float = Field(..., description="Target weighted average")
+
+class UpdateGoalSeekingScenarioRequest(BaseModel):
+    index: Optional[int] = Field(None, ge=0, description="Row of the weight to change")
+    weight: Optional[float] = Field(None, description="New weight value in %")
+    goal: Optional[float] = Field(None, description="New target weighted average")
+
+class GoalSeekingScenarioResponse(BaseModel):
+    scenario_id: UUID
+    initial_loss_rate: float
+    loss_rate_array: List[float]
+    normal_average: float
+    weighted_average: float
+
+class GoalSeekingSimulationRequest(BaseModel):
+    weight_array: List[float] = Field(..., min_length=1, description="Weight value in %")
+    goal: float = Field(..., description="Target weighted average")
+    draws: int = Field(10000, ge=1, description="Number of perturbed scenarios to simulate")
+    weight_sd: float = Field(5, ge=0, description="Standard deviation of the relative weight shock in %")
+    goal_sd: float = Field(0, ge=0, description="Standard deviation of the goal shock, in goal units")
+    seed: Optional[int] = Field(None, ge=0, description="Seed for a reproducible run; a random one is returned when omitted")
+    percentiles: List[float] = Field([5, 25, 50, 75, 95], description="Percentiles of the initial loss rate to report")
+    bins: int = Field(20, ge=1, le=1000, description="Number of histogram bins")
+
+class GoalSeekingSimulationHistogram(BaseModel):
+    edges: List[float]
+    counts: List[int]
+
+class GoalSeekingSimulationResponse(BaseModel):
+    base_initial_loss_rate: float
+    seed: int
+    draws: int
+    completed_draws: int
+    failed_draws: int
+    timed_out: bool
+    mean: Optional[float]
+    std: Optional[float]
+    percentiles: Dict[str, float]
+    histogram: Optional[GoalSeekingSimulationHistogram]
+
+class CreateRollRateHistoryRequest(BaseModel):
+    buckets: List[str] = Field(..., min_length=2, description="Aging bucket names from current to write-off, e.g. ['0-30', '31-60', '61-90', '>90']")
+
+class RollRateSnapshotRequest(BaseModel):
+    month: date = Field(..., description="Snapshot month (any day of the month)")
+    account_ids: List[Union[int, str]] = Field(..., description="Account id per row")
+    buckets: List[int] = Field(..., description="Aging bucket index per row (0 = first bucket)")
+    balances: List[float] = Field(..., description="Outstanding balance per row")
+
+class RollRateHistoryResponse(BaseModel):
+    history_id: UUID
+    buckets: List[str]
+    months: List[str] = []
+    transitions_used: int = 0
+    transition_matrix: List[List[float]] = []
+    roll_rates: List[float] = []
+    loss_rate_array: List[float] = []
+    weight_array: List[float] = []
+    normal_average: Optional[float] = None
+    weighted_average: Optional[float] = None
+
+class DepreciationBatchRequest(BaseModel):
+    harga_perolehan: List[float] = Field(..., min_length=1, description="Acquisition cost per asset (must be > 0)")
+    estimasi_umur: List[float] = Field(..., min_length=1, description="Estimated useful life in years per asset (must be > 0)")
+    estimasi_nilai_sisa: Optional[List[float]] = Field(None, description="Residual value per asset (>= 0), defaults to 0")
+    metode: List[str] = Field(..., min_length=1, description="Depreciation method per asset, or a single method for every asset")
+    unit_per_tahun: Optional[List[Optional[List[float]]]] = Field(None, description="Units produced per year per asset (units_of_production only)")
+    estimasi_total_unit: Optional[List[Optional[float]]] = Field(None, description="Estimated total units per asset, defaults to the sum of unit_per_tahun")
+
+class DepreciationBatchError(BaseModel):
+    index: int
+    detail: str
+
+class DepreciationBatchResponse(BaseModel):
+    metode: List[str]
+    offsets: List[int]
+    biaya_per_tahun: List[float]
+    biaya_per_bulan: List[float]
+    biaya_bulan_terakhir: Optional[List[float]] = None
+    errors: List[DepreciationBatchError]
+
+class DepreciationByYearResponse(BaseModel):
+    metode: List[str]
+    tahun: List[int]
+    biaya_per_tahun: List[List[Optional[float]]]
+    nilai_buku: List[List[Optional[float]]]
+    errors: List[DepreciationBatchError]
+
+class DepreciationScheduleRequest(DepreciationBatchRequest):
+    tanggal_perolehan: List[date] = Field(..., min_length=1, description="Acquisition date per asset")
+    company_id: Optional[UUID] = Field(None, description="Limit the schedule to this company's audit period")
+    period_start: Optional[date] = Field(None, description="First month to include (overrides the audit period start)")
+    period_end: Optional[date] = Field(None, description="Last month to include (overrides the audit period end)")
+
+class NetPresentValueRequest(BaseModel):
+    cash_flows: List[List[float]] = Field(..., min_length=1, description="One row of per-period cash flows per instrument")
+    rate: Optional[float] = Field(None, description="Single rate in % for every instrument")
+    rates: Optional[List[float]] = Field(None, description="Rate in % per instrument")
+    rate_curve: Optional[List[float]] = Field(None, description="Rate in % per period, shared by every instrument")
+    start_period: int = Field(1, ge=0, description="Period of the first cash flow column (0 = undiscounted)")
+    include_discount_factors: bool = Field(False, description="Also return the discount factor table")
+
+class NetPresentValueResponse(BaseModel):
+    npv: List[float]
+    discount_factors: Optional[Union[List[float], List[List[float]]]] = None
+
+class InternalRateOfReturnRequest(BaseModel):
+    cash_flows: List[List[float]] = Field(..., min_length=1, description="One row of cash flows per series, first flow at period 0")
+    dates: Optional[List[List[date]]] = Field(None, description="Date of every cash flow (XIRR), same shape as cash_flows")
+    guess: float = Field(10, gt=-100, description="Starting rate in % for the Newton iterations")
+
+class InternalRateOfReturnResponse(BaseModel):
+    irr: List[Optional[float]]
+    converged: List[bool]
+    errors: List[Optional[str]]
+
+TimeValueArgument = Optional[Union[float, List[float], List[List[float]]]]
+
+class TimeValueOfMoneyRequest(BaseModel):
+    solve_for: str = Field(..., description="Variable to solve for: rate, nper, pmt, pv or fv")
+    rate: TimeValueArgument = Field(None, description="Rate per period in %")
+    nper: TimeValueArgument = Field(None, description="Number of periods")
+    pmt: TimeValueArgument = Field(None, description="Payment per period (Excel sign convention)")
+    pv: TimeValueArgument = Field(None, description="Present value (Excel sign convention)")
+    fv: TimeValueArgument = Field(None, description="Future value (Excel sign convention)")
+    when: Union[int, List[int], List[List[int]]] = Field(0, description="0 = payments at period end, 1 = at period start")
+    guess: float = Field(10, gt=-100, description="Starting rate in % when solving for rate")
+
+class TimeValueOfMoneyResponse(BaseModel):
+    solve_for: str
+    shape: List[int]
+    result: Union[Optional[float], List[Optional[float]], List[List[Optional[float]]]]
+
+class AmortizationRequest(BaseModel):
+    principal: List[float] = Field(..., min_length=1, description="Loan principal per loan (must be > 0)")
+    rate: List[float] = Field(..., min_length=1, description="Annual interest rate in % per loan, or a single rate for every loan")
+    tenor: List[int] = Field(..., min_length=1, description="Number of payment periods per loan, or a single tenor for every loan")
+    structure: List[str] = Field(["annuity"], min_length=1, description="Repayment structure per loan ('annuity', 'flat' or 'balloon'), or a single structure for every loan")
+    balloon: Optional[List[float]] = Field(None, description="Balloon amount due with the last payment (balloon structure only)")
+    periods_per_year: int = Field(12, gt=0, le=365, description="Payment periods per year, 12 for monthly")
+
+class SensitivityAxis(BaseModel):
+    name: str = Field(..., description="Input varied along this axis, e.g. 'rate' or 'weight:2'")
+    values: List[float] = Field(..., min_length=1, description="Values of the input along this axis")
+
+class SensitivityRequest(BaseModel):
+    calculator: str = Field(..., description="Calculator to evaluate: present_value, tvm or goal_seeking")
+    base: Dict[str, Union[str, float, List[float]]] = Field(..., description="Inputs held fixed across the grid")
+    x_axis: SensitivityAxis = Field(..., description="Input varied down the rows of the matrix")
+    y_axis: SensitivityAxis = Field(..., description="Input varied across the columns of the matrix")
+
+class SensitivityResponse(BaseModel):
+    calculator: str
+    output: str
+    x_axis: SensitivityAxis
+    y_axis: SensitivityAxis
+    matrix: List[List[Optional[float]]]
+
+class GoalSeekRequest(BaseModel):
+    calculator: str = Field(..., description="Calculator to evaluate: depreciation, present_value, net_present_value, goal_seeking or provision")
+    inputs: Dict[str, Any] = Field(..., description="Inputs held fixed; the variable itself can be left out")
+    variable: str = Field(..., description="Input solved for, e.g. 'rate', 'estimasi_umur' or 'weight_array:2'")
+    output: str = Field(..., description="Output driven to the target, e.g. 'present_value' or 'jadwal_per_tahun:0'")
+    target: float = Field(..., description="Value the output should take")
+    guess: Optional[float] = Field(None, description="Starting point; by default the bracket cached for this calculator and target is used")
+    tolerance: float = Field(1e-10, gt=0, description="Absolute tolerance on the variable")
+    max_evaluations: int = Field(100, ge=2, le=1000, description="Calculator evaluations allowed, bracketing included")
+
+class GoalSeekResponse(BaseModel):
+    calculator: str
+    variable: str
+    output: str
+    target: float
+    value: float
+    achieved: float
+    evaluations: int
+    bracket: List[float]
+    cached_bracket: bool
@@ -0,0 +1,75 @@
+from uuid import UUID
+from datetime import date, datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+class FixedAssetInput(BaseModel):
+    code: str = Field(..., min_length=1, max_length=50, description="Asset code, unique within the company")
+    name: str = Field(..., min_length=1, max_length=200)
+    harga_perolehan: float = Field(..., description="Acquisition cost")
+    estimasi_umur: float = Field(..., description="Useful life in years")
+    estimasi_nilai_sisa: float = Field(0.0, description="Salvage value")
+    metode: str = Field(..., description="Depreciation method")
+    tanggal_perolehan: date = Field(..., description="Acquisition date")
+    unit_per_tahun: Optional[List[float]] = Field(None, description="Units produced per year, for units of production")
+    estimasi_total_unit: Optional[float] = Field(None, description="Total estimated units, for units of production")
+
+class FixedAsset(FixedAssetInput):
+    id: UUID
+    company_id: UUID
+    input_hash: Optional[str] = Field(None, exclude=True)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class DepreciationScheduleEntry(BaseModel):
+    period: date
+    depreciation: float
+    accumulated_depreciation: float
+    book_value: float
+
+class FixedAssetDetail(FixedAsset):
+    schedule: List[DepreciationScheduleEntry] = []
+
+class PeriodDepreciation(BaseModel):
+    period: date
+    depreciation: float
+    asset_count: int
+
+class SyncFixedAssetsRequest(BaseModel):
+    assets: List[FixedAssetInput] = Field(..., min_length=1, description="Assets to create or update, matched by code")
+
+class UpdateFixedAssetRequest(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    harga_perolehan: Optional[float] = None
+    estimasi_umur: Optional[float] = None
+    estimasi_nilai_sisa: Optional[float] = None
+    metode: Optional[str] = None
+    tanggal_perolehan: Optional[date] = None
+    unit_per_tahun: Optional[List[float]] = None
+    estimasi_total_unit: Optional[float] = None
+
+class SyncFixedAssetsMeta(BaseModel):
+    created: int
+    recomputed: int
+    unchanged: int
+    schedule_rows: int
+
+class SyncFixedAssetsResponse(BaseModel):
+    message: str
+    result: None = None
+    meta: SyncFixedAssetsMeta
+
+class FixedAssetResponse(BaseModel):
+    message: str
+    result: Optional[FixedAssetDetail]
+    meta: Optional[SyncFixedAssetsMeta]
+
+class FixedAssetListResponse(BaseModel):
+    message: str
+    result: List[FixedAsset]
+    meta: None = None
+
+class PeriodDepreciationResponse(BaseModel):
+    message: str
+    result: List[PeriodDepreciation]
+    meta: None = None
@@ -0,0 +1,54 @@
+from uuid import UUID
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class YieldCurve(BaseModel):
+    id: UUID
+    name: str
+    version: int
+    interpolation: str
+    tenors: List[float]
+    rates: List[float]
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+class CreateYieldCurveRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100, pattern=r"^[A-Za-z0-9_.-]+$")
+    tenors: List[float] = Field(..., min_length=1, description="Tenor points in years, strictly increasing")
+    rates: List[float] = Field(..., min_length=1, description="Annually compounded zero rate in % at each tenor")
+    interpolation: str = Field("linear", description="linear, log_linear or cubic")
+    description: Optional[str] = None
+
+class CurvePresentValueRequest(BaseModel):
+    version: Optional[int] = Field(None, gt=0, description="Curve version; the latest when left out")
+    cash_flows: Optional[List[List[float]]] = Field(None, description="Cash flows per period, one list per row")
+    start_period: int = Field(1, ge=0, description="Period of the first cash flow in each row")
+    future_value: Optional[List[float]] = Field(None, description="Single amounts to discount")
+    period: Optional[List[int]] = Field(None, description="Period in which each future value falls")
+    periods_per_year: int = Field(1, gt=0, le=365, description="Periods per year, 12 for monthly")
+
+class CurvePresentValue(BaseModel):
+    npv: Optional[List[float]] = None
+    present_value: Optional[List[float]] = None
+    discount_factors: List[float]
+
+class CurvePresentValueMeta(BaseModel):
+    name: str
+    version: int
+    interpolation: str
+
+class YieldCurveResponse(BaseModel):
+    message: str
+    result: Optional[YieldCurve]
+    meta: Optional[Dict]
+
+class YieldCurveListResponse(BaseModel):
+    message: str
+    result: List[YieldCurve]
+    meta: Optional[Dict]
+
+class CurvePresentValueResponse(BaseModel):
+    message: str
+    result: CurvePresentValue
+    meta: CurvePresentValueMeta
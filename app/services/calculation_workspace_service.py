@@ -0,0 +1,192 @@
+from uuid import UUID
+from typing import Any, Dict, List, Optional
+from fastapi import HTTPException, status
+from app.core.result_cache import ResultCache
+from app.repositories.calculation_workspace_repo import CalculationWorkspaceRepository
+from app.repositories.company_repo import CompanyRepository
+from app.schema.calculation_workspace_schema import CalculationWorkspace, CalculationWorkspaceResponse, DeleteCalculationWorkspaceResponse
+from app.services.base_service import BaseService
+from app.services.calculators.calculation_graph import CalculationGraph, calculator_inputs, validate_node_inputs
+
+class CalculationWorkspaceService(BaseService):
+    def __init__(
+        self,
+        calculation_workspace_repository: CalculationWorkspaceRepository,
+        company_repository: CompanyRepository,
+        result_cache: Optional[ResultCache] = None
+    ):
+        self.calculation_workspace_repository = calculation_workspace_repository
+        self.company_repository = company_repository
+        self.result_cache = result_cache
+        super().__init__(calculation_workspace_repository)
+
+    def _get_workspace(self, workspace_id: UUID) -> CalculationWorkspace:
+        workspace = self.calculation_workspace_repository.get_workspace(workspace_id)
+        if workspace is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Calculation workspace not found")
+        return workspace
+
+    def _graph(self, workspace: CalculationWorkspace) -> CalculationGraph:
+        nodes = {
+            node.name: {
+                "id": node.id,
+                "calculator": node.calculator,
+                "inputs": dict(node.inputs),
+                "input_hash": node.input_hash,
+                "output": node.output,
+                "error": node.error,
+            }
+            for node in workspace.nodes
+        }
+        edges = [{"id": edge.id, "source": edge.source, "output": edge.output, "target": edge.target, "input": edge.input} for edge in workspace.edges]
+        return CalculationGraph(nodes, edges)
+
+    def _memo(self, calculator: str, inputs: Dict[str, Any], compute):
+        # Identical invocations share one result across nodes and workspaces.
+        if self.result_cache is None:
+            return compute()
+        return self.result_cache.get_or_compute(self.result_cache.key(f"workspace/{calculator}", inputs), compute)
+
+    def _recompute(self, graph: CalculationGraph, changed: List[str]) -> List[str]:
+        try:
+            return graph.recompute(changed, memo=self._memo)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def _validate_inputs(self, calculator: str, inputs: Dict[str, Any]) -> None:
+        try:
+            allowed = calculator_inputs(calculator)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        unknown = set(inputs) - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid inputs for {calculator}: {', '.join(sorted(unknown))}. Allowed inputs are {', '.join(sorted(allowed))}"
+            )
+        try:
+            validate_node_inputs(calculator, inputs)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def _node(self, graph: CalculationGraph, name: str) -> Dict[str, Any]:
+        if name not in graph.nodes:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Node '{name}' not found")
+        return graph.nodes[name]
+
+    def _response(self, message: str, workspace_id: UUID, recomputed: List[str]) -> CalculationWorkspaceResponse:
+        return CalculationWorkspaceResponse(
+            message=message,
+            result=self.calculation_workspace_repository.get_workspace(workspace_id),
+            meta={"recomputed": recomputed},
+        )
+
+    def get_workspace(self, workspace_id: UUID) -> CalculationWorkspaceResponse:
+        return CalculationWorkspaceResponse(
+            message="Calculation workspace retrieved successfully",
+            result=self._get_workspace(workspace_id),
+            meta=None,
+        )
+
+    def get_workspace_by_company_year(self, company_id: UUID, year: int) -> CalculationWorkspaceResponse:
+        workspace = self.calculation_workspace_repository.get_workspace_by_company_year(company_id, year)
+        if workspace is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Calculation workspace not found")
+        return CalculationWorkspaceResponse(
+            message="Calculation workspace retrieved successfully",
+            result=workspace,
+            meta=None,
+        )
+
+    def create_workspace(self, company_id: UUID, year: int) -> CalculationWorkspaceResponse:
+        if self.company_repository.get_company_by_options("id", company_id).result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+        if self.calculation_workspace_repository.get_workspace_by_company_year(company_id, year) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A calculation workspace for this company and year already exists."
+            )
+
+        return CalculationWorkspaceResponse(
+            message="Calculation workspace successfully created",
+            result=self.calculation_workspace_repository.create_workspace(company_id, year),
+            meta=None,
+        )
+
+    def delete_workspace(self, workspace_id: UUID) -> DeleteCalculationWorkspaceResponse:
+        if not self.calculation_workspace_repository.delete_workspace(workspace_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Calculation workspace not found")
+        return DeleteCalculationWorkspaceResponse(
+            message="Calculation workspace deleted successfully",
+            result=None,
+            meta=None,
+        )
+
+    def add_node(self, workspace_id: UUID, name: str, calculator: str, inputs: Dict[str, Any]) -> CalculationWorkspaceResponse:
+        graph = self._graph(self._get_workspace(workspace_id))
+        if name in graph.nodes:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Node '{name}' already exists in this workspace.")
+        self._validate_inputs(calculator, inputs)
+
+        graph = CalculationGraph(
+            {**graph.nodes, name: {"calculator": calculator, "inputs": inputs, "input_hash": None, "output": None, "error": None}},
+            graph.edges
+        )
+        recomputed = self._recompute(graph, [name])
+        self.calculation_workspace_repository.create_node(workspace_id, name, graph.nodes[name], {})
+        return self._response("Node successfully added", workspace_id, recomputed)
+
+    def update_node(self, workspace_id: UUID, name: str, inputs: Dict[str, Any]) -> CalculationWorkspaceResponse:
+        graph = self._graph(self._get_workspace(workspace_id))
+        node = self._node(graph, name)
+        self._validate_inputs(node["calculator"], inputs)
+
+        merged = {**node["inputs"], **inputs}
+        node["inputs"] = {key: value for key, value in merged.items() if value is not None}
+        recomputed = self._recompute(graph, [name])
+        updates = {key: graph.nodes[key] for key in {name, *recomputed}}
+        self.calculation_workspace_repository.update_nodes(workspace_id, updates)
+        return self._response("Node successfully updated", workspace_id, recomputed)
+
+    def delete_node(self, workspace_id: UUID, name: str) -> CalculationWorkspaceResponse:
+        graph = self._graph(self._get_workspace(workspace_id))
+        node = self._node(graph, name)
+
+        children = [edge["target"] for edge in graph.edges if edge["source"] == name and edge["target"] != name]
+        nodes = {key: value for key, value in graph.nodes.items() if key != name}
+        edges = [edge for edge in graph.edges if name not in (edge["source"], edge["target"])]
+        graph = CalculationGraph(nodes, edges)
+        recomputed = self._recompute(graph, children)
+        updates = {key: graph.nodes[key] for key in recomputed}
+        self.calculation_workspace_repository.delete_node(workspace_id, node["id"], updates)
+        return self._response("Node deleted successfully", workspace_id, recomputed)
+
+    def add_edge(self, workspace_id: UUID, source: str, output: str, target: str, input: str) -> CalculationWorkspaceResponse:
+        graph = self._graph(self._get_workspace(workspace_id))
+        source_node = self._node(graph, source)
+        target_node = self._node(graph, target)
+        self._validate_inputs(target_node["calculator"], {input: None})
+        if source_node["output"] is not None and output not in source_node["output"]:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Node '{source}' has no output '{output}'.")
+        if any(edge["target"] == target and edge["input"] == input for edge in graph.edges):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Input '{input}' of node '{target}' is already fed by an edge.")
+        if graph.reaches(target, source):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The edge would create a cycle.")
+
+        graph = CalculationGraph(graph.nodes, [*graph.edges, {"source": source, "output": output, "target": target, "input": input}])
+        recomputed = self._recompute(graph, [target])
+        updates = {key: graph.nodes[key] for key in recomputed}
+        self.calculation_workspace_repository.create_edge(workspace_id, source_node["id"], output, target_node["id"], input, updates)
+        return self._response("Edge successfully added", workspace_id, recomputed)
+
+    def delete_edge(self, workspace_id: UUID, edge_id: UUID) -> CalculationWorkspaceResponse:
+        graph = self._graph(self._get_workspace(workspace_id))
+        edge = next((edge for edge in graph.edges if edge["id"] == edge_id), None)
+        if edge is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Edge not found")
+
+        graph = CalculationGraph(graph.nodes, [other for other in graph.edges if other["id"] != edge_id])
+        recomputed = self._recompute(graph, [edge["target"]])
+        updates = {key: graph.nodes[key] for key in recomputed}
+        self.calculation_workspace_repository.delete_edge(workspace_id, edge_id, updates)
+        return self._response("Edge deleted successfully", workspace_id, recomputed)
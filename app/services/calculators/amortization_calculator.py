@@ -0,0 +1,122 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from app.services.calculators.tvm_calculator import TimeValueOfMoneyServices
+
+class AmortizationServices:
+    STRUCTURES = ("annuity", "flat", "balloon")
+    MAX_YEARS = 100
+    # Loans per chunk are cut so one chunk's (loans x periods) matrices stay this size.
+    CHUNK_CELLS = 1_000_000
+
+    def __init__(self):
+        self.tvm = TimeValueOfMoneyServices()
+
+    def as_loan_arrays(
+        self,
+        principal: List[float],
+        rate: List[float],
+        tenor: List[int],
+        structure: List[str],
+        balloon: Optional[List[float]] = None
+    ) -> Tuple[np.ndarray, ...]:
+        n_loans = len(principal)
+
+        def column(values, name, dtype=float):
+            values = np.asarray(values, dtype=dtype)
+            if values.size == 1:
+                return np.broadcast_to(values.reshape(()), (n_loans,))
+            if values.shape != (n_loans,):
+                raise ValueError(f"{name} must have one value per loan or a single value for every loan.")
+            return values
+
+        return (
+            np.asarray(principal, dtype=float),
+            column(rate, "rate"),
+            column(tenor, "tenor", np.int64),
+            column(structure, "structure", object),
+            column(balloon if balloon is not None else [0], "balloon"),
+        )
+
+    def validate_loans(self, principal, rate, tenor, structure, balloon, periods_per_year: int):
+        if periods_per_year <= 0:
+            raise ValueError("periods_per_year must be greater than 0.")
+        checks = [
+            (principal <= 0, "Principal must be greater than 0."),
+            (tenor <= 0, "Tenor must be at least one period."),
+            (tenor > self.MAX_YEARS * periods_per_year, f"Tenor cannot exceed {self.MAX_YEARS} years of periods."),
+            (rate / periods_per_year <= -100, "Rate must be greater than -100% per period."),
+            (~np.isin(structure, self.STRUCTURES), f"Invalid structure. Choose one of {', '.join(repr(s) for s in self.STRUCTURES)}."),
+            ((structure == "balloon") & ((balloon < 0) | (balloon >= principal)), "Balloon must be at least 0 and less than the principal."),
+        ]
+        for failed, message in checks:
+            if failed.any():
+                raise ValueError(f"Row {int(np.argmax(failed))}: {message}")
+
+    def schedule_matrix(self, principal, rate, tenor, structure, balloon, periods_per_year: int = 12) -> Tuple[np.ndarray, ...]:
+        # Every period's closing balance has a closed form, so the whole (loans x periods)
+        # table comes from elementwise powers and a diff instead of a per-period loop.
+        r = (rate / 100 / periods_per_year)[:, None]
+        n = tenor[:, None]
+        loan = principal[:, None]
+        periods = np.arange(1, int(tenor.max()) + 1)
+
+        residual = np.where(structure == "balloon", balloon, 0)[:, None]
+        growth = (1 + r) ** periods
+        instalment = (loan * (1 + r) ** n - residual) / self.tvm.annuity_factor(r, n, (1 + r) ** n)
+        annuity_closing = loan * growth - instalment * self.tvm.annuity_factor(r, periods, growth)
+        flat_closing = loan - loan * periods / n
+
+        closing = np.where((structure == "flat")[:, None], flat_closing, annuity_closing)
+        # The last period settles whatever is left, including the balloon.
+        closing = np.where(periods >= n, 0, closing)
+        opening = np.hstack([loan, closing[:, :-1]])
+
+        interest = np.where((structure == "flat")[:, None], loan * r, opening * r)
+        principal_paid = opening - closing
+        payment = interest + principal_paid
+        return periods, payment, interest, principal_paid, closing
+
+    def schedule_size(self, tenor: List[int], n_loans: int) -> int:
+        # Rows a schedule produces, used to size the request for the compute pool.
+        return int(sum(tenor)) if len(tenor) != 1 else int(tenor[0]) * n_loans
+
+    def schedule_chunks(
+        self,
+        principal: List[float],
+        rate: List[float],
+        tenor: List[int],
+        structure: List[str],
+        balloon: Optional[List[float]] = None,
+        periods_per_year: int = 12,
+        fmt: str = "ndjson",
+        chunk_size: int = 512
+    ) -> List[Tuple]:
+        # Validates every loan up front and splits them into render_chunk() arguments.
+        loans = self.as_loan_arrays(principal, rate, tenor, structure, balloon)
+        if fmt not in ("ndjson", "csv"):
+            raise ValueError("Invalid format. Choose 'ndjson' or 'csv'.")
+        self.validate_loans(*loans, periods_per_year)
+
+        chunk_size = max(1, min(chunk_size, self.CHUNK_CELLS // int(loans[2].max())))
+        return [
+            ([column[start:start + chunk_size] for column in loans], start, periods_per_year, fmt)
+            for start in range(0, len(loans[0]), chunk_size)
+        ]
+
+    def render_chunk(self, chunk: List[np.ndarray], start: int, periods_per_year: int, fmt: str) -> str:
+        periods, payment, interest, principal_paid, balance = self.schedule_matrix(*chunk, periods_per_year)
+        loan, col = np.nonzero(periods <= chunk[2][:, None])
+        columns = zip(
+            (loan + start).tolist(),
+            periods[col].tolist(),
+            payment[loan, col].tolist(),
+            interest[loan, col].tolist(),
+            principal_paid[loan, col].tolist(),
+            balance[loan, col].tolist(),
+        )
+        if fmt == "csv":
+            return "".join(f"{i},{p},{m},{t},{c},{b}\n" for i, p, m, t, c, b in columns)
+        return "".join(
+            f'{{"index": {i}, "period": {p}, "payment": {m}, "interest": {t}, "principal": {c}, "balance": {b}}}\n'
+            for i, p, m, t, c, b in columns
+        )
@@ -0,0 +1,219 @@
+import hashlib
+import json
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+import numpy as np
+from pydantic import ValidationError
+from app.schema.calculation_workspace_schema import (
+    DepreciationNodeInputs,
+    GoalSeekingNodeInputs,
+    NetPresentValueNodeInputs,
+    PresentValueNodeInputs,
+    ProvisionNodeInputs,
+)
+from app.services.calculators.depreciation_calculator import PenyusutanCalculatorServices
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+from app.services.calculators.present_value_calculator import PresentValueServices
+
+def depreciation_node(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    service = PenyusutanCalculatorServices()
+    biaya_per_bulan, biaya_per_tahun = service.calculate(
+        inputs["harga_perolehan"],
+        inputs["estimasi_umur"],
+        inputs["estimasi_nilai_sisa"],
+        inputs["metode"],
+        inputs["unit_per_tahun"],
+        inputs["estimasi_total_unit"]
+    )
+    # Constant methods answer with one yearly figure; downstream nodes (a tax shield
+    # NPV) need the year-by-year schedule as well.
+    schedule, n_years, errors = service.yearly_schedule_batch(*service.as_batch_arrays(
+        [inputs["harga_perolehan"]],
+        [inputs["estimasi_umur"]],
+        [inputs["estimasi_nilai_sisa"]],
+        [inputs["metode"]],
+        [inputs["unit_per_tahun"]] if inputs["unit_per_tahun"] is not None else None,
+        [inputs["estimasi_total_unit"]]
+    ))
+    if errors[0]:
+        raise ValueError(errors[0])
+    jadwal = schedule[0, :n_years[0]]
+    return {
+        "biaya_per_bulan": biaya_per_bulan,
+        "biaya_per_tahun": biaya_per_tahun,
+        "jadwal_per_tahun": jadwal.tolist(),
+        "nilai_buku": (inputs["harga_perolehan"] - np.cumsum(jadwal)).tolist(),
+    }
+
+def present_value_node(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "present_value": PresentValueServices().present_value(inputs["future_value"], inputs["rate"], inputs["period"]),
+    }
+
+def net_present_value_node(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    # factor scales every cash flow first, e.g. a tax rate turning a depreciation
+    # schedule into tax shields.
+    cash_flows = np.asarray(inputs["cash_flows"], dtype=float) * inputs["factor"]
+    npv, _ = PresentValueServices().net_present_value([cash_flows.tolist()], rate=inputs["rate"], start_period=inputs["start_period"])
+    return {
+        "cash_flows": cash_flows.tolist(),
+        "npv": float(npv[0]),
+    }
+
+def goal_seeking_node(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return GoalSeekingWeightedAverage().goal_seek_weighted_average(inputs["weight_array"], inputs["goal"])
+
+def provision_node(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    loss_rates = np.asarray(inputs["loss_rate_array"], dtype=float)
+    exposure = np.asarray(inputs["exposure"], dtype=float)
+    if loss_rates.shape != exposure.shape:
+        raise ValueError("loss_rate_array and exposure must have the same length.")
+    provisions = exposure * loss_rates / 100
+    return {
+        "provision_per_row": provisions.tolist(),
+        "provision": float(provisions.sum()),
+    }
+
+# Calculator name -> (function, required inputs, optional inputs with defaults).
+NODE_CALCULATORS: Dict[str, Any] = {
+    "depreciation": (
+        depreciation_node,
+        ("harga_perolehan", "estimasi_umur", "metode"),
+        {"estimasi_nilai_sisa": 0, "unit_per_tahun": None, "estimasi_total_unit": None},
+    ),
+    "present_value": (present_value_node, ("future_value", "rate"), {"period": 0}),
+    "net_present_value": (net_present_value_node, ("cash_flows", "rate"), {"start_period": 1, "factor": 1}),
+    "goal_seeking": (goal_seeking_node, ("weight_array", "goal"), {}),
+    "provision": (provision_node, ("loss_rate_array", "exposure"), {}),
+}
+
+NODE_INPUT_MODELS: Dict[str, Any] = {
+    "depreciation": DepreciationNodeInputs,
+    "present_value": PresentValueNodeInputs,
+    "net_present_value": NetPresentValueNodeInputs,
+    "goal_seeking": GoalSeekingNodeInputs,
+    "provision": ProvisionNodeInputs,
+}
+
+def validate_node_inputs(calculator: str, inputs: Dict[str, Any]) -> None:
+    try:
+        NODE_INPUT_MODELS[calculator].model_validate(inputs)
+    except ValidationError as e:
+        problems = "; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors())
+        raise ValueError(f"Invalid inputs for {calculator}: {problems}.")
+
+def calculator_inputs(calculator: str) -> Set[str]:
+    if calculator not in NODE_CALCULATORS:
+        raise ValueError(f"Invalid calculator. Choose one of {', '.join(repr(name) for name in NODE_CALCULATORS)}.")
+    _, required, optional = NODE_CALCULATORS[calculator]
+    return set(required) | set(optional)
+
+class CalculationGraph:
+    # A workspace as plain data: nodes keyed by name ({"calculator", "inputs",
+    # "input_hash", "output", "error"}) and edges feeding one output of a source node
+    # into one input of a target node. recompute() walks only what lies downstream
+    # of the changed nodes, in topological order, and stops early wherever a node's
+    # resolved inputs hash the same as last time.
+    def __init__(self, nodes: Dict[str, Dict[str, Any]], edges: List[Dict[str, str]]):
+        self.nodes = nodes
+        self.edges = edges
+        self.children: Dict[str, List[str]] = {name: [] for name in nodes}
+        self.incoming: Dict[str, List[Dict[str, str]]] = {name: [] for name in nodes}
+        for edge in edges:
+            self.children[edge["source"]].append(edge["target"])
+            self.incoming[edge["target"]].append(edge)
+
+    @staticmethod
+    def input_hash(calculator: str, inputs: Dict[str, Any]) -> str:
+        canonical = json.dumps({"calculator": calculator, "inputs": inputs}, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def reaches(self, source: str, target: str) -> bool:
+        seen, queue = {source}, deque([source])
+        while queue:
+            name = queue.popleft()
+            if name == target:
+                return True
+            for child in self.children[name]:
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return False
+
+    def downstream(self, names: Iterable[str]) -> Set[str]:
+        affected = set(names)
+        queue = deque(affected)
+        while queue:
+            for child in self.children[queue.popleft()]:
+                if child not in affected:
+                    affected.add(child)
+                    queue.append(child)
+        return affected
+
+    def topological_order(self, names: Set[str]) -> List[str]:
+        indegree = {name: 0 for name in names}
+        for name in names:
+            for child in self.children[name]:
+                if child in indegree:
+                    indegree[child] += 1
+        queue = deque(sorted(name for name, degree in indegree.items() if degree == 0))
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for child in self.children[name]:
+                if child in indegree:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        queue.append(child)
+        if len(order) != len(names):
+            raise ValueError("The workspace graph contains a cycle.")
+        return order
+
+    def resolve_inputs(self, name: str) -> Dict[str, Any]:
+        node = self.nodes[name]
+        _, required, optional = NODE_CALCULATORS[node["calculator"]]
+        inputs = {**optional, **node["inputs"]}
+        for edge in self.incoming[name]:
+            source = self.nodes[edge["source"]]
+            if source["error"] is not None or source["output"] is None:
+                raise ValueError(f"Input '{edge['input']}' depends on node '{edge['source']}', which has no result.")
+            if edge["output"] not in source["output"]:
+                raise ValueError(f"Node '{edge['source']}' has no output '{edge['output']}'.")
+            inputs[edge["input"]] = source["output"][edge["output"]]
+        missing = [key for key in required if inputs.get(key) is None]
+        if missing:
+            raise ValueError(f"Missing input: {', '.join(missing)}.")
+        # Edge-fed values are checked here; a list output wired into a numeric input
+        # fails the node instead of the request.
+        validate_node_inputs(node["calculator"], inputs)
+        return inputs
+
+    def recompute(
+        self,
+        changed: Iterable[str],
+        memo: Optional[Callable[[str, Dict[str, Any], Callable[[], Any]], Any]] = None
+    ) -> List[str]:
+        updated = []
+        for name in self.topological_order(self.downstream(changed)):
+            node = self.nodes[name]
+            try:
+                inputs = self.resolve_inputs(name)
+            except ValueError as e:
+                inputs, error = None, str(e)
+            if inputs is not None:
+                digest = self.input_hash(node["calculator"], inputs)
+                if digest == node["input_hash"]:
+                    continue
+                function = NODE_CALCULATORS[node["calculator"]][0]
+                try:
+                    output = memo(node["calculator"], inputs, lambda: function(inputs)) if memo else function(inputs)
+                    node.update({"input_hash": digest, "output": output, "error": None})
+                except (ValueError, TypeError) as e:
+                    node.update({"input_hash": digest, "output": None, "error": str(e)})
+            else:
+                if node["error"] == error and node["output"] is None:
+                    continue
+                node.update({"input_hash": None, "output": None, "error": error})
+            updated.append(name)
+        return updated
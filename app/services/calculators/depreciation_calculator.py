@@ -1,4 +1,13 @@
+import numpy as np
+from datetime import date
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
+from app.services.calculators.depreciation_methods import CONSTANT_METHODS, DEPRECIATION_METHODS, YEAR_LOOKUPS
+from app.services.calculators.fixed_point import DEFAULT_SCALE, divide_half_even, from_minor, round_to_minor, to_minor
+
 class PenyusutanCalculatorServices:
+    MAX_BATCH_YEARS = 100
+
     def __init__(self):
         pass
 
@@ -30,10 +39,410 @@ class PenyusutanCalculatorServices:
 
         return biaya_per_bulan_list, biaya_per_tahun_list
 
-    def calculate(self, harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode):
-        if metode == "straight_line":
-            return self.straight_line(harga_perolehan, estimasi_umur, estimasi_nilai_sisa)
-        elif metode == "double_declining":
-            return self.double_declining(harga_perolehan, estimasi_umur, estimasi_nilai_sisa)
+    def invalid_method_message(self) -> str:
+        return f"Invalid depreciation method. Choose one of {', '.join(repr(name) for name in DEPRECIATION_METHODS)}."
+
+    def calculate(
+        self,
+        harga_perolehan,
+        estimasi_umur,
+        estimasi_nilai_sisa,
+        metode,
+        unit_per_tahun: Optional[List[float]] = None,
+        estimasi_total_unit: Optional[float] = None,
+        exact: bool = False,
+        scale: int = DEFAULT_SCALE
+    ):
+        if metode not in DEPRECIATION_METHODS:
+            raise ValueError(self.invalid_method_message())
+        self.validate_inputs(harga_perolehan, estimasi_umur, estimasi_nilai_sisa)
+
+        assets = self.as_batch_arrays(
+            [harga_perolehan],
+            [estimasi_umur],
+            [estimasi_nilai_sisa],
+            [metode],
+            [unit_per_tahun] if unit_per_tahun is not None else None,
+            [estimasi_total_unit]
+        )
+        # A single asset is not held to MAX_BATCH_YEARS, and a constant method needs
+        # no schedule at all, so any useful life works here as it always has.
+        if metode in CONSTANT_METHODS:
+            error = self.validate_inputs_batch(*assets, max_years=None)[0]
+            if error:
+                raise ValueError(error)
+            if exact:
+                return self.constant_charge_exact(*assets[:4], scale=scale)
+            biaya_per_tahun = (harga_perolehan - estimasi_nilai_sisa) / estimasi_umur
+            return biaya_per_tahun / 12, biaya_per_tahun
+
+        if exact:
+            schedule, n_years, errors = self.yearly_schedule_exact(*assets, scale=scale, max_years=None)
+        else:
+            schedule, n_years, errors = self.yearly_schedule_batch(*assets, max_years=None)
+        if errors[0]:
+            raise ValueError(errors[0])
+
+        if exact:
+            biaya_per_tahun = schedule[0, :n_years[0]]
+            return self.monthly_charges(biaya_per_tahun, exact, scale).tolist(), from_minor(biaya_per_tahun, scale).tolist()
+
+        biaya_per_tahun = schedule[0, :n_years[0]]
+        return (biaya_per_tahun / 12).tolist(), biaya_per_tahun.tolist()
+
+    def constant_charge_exact(self, harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, scale: int = DEFAULT_SCALE):
+        # Year one of yearly_schedule_exact, which every later year repeats, without
+        # building the schedule: a life of millions of years costs nothing.
+        if estimasi_umur[0] < 1:
+            return [], []
+        if metode[0] == "straight_line" and estimasi_umur[0] == np.floor(estimasi_umur[0]):
+            charge = divide_half_even(int(to_minor(harga_perolehan, scale)[0] - to_minor(estimasi_nilai_sisa, scale)[0]), int(estimasi_umur[0]))
+        else:
+            kernel = DEPRECIATION_METHODS[metode[0]]
+            charge = int(round_to_minor(kernel(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, np.arange(1, 2))[0, :1] * scale)[0])
+        return float(self.monthly_charges(np.int64(charge), True, scale)), float(from_minor(charge, scale))
+
+    def validate_inputs_batch(
+        self,
+        harga_perolehan: np.ndarray,
+        estimasi_umur: np.ndarray,
+        estimasi_nilai_sisa: np.ndarray,
+        metode: np.ndarray,
+        unit_per_tahun: np.ndarray,
+        unit_counts: np.ndarray,
+        estimasi_total_unit: np.ndarray,
+        max_years: Optional[int] = MAX_BATCH_YEARS
+    ) -> List[Optional[str]]:
+        errors: List[Optional[str]] = [None] * len(harga_perolehan)
+        by_units = metode == "units_of_production"
+        total_units = np.where(np.isnan(estimasi_total_unit), unit_per_tahun.sum(axis=1), estimasi_total_unit)
+        # Later checks win, so list them in reverse order of the single-asset validation.
+        failures = [
+            (by_units & ~(total_units > 0), "Estimasi Total Unit must be a positive number."),
+            (by_units & (unit_per_tahun < 0).any(axis=1), "Unit Per Tahun must be non-negative numbers."),
+            (by_units & (unit_counts > np.floor(estimasi_umur)), "Unit Per Tahun cannot have more entries than the useful life in years."),
+            (by_units & (unit_counts == 0), "Unit Per Tahun is required for units_of_production."),
+            (estimasi_umur > (np.inf if max_years is None else max_years), f"Estimasi Umur Manfaat cannot exceed {max_years} years."),
+            (~(estimasi_nilai_sisa >= 0), "Estimasi Nilai Sisa must be a non-negative number."),
+            (~(estimasi_umur > 0), "Estimasi Umur Manfaat must be a positive number."),
+            (~(harga_perolehan > 0), "Harga Perolehan must be a positive number."),
+            (~np.isin(metode, list(DEPRECIATION_METHODS)), self.invalid_method_message()),
+        ]
+        for mask, message in failures:
+            for i in np.flatnonzero(mask):
+                errors[i] = message
+        return errors
+
+    def as_batch_arrays(
+        self,
+        harga_perolehan: List[float],
+        estimasi_umur: List[float],
+        estimasi_nilai_sisa: List[float],
+        metode: List[str],
+        unit_per_tahun: Optional[List[List[float]]] = None,
+        estimasi_total_unit: Optional[List[Optional[float]]] = None
+    ) -> Tuple[np.ndarray, ...]:
+        n_assets = len(harga_perolehan)
+        if not n_assets == len(estimasi_umur) == len(estimasi_nilai_sisa) == len(metode):
+            raise ValueError("harga_perolehan, estimasi_umur, estimasi_nilai_sisa and metode must have the same length.")
+        if unit_per_tahun is not None and len(unit_per_tahun) != n_assets:
+            raise ValueError("unit_per_tahun must have one entry per asset.")
+        if estimasi_total_unit is not None and len(estimasi_total_unit) != n_assets:
+            raise ValueError("estimasi_total_unit must have one entry per asset.")
+
+        unit_rows = unit_per_tahun if unit_per_tahun is not None else [[]] * n_assets
+        unit_counts = np.fromiter((len(row or []) for row in unit_rows), dtype=np.intp, count=n_assets)
+        units = np.zeros((n_assets, int(unit_counts.max(initial=0))))
+        units[np.arange(units.shape[1]) < unit_counts[:, None]] = np.fromiter(chain.from_iterable(row or [] for row in unit_rows), dtype=float)
+        total_units = np.array(
+            [np.nan if value is None else value for value in estimasi_total_unit] if estimasi_total_unit is not None else np.full(n_assets, np.nan),
+            dtype=float
+        )
+
+        return (
+            np.asarray(harga_perolehan, dtype=float),
+            np.asarray(estimasi_umur, dtype=float),
+            np.asarray(estimasi_nilai_sisa, dtype=float),
+            np.asarray(metode, dtype=object),
+            units,
+            unit_counts,
+            total_units,
+        )
+
+    def yearly_schedule_batch(
+        self,
+        harga_perolehan: np.ndarray,
+        estimasi_umur: np.ndarray,
+        estimasi_nilai_sisa: np.ndarray,
+        metode: np.ndarray,
+        unit_per_tahun: np.ndarray,
+        unit_counts: np.ndarray,
+        estimasi_total_unit: np.ndarray,
+        max_years: Optional[int] = MAX_BATCH_YEARS
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+        errors = self.validate_inputs_batch(
+            harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, unit_counts, estimasi_total_unit, max_years
+        )
+        valid = np.array([error is None for error in errors], dtype=bool)
+
+        n_years = np.where(valid, np.floor(np.where(valid, estimasi_umur, 0)), 0).astype(np.intp)
+        years = np.arange(1, int(n_years.max(initial=0)) + 1)
+        schedule = np.zeros((len(harga_perolehan), len(years)))
+        if not len(years):
+            return schedule, n_years, errors
+
+        units = np.zeros(schedule.shape)
+        width = min(unit_per_tahun.shape[1], len(years))
+        units[:, :width] = unit_per_tahun[:, :width]
+        for name, kernel in DEPRECIATION_METHODS.items():
+            rows = valid & (metode == name)
+            if rows.any():
+                schedule[rows] = kernel(
+                    harga_perolehan[rows],
+                    estimasi_umur[rows],
+                    estimasi_nilai_sisa[rows],
+                    years,
+                    unit_per_tahun=units[rows],
+                    estimasi_total_unit=estimasi_total_unit[rows]
+                )
+
+        schedule[years > n_years[:, None]] = 0
+        return schedule, n_years, errors
+
+    def yearly_schedule_exact(
+        self,
+        *assets: np.ndarray,
+        scale: int = DEFAULT_SCALE,
+        max_years: Optional[int] = MAX_BATCH_YEARS
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+        # Same schedule in int64 minor units. Accumulated depreciation is rounded half
+        # to even once per year and each charge is the difference, so the charges sum
+        # to the rounded accumulated total and book values reconcile to the minor unit.
+        # Straight line over whole years is computed in integers end to end.
+        schedule, n_years, errors = self.yearly_schedule_batch(*assets, max_years=max_years)
+        cost, life, salvage, metode = assets[:4]
+        valid = np.array([error is None for error in errors], dtype=bool)
+        base = to_minor(np.where(valid, cost, 0), scale) - to_minor(np.where(valid, salvage, 0), scale)
+
+        years = np.arange(1, schedule.shape[1] + 1)
+        accumulated = round_to_minor(np.cumsum(schedule, axis=1) * scale)
+        whole_straight_line = valid & (metode == "straight_line") & (life == np.floor(np.where(valid, life, 0)))
+        if whole_straight_line.any():
+            held = np.minimum(years, n_years[whole_straight_line][:, None])
+            accumulated[whole_straight_line] = divide_half_even(
+                base[whole_straight_line][:, None] * held, life[whole_straight_line].astype(np.int64)[:, None]
+            )
+
+        charges = np.diff(accumulated, axis=1, prepend=0)
+        charges[years > n_years[:, None]] = 0
+        return charges, n_years, errors
+
+    def calculate_batch(
+        self,
+        harga_perolehan: List[float],
+        estimasi_umur: List[float],
+        estimasi_nilai_sisa: List[float],
+        metode: List[str],
+        unit_per_tahun: Optional[List[List[float]]] = None,
+        estimasi_total_unit: Optional[List[Optional[float]]] = None,
+        exact: bool = False,
+        scale: int = DEFAULT_SCALE
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+        assets = self.as_batch_arrays(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, estimasi_total_unit)
+        if exact:
+            schedule, n_years, errors = self.yearly_schedule_exact(*assets, scale=scale)
         else:
-            raise ValueError("Invalid depreciation method. Choose 'straight_line' or 'double_declining'.")
\ No newline at end of file
+            schedule, n_years, errors = self.yearly_schedule_batch(*assets)
+
+        offsets = np.concatenate(([0], np.cumsum(n_years)))
+        biaya_per_tahun = schedule[np.arange(1, schedule.shape[1] + 1) <= n_years[:, None]]
+        return offsets, biaya_per_tahun, errors
+
+    def monthly_charges(
+        self,
+        biaya_per_tahun: np.ndarray,
+        exact: bool = False,
+        scale: int = DEFAULT_SCALE,
+        last_month: bool = False
+    ) -> np.ndarray:
+        # In exact mode biaya_per_tahun is in minor units and the monthly figure is
+        # rounded half to even. Months one to eleven take that figure and the last
+        # month takes what is left of the year (last_month=True), so the twelve
+        # charges add back to the yearly one: 27.78 * 11 + 27.75 = 333.33.
+        if exact:
+            biaya_per_bulan = divide_half_even(biaya_per_tahun, 12)
+            return from_minor(biaya_per_tahun - 11 * biaya_per_bulan if last_month else biaya_per_bulan, scale)
+        return biaya_per_tahun / 12
+
+    def depreciation_by_year(
+        self,
+        harga_perolehan: List[float],
+        estimasi_umur: List[float],
+        estimasi_nilai_sisa: List[float],
+        metode: List[str],
+        year: int,
+        year_to: Optional[int] = None,
+        unit_per_tahun: Optional[List[List[float]]] = None,
+        estimasi_total_unit: Optional[List[Optional[float]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Optional[str]]]:
+        year_to = year if year_to is None else year_to
+        if year < 1 or year_to < year:
+            raise ValueError("year must be at least 1 and year_to cannot be before year.")
+        if year_to - year >= self.MAX_BATCH_YEARS:
+            raise ValueError(f"A year range cannot span more than {self.MAX_BATCH_YEARS} years.")
+
+        assets = self.as_batch_arrays(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, estimasi_total_unit)
+        cost, life, salvage, metode = assets[:4]
+        errors = self.validate_inputs_batch(*assets)
+        valid = np.array([error is None for error in errors], dtype=bool)
+
+        years = np.arange(year, year_to + 1)
+        depreciation = np.full((len(cost), len(years)), np.nan)
+        book_value = np.full((len(cost), len(years)), np.nan)
+        for name, lookup in YEAR_LOOKUPS.items():
+            rows = valid & (metode == name)
+            if rows.any():
+                depreciation[rows], book_value[rows] = lookup(cost[rows], life[rows], salvage[rows], years)
+
+        rest = valid & ~np.isin(metode, list(YEAR_LOOKUPS))
+        if rest.any():
+            schedule, n_years, _ = self.yearly_schedule_batch(*(column[rest] for column in assets))
+            accumulated = np.hstack((np.zeros((len(schedule), 1)), np.cumsum(schedule, axis=1)))
+            held = np.minimum(years, n_years[:, None])
+            depreciation[rest] = np.where(years <= n_years[:, None], np.take_along_axis(accumulated, held, axis=1) - np.take_along_axis(accumulated, np.maximum(held - 1, 0), axis=1), 0)
+            book_value[rest] = cost[rest][:, None] - np.take_along_axis(accumulated, held, axis=1)
+
+        return years, depreciation, book_value, errors
+
+    def acquisition_months(self, tanggal_perolehan: List[date]) -> Tuple[np.ndarray, np.ndarray]:
+        acquired = np.array(tanggal_perolehan, dtype="datetime64[D]")
+        first_month = acquired.astype("datetime64[M]")
+        day = (acquired - first_month.astype("datetime64[D]")).astype(np.int64) + 1
+        days_in_month = ((first_month + 1).astype("datetime64[D]") - first_month.astype("datetime64[D]")).astype(np.int64)
+        # Share of the acquisition month the asset was held; the remainder of the
+        # first asset-month spills into the month after the last full one.
+        held = (days_in_month - day + 1) / days_in_month
+        return first_month.astype(np.int64), held
+
+    def monthly_rows(
+        self,
+        assets: Tuple[np.ndarray, ...],
+        first_month: np.ndarray,
+        held: np.ndarray,
+        lower: int = np.iinfo(np.int64).min,
+        upper: int = np.iinfo(np.int64).max
+    ) -> Tuple[np.ndarray, ...]:
+        # One row per asset-month between lower and upper (months since the epoch):
+        # asset index, month, depreciation, accumulated depreciation and book value.
+        schedule, n_years, _ = self.yearly_schedule_batch(*assets)
+        monthly = np.repeat(schedule / 12, 12, axis=1)
+        fraction = held[:, None]
+        prorated = fraction * np.pad(monthly, ((0, 0), (0, 1))) + (1 - fraction) * np.pad(monthly, ((0, 0), (1, 0)))
+        accumulated = np.cumsum(prorated, axis=1)
+        book_value = assets[0][:, None] - accumulated
+
+        cols = np.arange(prorated.shape[1])
+        n_months = n_years[:, None] * 12
+        months = first_month[:, None] + cols
+        keep = (
+            (cols < n_months + ((fraction < 1) & (n_months > 0)))
+            & (months >= lower)
+            & (months <= upper)
+        )
+        asset, col = np.nonzero(keep)
+        return asset, months[asset, col], prorated[asset, col], accumulated[asset, col], book_value[asset, col]
+
+    def monthly_schedule(
+        self,
+        harga_perolehan: List[float],
+        estimasi_umur: List[float],
+        estimasi_nilai_sisa: List[float],
+        metode: List[str],
+        tanggal_perolehan: List[date],
+        period_start: Optional[date] = None,
+        period_end: Optional[date] = None,
+        fmt: str = "ndjson",
+        chunk_size: int = 512,
+        unit_per_tahun: Optional[List[List[float]]] = None,
+        estimasi_total_unit: Optional[List[Optional[float]]] = None
+    ) -> Iterator[str]:
+        assets = self.as_batch_arrays(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, estimasi_total_unit)
+        cost = assets[0]
+        if len(tanggal_perolehan) != len(cost):
+            raise ValueError("tanggal_perolehan must have the same length as harga_perolehan.")
+        if fmt not in ("ndjson", "csv"):
+            raise ValueError("Invalid format. Choose 'ndjson' or 'csv'.")
+
+        # Inputs are validated before the generator is returned, so a bad row is a
+        # 400 instead of a stream that breaks halfway through.
+        errors = self.validate_inputs_batch(*assets)
+        for i, error in enumerate(errors):
+            if error:
+                raise ValueError(f"Row {i}: {error}")
+
+        first_month, held = self.acquisition_months(tanggal_perolehan)
+        lower = np.datetime64(period_start, "M").astype(np.int64) if period_start else np.iinfo(np.int64).min
+        upper = np.datetime64(period_end, "M").astype(np.int64) if period_end else np.iinfo(np.int64).max
+
+        def rows() -> Iterator[str]:
+            if fmt == "csv":
+                yield "index,period,depreciation,accumulated_depreciation,book_value\n"
+
+            for start in range(0, len(cost), chunk_size):
+                chunk = slice(start, start + chunk_size)
+                asset, months, depreciation, accumulated, book_value = self.monthly_rows(
+                    tuple(column[chunk] for column in assets), first_month[chunk], held[chunk], lower, upper
+                )
+                periods = np.datetime_as_string(months.astype("datetime64[M]"))
+                columns = zip(
+                    (asset + start).tolist(),
+                    periods.tolist(),
+                    depreciation.tolist(),
+                    accumulated.tolist(),
+                    book_value.tolist(),
+                )
+                if fmt == "csv":
+                    yield "".join(f"{i},{p},{d},{a},{b}\n" for i, p, d, a, b in columns)
+                else:
+                    yield "".join(
+                        f'{{"index": {i}, "period": "{p}", "depreciation": {d}, "accumulated_depreciation": {a}, "book_value": {b}}}\n'
+                        for i, p, d, a, b in columns
+                    )
+
+        return rows()
+
+    def schedule_entries(
+        self,
+        harga_perolehan: List[float],
+        estimasi_umur: List[float],
+        estimasi_nilai_sisa: List[float],
+        metode: List[str],
+        tanggal_perolehan: List[date],
+        unit_per_tahun: Optional[List[List[float]]] = None,
+        estimasi_total_unit: Optional[List[Optional[float]]] = None,
+        chunk_size: int = 512
+    ) -> Tuple[np.ndarray, ...]:
+        # Whole monthly schedule of every asset for the materialized schedule table:
+        # asset index, period end date, depreciation, accumulated depreciation and
+        # book value, using the same proration as monthly_schedule.
+        assets = self.as_batch_arrays(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, metode, unit_per_tahun, estimasi_total_unit)
+        if len(tanggal_perolehan) != len(assets[0]):
+            raise ValueError("tanggal_perolehan must have the same length as harga_perolehan.")
+        for i, error in enumerate(self.validate_inputs_batch(*assets)):
+            if error:
+                raise ValueError(f"Row {i}: {error}")
+
+        first_month, held = self.acquisition_months(tanggal_perolehan)
+        parts = []
+        for start in range(0, len(assets[0]), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            asset, months, depreciation, accumulated, book_value = self.monthly_rows(
+                tuple(column[chunk] for column in assets), first_month[chunk], held[chunk]
+            )
+            parts.append((asset + start, months, depreciation, accumulated, book_value))
+        if not parts:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype="datetime64[D]"), np.empty(0), np.empty(0), np.empty(0)
+
+        asset, months, depreciation, accumulated, book_value = (np.concatenate(column) for column in zip(*parts))
+        period_end = (months + 1).astype("datetime64[M]").astype("datetime64[D]") - 1
+        return asset, period_end, depreciation, accumulated, book_value
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Callable, Dict, Set, Tuple
+
+# Every kernel maps asset columns (cost, life, salvage, plus any per-method extras)
+# to a dense (assets x years) matrix of yearly depreciation for years 1..len(years).
+# Cells past an asset's own life are ignored by the caller.
+DepreciationKernel = Callable[..., np.ndarray]
+
+DEPRECIATION_METHODS: Dict[str, DepreciationKernel] = {}
+CONSTANT_METHODS: Set[str] = set()
+
+def register_depreciation_method(name: str, constant: bool = False):
+    def decorator(kernel: DepreciationKernel) -> DepreciationKernel:
+        DEPRECIATION_METHODS[name] = kernel
+        if constant:
+            CONSTANT_METHODS.add(name)
+        return kernel
+    return decorator
+
+def limit_to_depreciable_base(schedule: np.ndarray, harga_perolehan: np.ndarray, estimasi_nilai_sisa: np.ndarray) -> np.ndarray:
+    accumulated = np.minimum(np.cumsum(schedule, axis=1), (harga_perolehan - estimasi_nilai_sisa)[:, None])
+    return np.diff(accumulated, axis=1, prepend=0)
+
+@register_depreciation_method("straight_line", constant=True)
+def straight_line(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years, **kwargs):
+    biaya_per_tahun = (harga_perolehan - estimasi_nilai_sisa) / estimasi_umur
+    return np.broadcast_to(biaya_per_tahun[:, None], (len(biaya_per_tahun), len(years)))
+
+@register_depreciation_method("double_declining")
+def double_declining(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years, **kwargs):
+    # The depreciable base shrinks by the same factor every year, so year t is
+    # (cost - salvage) * rate * (1 - rate) ** (t - 1) without carrying book value.
+    rate = 2 / estimasi_umur
+    return ((harga_perolehan - estimasi_nilai_sisa) * rate)[:, None] * (1 - rate)[:, None] ** (years - 1)
+
+@register_depreciation_method("sum_of_years_digits")
+def sum_of_years_digits(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years, **kwargs):
+    n_years = np.floor(estimasi_umur)[:, None]
+    remaining = np.maximum(n_years - years + 1, 0)
+    return (harga_perolehan - estimasi_nilai_sisa)[:, None] * remaining / (n_years * (n_years + 1) / 2)
+
+def declining_balance(factor: float) -> DepreciationKernel:
+    def kernel(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years, **kwargs):
+        # Until the switch the book value is cost * (1 - rate) ** (t - 1). The switch
+        # year is the first one where spreading the remaining base evenly over the
+        # remaining life beats the declining charge, and that straight-line charge
+        # then holds for every later year.
+        rate = np.minimum(factor / estimasi_umur, 1)[:, None]
+        opening = harga_perolehan[:, None] * (1 - rate) ** (years - 1)
+        declining = opening * rate
+        remaining = estimasi_umur[:, None] - years + 1
+        straight = np.full(opening.shape, -np.inf)
+        np.divide(opening - estimasi_nilai_sisa[:, None], remaining, out=straight, where=remaining > 0)
+
+        switched = straight >= declining
+        switch_year = np.where(switched.any(axis=1), switched.argmax(axis=1), len(years))
+        switch_charge = np.take_along_axis(straight, np.minimum(switch_year, len(years) - 1)[:, None], axis=1)
+        schedule = np.where(np.arange(len(years)) < switch_year[:, None], declining, switch_charge)
+        return limit_to_depreciable_base(schedule, harga_perolehan, estimasi_nilai_sisa)
+    return kernel
+
+register_depreciation_method("declining_balance_150")(declining_balance(1.5))
+register_depreciation_method("declining_balance_200")(declining_balance(2))
+
+@register_depreciation_method("units_of_production")
+def units_of_production(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years, unit_per_tahun=None, estimasi_total_unit=None, **kwargs):
+    units = unit_per_tahun[:, :len(years)]
+    total_units = np.where(np.isnan(estimasi_total_unit), units.sum(axis=1), estimasi_total_unit)
+    schedule = (harga_perolehan - estimasi_nilai_sisa)[:, None] * units / total_units[:, None]
+    return limit_to_depreciable_base(schedule, harga_perolehan, estimasi_nilai_sisa)
+
+# Year lookups answer "depreciation and closing book value for years k" directly,
+# without building the schedule up to k. Methods without one fall back to the
+# full schedule kernel.
+YEAR_LOOKUPS: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {}
+
+def register_year_lookup(name: str):
+    def decorator(lookup):
+        YEAR_LOOKUPS[name] = lookup
+        return lookup
+    return decorator
+
+@register_year_lookup("straight_line")
+def straight_line_by_year(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years):
+    n_years = np.floor(estimasi_umur)[:, None]
+    biaya_per_tahun = ((harga_perolehan - estimasi_nilai_sisa) / estimasi_umur)[:, None]
+    depreciation = np.where(years <= n_years, biaya_per_tahun, 0)
+    return depreciation, harga_perolehan[:, None] - biaya_per_tahun * np.minimum(years, n_years)
+
+@register_year_lookup("double_declining")
+def double_declining_by_year(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years):
+    n_years = np.floor(estimasi_umur)[:, None]
+    rate = (2 / estimasi_umur)[:, None]
+    base = (harga_perolehan - estimasi_nilai_sisa)[:, None]
+    depreciation = np.where(years <= n_years, base * rate * (1 - rate) ** (years - 1), 0)
+    return depreciation, harga_perolehan[:, None] - base * (1 - (1 - rate) ** np.minimum(years, n_years))
+
+@register_year_lookup("sum_of_years_digits")
+def sum_of_years_digits_by_year(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, years):
+    n_years = np.floor(estimasi_umur)[:, None]
+    digits = n_years * (n_years + 1) / 2
+    base = (harga_perolehan - estimasi_nilai_sisa)[:, None]
+    held = np.minimum(years, n_years)
+    depreciation = np.where(years <= n_years, base * (n_years - years + 1) / digits, 0)
+    return depreciation, harga_perolehan[:, None] - base * (held * n_years - held * (held - 1) / 2) / digits
@@ -0,0 +1,54 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Generic, TypeVar
+from app.core.exceptions import NotFoundError
+
+T = TypeVar("T")
+
+class ExpiringStore(Generic[T]):
+    # In-process LRU keyed by uuid; entries also expire after ttl_seconds without access.
+    not_found_message = "Item not found"
+
+    def __init__(self, max_items: int = 1000, ttl_seconds: int = 3600):
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[uuid.UUID, T]" = OrderedDict()
+        self._touched: Dict[uuid.UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float):
+        while self._items:
+            oldest = next(iter(self._items))
+            if len(self._items) < self.max_items and now - self._touched[oldest] < self.ttl_seconds:
+                break
+            del self._items[oldest]
+            del self._touched[oldest]
+
+    def _get(self, item_id: uuid.UUID, now: float) -> T:
+        item = self._items.get(item_id)
+        if item is None or now - self._touched[item_id] >= self.ttl_seconds:
+            raise NotFoundError(self.not_found_message)
+        self._items.move_to_end(item_id)
+        self._touched[item_id] = now
+        return item
+
+    def _put(self, item: T) -> uuid.UUID:
+        item_id = uuid.uuid4()
+        with self._lock:
+            now = time.monotonic()
+            self._evict(now)
+            self._items[item_id] = item
+            self._touched[item_id] = now
+        return item_id
+
+    def get(self, item_id: uuid.UUID) -> T:
+        with self._lock:
+            return self._get(item_id, time.monotonic())
+
+    def delete(self, item_id: uuid.UUID):
+        with self._lock:
+            self._get(item_id, time.monotonic())
+            del self._items[item_id]
+            del self._touched[item_id]
@@ -0,0 +1,56 @@
+import numpy as np
+
+# Exact mode keeps amounts as int64 counts of minor units (1 / scale of the currency
+# unit, e.g. sen). Every step that leaves the integers rounds half to even, once, so
+# the totals of rounded line items always reconcile with the rounded total.
+DEFAULT_SCALE = 100
+# Rates (%) are carried in units of 1 / RATE_SCALE of a percent.
+RATE_SCALE = 10_000
+# float64 represents every integer below 2 ** 53 exactly.
+MAX_EXACT = 2 ** 53
+
+def to_minor(values, scale: int = DEFAULT_SCALE) -> np.ndarray:
+    scaled = np.asarray(values, dtype=float) * scale
+    if not np.isfinite(scaled).all() or (np.abs(scaled) >= MAX_EXACT).any():
+        raise ValueError("Amount is too large for exact mode.")
+    return np.rint(scaled).astype(np.int64)
+
+def from_minor(values, scale: int = DEFAULT_SCALE) -> np.ndarray:
+    return np.asarray(values) / scale
+
+def round_to_minor(values: np.ndarray) -> np.ndarray:
+    # For amounts already expressed in minor units that came out of a float step
+    # (a discount factor, a depreciation kernel).
+    if not np.isfinite(values).all() or (np.abs(values) >= MAX_EXACT).any():
+        raise ValueError("Amount is too large for exact mode.")
+    return np.rint(values).astype(np.int64)
+
+def divide_half_even(numerator, denominator):
+    # Integer division rounded half to even, on int64 arrays or on Python ints
+    # (for sums that outgrow int64).
+    if np.ndim(numerator) == 0 and np.ndim(denominator) == 0:
+        numerator, denominator = int(numerator), int(denominator)
+        if denominator == 0:
+            raise ValueError("Division by zero in exact mode.")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        quotient, remainder = divmod(numerator, denominator)
+        return quotient + (2 * remainder > denominator or (2 * remainder == denominator and quotient % 2 == 1))
+
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype=np.int64), np.asarray(denominator, dtype=np.int64))
+    if (denominator == 0).any():
+        raise ValueError("Division by zero in exact mode.")
+    negative = denominator < 0
+    numerator = np.where(negative, -numerator, numerator)
+    denominator = np.where(negative, -denominator, denominator)
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    return quotient + ((twice > denominator) | ((twice == denominator) & (quotient % 2 == 1)))
+
+def exact_sum_of_products(a: np.ndarray, b: np.ndarray):
+    # Stays in int64 when the products provably fit, otherwise sums Python ints.
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    if float(np.abs(a).max(initial=0)) * float(np.abs(b).sum(dtype=float)) < 2 ** 62:
+        return np.int64(np.dot(a, b))
+    return sum(int(x) * int(y) for x, y in zip(a.tolist(), b.tolist()))
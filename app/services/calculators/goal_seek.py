@@ -0,0 +1,233 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from scipy.optimize import brentq
+from app.services.calculators.calculation_graph import NODE_CALCULATORS, CalculationGraph, calculator_inputs, validate_node_inputs
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+def attainable_goals(inputs: Dict[str, Any]) -> Tuple[float, float]:
+    return GoalSeekingWeightedAverage().attainable_goal_range(inputs["weight_array"])
+
+# (calculator, input) -> open interval the input can take, or a function of the other
+# inputs returning one; anything else is unbounded.
+INPUT_DOMAINS: Dict[Tuple[str, str], Union[Tuple[float, float], Callable[[Dict[str, Any]], Tuple[float, float]]]] = {
+    ("present_value", "rate"): (-100, math.inf),
+    ("net_present_value", "rate"): (-100, math.inf),
+    ("depreciation", "harga_perolehan"): (0, math.inf),
+    ("depreciation", "estimasi_umur"): (0, math.inf),
+    ("depreciation", "estimasi_nilai_sisa"): (0, math.inf),
+    ("goal_seeking", "goal"): attainable_goals,
+}
+
+class GoalSeekServices:
+    # Solves f(x) = target for one numeric input of a registered calculator with
+    # Brent's method. Brackets around past roots are remembered per calculator,
+    # target and fixed inputs: a repeated seek starts from a bracket a few
+    # tolerances wide. Any other seek of the same input and output starts from a
+    # looser bracket around the last root and expands only as far as it has to.
+    EXPANSION = 1.6
+    MAX_EXPANSIONS = 60
+    MAX_RETREATS = 20
+
+    def __init__(self, max_brackets: int = 1000):
+        self.max_brackets = max_brackets
+        self._brackets: "OrderedDict[Tuple, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split(name: str) -> Tuple[str, Optional[int]]:
+        # 'jadwal_per_tahun:0' addresses one element of a list input or output.
+        key, sep, index = name.partition(":")
+        if not sep:
+            return key, None
+        try:
+            return key, int(index)
+        except ValueError:
+            raise ValueError(f"Invalid index in '{name}'; use '<name>:<index>'.")
+
+    def _cached_bracket(self, *keys: Tuple) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            for key in keys:
+                bracket = self._brackets.get(key)
+                if bracket is not None:
+                    self._brackets.move_to_end(key)
+                    return bracket
+            return None
+
+    def _remember(self, brackets: Dict[Tuple, Tuple[float, float]]) -> None:
+        with self._lock:
+            for key, bracket in brackets.items():
+                self._brackets[key] = bracket
+                self._brackets.move_to_end(key)
+            while len(self._brackets) > self.max_brackets:
+                self._brackets.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._brackets.clear()
+
+    def _fixed_inputs_hash(self, calculator: str, inputs: Dict[str, Any], variable: str) -> str:
+        # The inputs held fixed during a seek, with the solved-for slot blanked out.
+        name, position = self._split(variable)
+        fixed = dict(inputs)
+        if position is None:
+            fixed.pop(name, None)
+        else:
+            fixed[name] = list(fixed[name])
+            fixed[name][position] = None
+        return CalculationGraph.input_hash(calculator, fixed)
+
+    def objective(self, calculator: str, inputs: Dict[str, Any], variable: str, output: str) -> Callable[[float], float]:
+        allowed = calculator_inputs(calculator)
+        function, required, optional = NODE_CALCULATORS[calculator]
+        name, position = self._split(variable)
+        if name not in allowed:
+            raise ValueError(f"Invalid variable for {calculator}. Choose one of {', '.join(sorted(allowed))}.")
+        unknown = set(inputs) - allowed
+        if unknown:
+            raise ValueError(f"Invalid inputs for {calculator}: {', '.join(sorted(unknown))}.")
+
+        base = {**optional, **inputs}
+        if position is None:
+            base[name] = 0.0
+        elif not isinstance(base.get(name), list) or not -len(base[name]) <= position < len(base[name]):
+            raise ValueError(f"Input '{name}' has no element {position}.")
+        missing = [key for key in required if base.get(key) is None]
+        if missing:
+            raise ValueError(f"Missing input: {', '.join(missing)}.")
+        validate_node_inputs(calculator, base)
+        output_name, output_position = self._split(output)
+
+        def evaluate(x: float) -> float:
+            values = dict(base)
+            if position is None:
+                values[name] = x
+            else:
+                values[name] = list(values[name])
+                values[name][position] = x
+            result = function(values)
+            if output_name not in result:
+                raise LookupError(f"{calculator} has no output '{output_name}'. Choose one of {', '.join(result)}.")
+            value = result[output_name]
+            if isinstance(value, list):
+                if output_position is None:
+                    raise LookupError(f"Output '{output_name}' is a list; pick an element with '{output_name}:<index>'.")
+                if not -len(value) <= output_position < len(value):
+                    raise ValueError(f"Output '{output_name}' has no element {output_position} at {name} = {x:g}.")
+                value = value[output_position]
+            elif output_position is not None:
+                raise LookupError(f"Output '{output_name}' is not a list.")
+            value = float(value)
+            if not math.isfinite(value):
+                raise ValueError(f"{calculator} has no finite '{output}' at {name} = {x:g}.")
+            return value
+        return evaluate
+
+    def _start(self, guess: Optional[float], lower: float, upper: float) -> Tuple[float, float]:
+        x0 = 1.0 if guess is None else float(guess)
+        if not lower < x0 < upper:
+            if math.isfinite(lower) and math.isfinite(upper):
+                x0 = (lower + upper) / 2
+            else:
+                x0 = lower + 1 if math.isfinite(lower) else upper - 1
+        return self._around(x0, max(abs(x0) * 0.1, 0.1), lower, upper)
+
+    def _around(self, x: float, half_width: float, lower: float, upper: float) -> Tuple[float, float]:
+        return self._toward(x, x - half_width, lower, upper), self._toward(x, x + half_width, lower, upper)
+
+    @staticmethod
+    def _toward(current: float, candidate: float, lower: float = -math.inf, upper: float = math.inf) -> float:
+        # Steps that would leave the open domain stop halfway to its edge instead.
+        if candidate <= lower:
+            return (current + lower) / 2 if math.isfinite(lower) and current > lower else candidate
+        if candidate >= upper:
+            return (current + upper) / 2 if math.isfinite(upper) and current < upper else candidate
+        return candidate
+
+    def _bracket(
+        self,
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        lower: float,
+        upper: float
+    ) -> Tuple[float, float, float, float]:
+        a, fa = self._probe(f, a, b)
+        b, fb = self._probe(f, b, a)
+        for _ in range(self.MAX_EXPANSIONS):
+            if fa == 0 or fb == 0 or (fa < 0) != (fb < 0):
+                return a, b, fa, fb
+            # Grow on the side closer to the target, as in Numerical Recipes' zbrac.
+            width = b - a
+            if abs(fa) < abs(fb):
+                a, fa = self._probe(f, self._toward(a, a - self.EXPANSION * width, lower, upper), a)
+            else:
+                b, fb = self._probe(f, self._toward(b, b + self.EXPANSION * width, lower, upper), b)
+        raise ValueError(f"Could not bracket the target between {a:g} and {b:g}; the output stays on one side of it.")
+
+    def _probe(self, f: Callable[[float], float], x: float, anchor: float) -> Tuple[float, float]:
+        # Points the calculator rejects are retreated halfway back toward a known point.
+        for _ in range(self.MAX_RETREATS):
+            try:
+                return x, f(x)
+            except ValueError as e:
+                error = e
+                x = (x + anchor) / 2
+        raise ValueError(f"The calculator could not be evaluated near {x:g}: {error} Try another guess.")
+
+    def seek(
+        self,
+        calculator: str,
+        inputs: Dict[str, Any],
+        variable: str,
+        output: str,
+        target: float,
+        guess: Optional[float] = None,
+        tolerance: float = 1e-10,
+        max_evaluations: int = 100
+    ) -> Dict[str, Any]:
+        evaluate = self.objective(calculator, inputs, variable, output)
+        # brentq re-evaluates the bracket ends and the root; only new points are computed.
+        evaluated: Dict[float, float] = {}
+
+        def f(x: float) -> float:
+            if x not in evaluated:
+                if len(evaluated) >= max_evaluations:
+                    raise RuntimeError(f"Goal seeking did not converge within {max_evaluations} evaluations.")
+                evaluated[x] = evaluate(x)
+            return evaluated[x] - target
+
+        domain = INPUT_DOMAINS.get((calculator, self._split(variable)[0]), (-math.inf, math.inf))
+        lower, upper = domain(inputs) if callable(domain) else domain
+        key = (calculator, variable, output)
+        target_key = (*key, float(target), self._fixed_inputs_hash(calculator, inputs, variable))
+        cached = self._cached_bracket(target_key, key) if guess is None else None
+        if cached is not None and not lower < cached[0] <= cached[1] < upper:
+            # A bracket left by other fixed inputs can fall outside this seek's domain.
+            cached = None
+        start = cached if cached is not None else self._start(guess, lower, upper)
+
+        try:
+            a, b, fa, fb = self._bracket(f, *start, lower, upper)
+            if fa == 0 or fb == 0:
+                root = a if fa == 0 else b
+            else:
+                root = brentq(f, a, b, xtol=tolerance, maxiter=max_evaluations)
+        except LookupError as e:
+            raise ValueError(str(e.args[0]))
+        except RuntimeError as e:
+            raise ValueError(str(e))
+
+        achieved = f(root) + target
+        self._remember({
+            target_key: self._around(root, max(tolerance * 4, abs(root) * 1e-14), lower, upper),
+            key: self._around(root, max(abs(root) * 0.01, tolerance * 4), lower, upper),
+        })
+        return {
+            "value": float(root),
+            "achieved": achieved,
+            "evaluations": len(evaluated),
+            "bracket": [float(a), float(b)],
+            "cached_bracket": cached is not None,
+        }
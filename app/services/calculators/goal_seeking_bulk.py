@@ -0,0 +1,156 @@
+import csv
+import io
+import os
+from tempfile import SpooledTemporaryFile
+from zipfile import BadZipFile
+from openpyxl import Workbook, load_workbook # type: ignore
+from openpyxl.utils.exceptions import InvalidFileException # type: ignore
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+class GoalSeekingBulk:
+    # Uploads are long tables with one row per weight: a segment column names the
+    # table, consecutive rows of the same segment form it, and its goal sits on any
+    # of them. Rows are streamed in and results streamed out, so only one batch of
+    # tables is ever held in memory. openpyxl's read-only reader still keeps an empty
+    # element per parsed row, hence the row limit.
+    #
+    # goal_seek_batch pads a batch to its longest table, so a batch is cut by padded
+    # cells (tables x longest table) as well as by table count.
+    COLUMNS = ("segment", "goal", "weight")
+    BATCH_SIZE = 500
+    BATCH_CELLS = 200_000
+
+    def __init__(self, max_rows: int = 500_000):
+        self.max_rows = max_rows
+        self.service = GoalSeekingWeightedAverage()
+
+    def iter_rows(self, file: BinaryIO, filename: Optional[str]) -> Iterator[Sequence[Any]]:
+        extension = os.path.splitext(filename or "")[1].lower()
+        if extension == ".csv":
+            text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+            try:
+                yield from csv.reader(text)
+            finally:
+                text.detach()
+        elif extension in (".xlsx", ".xlsm"):
+            try:
+                workbook = load_workbook(file, read_only=True, data_only=True)
+            except (BadZipFile, InvalidFileException, KeyError):
+                raise ValueError("The uploaded file is not a valid workbook.")
+            try:
+                yield from workbook.worksheets[0].iter_rows(values_only=True)
+            finally:
+                workbook.close()
+        else:
+            raise ValueError("Upload a .xlsx or .csv file.")
+
+    def _number(self, value: Any, name: str, number: int) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Row {number}: {name} must be a number.")
+
+    def iter_tables(self, rows: Iterable[Sequence[Any]]) -> Iterator[Tuple[str, float, List[float]]]:
+        columns = None
+        seen = set()
+        segment, goal, weights = None, None, []
+        for number, row in enumerate(rows, start=1):
+            if number > self.max_rows:
+                raise ValueError(f"The uploaded file has more than {self.max_rows} rows.")
+            cells = ["" if cell is None else str(cell).strip() for cell in row]
+            if not any(cells):
+                continue
+            if columns is None:
+                names = [cell.lower() for cell in cells]
+                missing = [name for name in self.COLUMNS if name not in names]
+                if missing:
+                    raise ValueError(f"Row {number}: the header is missing the {', '.join(missing)} column(s).")
+                columns = [names.index(name) for name in self.COLUMNS]
+                continue
+
+            row_segment, row_goal, row_weight = (row[i] if i < len(row) else None for i in columns)
+            row_segment = "" if row_segment is None else str(row_segment).strip()
+            if not row_segment:
+                raise ValueError(f"Row {number}: segment cannot be empty.")
+            if row_segment != segment:
+                if segment is not None:
+                    if goal is None:
+                        raise ValueError(f"Segment '{segment}' has no goal.")
+                    yield segment, goal, weights
+                if row_segment in seen:
+                    raise ValueError(f"Row {number}: segment '{row_segment}' appears in more than one block.")
+                seen.add(row_segment)
+                segment, goal, weights = row_segment, None, []
+
+            if row_goal not in (None, ""):
+                row_goal = self._number(row_goal, "goal", number)
+                if goal is not None and row_goal != goal:
+                    raise ValueError(f"Row {number}: segment '{segment}' has more than one goal.")
+                goal = row_goal
+            weights.append(self._number(row_weight, "weight", number))
+
+        if columns is None:
+            raise ValueError("The uploaded file is empty.")
+        if segment is not None:
+            if goal is None:
+                raise ValueError(f"Segment '{segment}' has no goal.")
+            yield segment, goal, weights
+
+    def iter_batches(self, tables: Iterable[Tuple[str, float, List[float]]]) -> Iterator[List[Tuple[str, float, List[float]]]]:
+        batch, width = [], 0
+        for table in tables:
+            wider = max(width, len(table[2]))
+            if batch and (len(batch) >= self.BATCH_SIZE or (len(batch) + 1) * wider > self.BATCH_CELLS):
+                yield batch
+                batch, wider = [], len(table[2])
+            batch.append(table)
+            width = wider
+        if batch:
+            yield batch
+
+    def run(self, file: BinaryIO, filename: Optional[str], output: Optional[BinaryIO] = None) -> BinaryIO:
+        wb = Workbook(write_only=True)
+        summary = wb.create_sheet("Summary")
+        summary.append(["Segment", "Goal", "Initial Loss Rate", "Normal Average", "Weighted Average", "Error"])
+        details = wb.create_sheet("Loss Rates")
+        details.append(["Segment", "Row", "Weight", "Loss Rate"])
+
+        # Both generators are closed here, while the upload is still open; left to
+        # the garbage collector, the CSV reader would detach from a closed file.
+        rows = self.iter_rows(file, filename)
+        tables = self.iter_tables(rows)
+        total = 0
+        try:
+            for batch in self.iter_batches(tables):
+                results = self.service.goal_seek_batch([weights for _, _, weights in batch], [goal for _, goal, _ in batch])
+                for (segment, goal, weights), result in zip(batch, results):
+                    summary.append([
+                        segment,
+                        goal,
+                        result["initial_loss_rate"],
+                        result["normal_average"],
+                        result["weighted_average"],
+                        result["error"],
+                    ])
+                    loss_rates = result["loss_rate_array"] or [None] * len(weights)
+                    for row, (weight, loss_rate) in enumerate(zip(weights, loss_rates), start=1):
+                        details.append([segment, row, weight, loss_rate])
+                total += len(batch)
+            if total == 0:
+                raise ValueError("The uploaded file does not contain any tables.")
+        except Exception:
+            # Write-only sheets spill to temporary files that are only removed once
+            # the workbook is saved, so finish a save into nowhere before failing.
+            with open(os.devnull, "wb") as sink:
+                wb.save(sink)
+            raise
+        finally:
+            tables.close()
+            rows.close()
+
+        if output is None:
+            output = SpooledTemporaryFile(max_size=self.service.EXPORT_SPOOL_SIZE)
+        wb.save(output)
+        output.seek(0)
+        return output
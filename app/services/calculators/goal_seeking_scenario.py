@@ -0,0 +1,146 @@
+import heapq
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+import numpy as np
+from app.services.calculators.expiring_store import ExpiringStore
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+class GoalSeekingScenario:
+    # Running sums are rebuilt from the weights after this many single-row edits,
+    # so floating-point drift from repeated add/subtract stays bounded.
+    RESYNC_EVERY = 1024
+
+    def __init__(self, weights: List[float], goal: float, service: GoalSeekingWeightedAverage):
+        self.service = service
+        self.weights = np.array(weights, dtype=float)
+        self.goal = float(goal)
+        self.validate_weights(self.weights)
+        self.resync()
+
+    def validate_weights(self, weights: np.ndarray):
+        if weights.size == 0:
+            raise ValueError("Weights array cannot be empty.")
+        if weights[0] == 0:
+            raise ValueError("The weight of the first row cannot be zero.")
+        if (weights < 0).any():
+            raise ValueError("Weights must be non-negative for incremental goal seeking.")
+
+    def resync(self):
+        mid = self.weights[1:-1]
+        self.total = float(self.weights.sum())
+        self.mid_sum = float(mid.sum())
+        self.mid_sum_squares = float(np.dot(mid, mid))
+        self.mid_heap = [(-w, i) for i, w in enumerate(mid.tolist(), start=1)]
+        heapq.heapify(self.mid_heap)
+        self.edits = 0
+
+    def is_mid(self, index: int) -> bool:
+        return 0 < index < len(self.weights) - 1
+
+    def max_mid_weight(self) -> float:
+        # Lazy deletion: stale heap entries are dropped once they reach the top.
+        while self.mid_heap and self.weights[self.mid_heap[0][1]] != -self.mid_heap[0][0]:
+            heapq.heappop(self.mid_heap)
+        return -self.mid_heap[0][0] if self.mid_heap else 0.0
+
+    def update_weight(self, index: int, weight: float):
+        if not 0 <= index < len(self.weights):
+            raise ValueError("Weight index is out of range.")
+        if index == 0 and weight == 0:
+            raise ValueError("The weight of the first row cannot be zero.")
+        if weight < 0:
+            raise ValueError("Weights must be non-negative for incremental goal seeking.")
+
+        previous = self.weights[index]
+        self.weights[index] = weight
+        self.total += weight - previous
+        if self.is_mid(index):
+            self.mid_sum += weight - previous
+            self.mid_sum_squares += weight * weight - previous * previous
+            heapq.heappush(self.mid_heap, (-weight, index))
+
+        self.edits += 1
+        if self.edits >= self.RESYNC_EVERY or len(self.mid_heap) > 2 * len(self.weights):
+            self.resync()
+
+    def update_goal(self, goal: float):
+        self.goal = float(goal)
+
+    def solve(self) -> Dict[str, Any]:
+        # With x = y * w_0, uncapped middle rows contribute y * w_i^2 to the weighted
+        # sum, so the uncapped segment is y * (w_0^2 + sum w_i^2) + 100 * w_last and
+        # can be solved in O(1). A valid result never caps a row before the last one,
+        # so any solution outside that segment is reported through the exact solver.
+        if self.total == 0:
+            raise ValueError("The sum of weights cannot be zero.")
+
+        n = len(self.weights)
+        first = self.weights[0]
+        if n == 1:
+            initial_loss_rate = self.goal
+            valid = 0 <= initial_loss_rate <= 100
+            normal_average = weighted_average = initial_loss_rate
+        else:
+            last = self.weights[-1]
+            y = (self.goal * self.total - 100 * last) / (first * first + self.mid_sum_squares)
+            initial_loss_rate = y * first
+            valid = 0 <= initial_loss_rate < 100 and y * self.max_mid_weight() < 100
+            normal_average = (initial_loss_rate + y * self.mid_sum + 100) / n
+            weighted_average = (first * initial_loss_rate + y * self.mid_sum_squares + 100 * last) / self.total
+
+        if not valid:
+            weights = self.weights.tolist()
+            self.service.solve_initial_loss_rate(weights, self.goal)
+            raise ValueError("Computed loss rates exceed 100 before the last period.")
+
+        weight_diffs = self.service.weight_difference(self.weights)
+        loss_rates = self.service.calculate_loss_rates(initial_loss_rate, weight_diffs)
+        return {
+            "initial_loss_rate": float(initial_loss_rate),
+            "loss_rate_array": loss_rates.tolist(),
+            "normal_average": float(normal_average),
+            "weighted_average": float(weighted_average),
+        }
+
+class GoalSeekingScenarioStore(ExpiringStore[GoalSeekingScenario]):
+    not_found_message = "Goal seeking scenario not found"
+
+    def __init__(self, max_scenarios: int = 1000, ttl_seconds: int = 3600):
+        super().__init__(max_scenarios, ttl_seconds)
+        self.service = GoalSeekingWeightedAverage()
+
+    def create(self, weights: List[float], goal: float) -> Dict[str, Any]:
+        scenario = GoalSeekingScenario(weights, goal, self.service)
+        result = scenario.solve()
+        return {"scenario_id": self._put(scenario), **result}
+
+    def update(
+        self,
+        scenario_id: uuid.UUID,
+        index: Optional[int] = None,
+        weight: Optional[float] = None,
+        goal: Optional[float] = None
+    ) -> Dict[str, Any]:
+        if (index is None) != (weight is None):
+            raise ValueError("Both index and weight are required to change a weight.")
+
+        with self._lock:
+            scenario = self._get(scenario_id, time.monotonic())
+            previous_weight = scenario.weights[index] if index is not None and 0 <= index < len(scenario.weights) else None
+            previous_goal = scenario.goal
+            try:
+                if index is not None:
+                    scenario.update_weight(index, weight)
+                if goal is not None:
+                    scenario.update_goal(goal)
+                result = scenario.solve()
+            except ValueError:
+                # A rejected edit leaves the scenario as it was; rebuilding the sums
+                # and heap is O(n), but only on the error path.
+                if previous_weight is not None:
+                    scenario.weights[index] = previous_weight
+                scenario.goal = previous_goal
+                scenario.resync()
+                raise
+        return {"scenario_id": scenario_id, **result}
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+from app.core.compute_pool import ComputePool
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+def simulate_chunk(
+    weights: np.ndarray,
+    goal: float,
+    weight_sd: float,
+    goal_sd: float,
+    seed: np.random.SeedSequence,
+    size: int,
+    deadline: Optional[float] = None,
+    step: int = 1_000
+) -> np.ndarray:
+    # Module level so it can be pickled into worker processes. Failed draws are NaN.
+    # All draws are made up front, so the samples do not depend on `step`; solving
+    # stops at `deadline` (time.monotonic()) and returns the draws finished by then.
+    rng = np.random.default_rng(seed)
+    service = GoalSeekingWeightedAverage()
+    perturbed = np.maximum(weights * (1 + rng.normal(0, weight_sd / 100, (size, len(weights)))), 0)
+    goals = goal + rng.normal(0, goal_sd, size)
+    results = []
+    for start in range(0, size, step):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        results.append(service.initial_loss_rates_batch(perturbed[start:start + step], goals[start:start + step]))
+    return np.concatenate(results) if results else np.zeros(0)
+
+class GoalSeekingSimulation:
+    # Draws are split into fixed-size chunks, each seeded from its own child of one
+    # SeedSequence, so a seeded run gives the same draws whatever the worker count.
+    # A chunk holds at most CHUNK_CELLS perturbed weights, so long weight arrays get
+    # proportionally fewer draws per chunk.
+    CHUNK_SIZE = 10_000
+    CHUNK_CELLS = 1_000_000
+    MAX_WEIGHTS = 10_000
+
+    def __init__(self, pool: ComputePool, timeout_seconds: float = 30, max_draws: int = 1_000_000):
+        self.pool = pool
+        self.timeout_seconds = timeout_seconds
+        self.max_draws = max_draws
+        self.service = GoalSeekingWeightedAverage()
+
+    async def simulate(
+        self,
+        weights: List[float],
+        goal: float,
+        draws: int = 10_000,
+        weight_sd: float = 5,
+        goal_sd: float = 0,
+        seed: Optional[int] = None,
+        percentiles: List[float] = (5, 25, 50, 75, 95),
+        bins: int = 20
+    ) -> Dict[str, Any]:
+        if not 1 <= draws <= self.max_draws:
+            raise ValueError(f"draws must be between 1 and {self.max_draws}.")
+        if weight_sd < 0 or goal_sd < 0:
+            raise ValueError("Standard deviations must be non-negative.")
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError("Percentiles must be between 0 and 100.")
+        if len(weights) > self.MAX_WEIGHTS:
+            raise ValueError(f"A simulation cannot have more than {self.MAX_WEIGHTS} weights.")
+        base_initial_loss_rate = self.service.solve_initial_loss_rate(weights, goal)
+
+        base = np.asarray(weights, dtype=float)
+        seed_sequence = np.random.SeedSequence(seed)
+        chunk_size = max(1, min(self.CHUNK_SIZE, self.CHUNK_CELLS // max(len(weights), 1)))
+        sizes = [min(chunk_size, draws - start) for start in range(0, draws, chunk_size)]
+        chunks = [(base, goal, weight_sd, goal_sd, child, size) for child, size in zip(seed_sequence.spawn(len(sizes)), sizes)]
+
+        # Waiting never blocks the event loop, and running chunks check the deadline
+        # themselves, so a timed-out run frees its pool workers along with the request.
+        deadline = time.monotonic() + self.timeout_seconds
+        if len(chunks) == 1:
+            results = [await run_in_threadpool(simulate_chunk, *chunks[0], deadline)]
+            pending = set()
+        else:
+            with self.pool.slot():
+                futures = [self.pool.executor.submit(simulate_chunk, *chunk, deadline) for chunk in chunks]
+                await asyncio.wait([asyncio.wrap_future(future) for future in futures], timeout=self.timeout_seconds)
+                pending = {future for future in futures if not future.done()}
+                for future in pending:
+                    future.cancel()
+                results = [future.result() for future in futures if future not in pending]
+        timed_out = bool(pending) or sum(len(result) for result in results) < draws
+
+        samples = np.concatenate(results) if results else np.zeros(0)
+        solved = samples[~np.isnan(samples)]
+        summary: Dict[str, Any] = {
+            "base_initial_loss_rate": base_initial_loss_rate,
+            "seed": seed_sequence.entropy,
+            "draws": draws,
+            "completed_draws": len(samples),
+            "failed_draws": int(np.isnan(samples).sum()),
+            "timed_out": timed_out,
+            "mean": None,
+            "std": None,
+            "percentiles": {},
+            "histogram": None,
+        }
+        if solved.size:
+            counts, edges = np.histogram(solved, bins=bins)
+            summary.update({
+                "mean": float(solved.mean()),
+                "std": float(solved.std()),
+                "percentiles": {f"p{p:g}": float(v) for p, v in zip(percentiles, np.percentile(solved, percentiles))},
+                "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+            })
+        return summary
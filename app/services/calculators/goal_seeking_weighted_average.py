@@ -1,63 +1,283 @@
+import numpy as np
 from scipy.optimize import root_scalar
+from itertools import chain
+from tempfile import SpooledTemporaryFile
 from openpyxl import Workbook # type: ignore
-from typing import List
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from app.services.calculators.fixed_point import DEFAULT_SCALE, RATE_SCALE, divide_half_even, exact_sum_of_products, to_minor
 
 class GoalSeekingWeightedAverage:
+    EXPORT_SPOOL_SIZE = 1024 * 1024
+
     def __init__(self):
         pass
 
-    def normal_average(self, values):
-        if not values:
+    def _as_input_type(self, source, array: np.ndarray):
+        # Callers passing ndarrays get ndarrays back; list callers keep getting lists.
+        return array if isinstance(source, np.ndarray) else array.tolist()
+
+    def normal_average(self, values, exact: bool = False):
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
             raise ValueError("The input list cannot be empty.")
-        return sum(values) / len(values)
+        if exact:
+            return divide_half_even(int(to_minor(values, RATE_SCALE).sum()), values.size) / RATE_SCALE
+        return float(values.mean())
     
-    def weighted_average(self, values, weights):
-        if len(values) != len(weights):
+    def weighted_average(self, values, weights, exact: bool = False, scale: int = DEFAULT_SCALE):
+        values = np.asarray(values, dtype=float)
+        weights = np.asarray(weights, dtype=float)
+        if values.shape != weights.shape:
             raise ValueError("Values and weights must have the same length.")
-        if not values or not weights:
+        if values.size == 0:
             raise ValueError("Values and weights cannot be empty.")
-        return sum(v * w for v, w in zip(values, weights)) / sum(weights)
+        if exact:
+            # Rates in 1/RATE_SCALE of a percent, weights in minor units; the quotient is
+            # the only rounding step.
+            minor_weights = to_minor(weights, scale)
+            total = int(minor_weights.sum())
+            if total == 0:
+                raise ValueError("The sum of weights cannot be zero.")
+            return divide_half_even(exact_sum_of_products(to_minor(values, RATE_SCALE), minor_weights), total) / RATE_SCALE
+        total = weights.sum()
+        if total == 0:
+            raise ValueError("The sum of weights cannot be zero.")
+        return float(np.dot(values, weights) / total)
 
     def weight_difference(self, weights):
-        if not weights:
+        array = np.asarray(weights, dtype=float)
+        if array.size == 0:
             raise ValueError("Weights array cannot be empty.")
 
-        if weights[0] == 0:
+        if array[0] == 0:
             raise ValueError("The weight of the first row cannot be zero.")
 
-        weight_differences = [(weights[i] / weights[0]) - 1 if i > 0 else 0 for i in range(len(weights))]
+        weight_differences = array / array[0]
+        weight_differences -= 1
+        weight_differences[0] = 0
         
-        return weight_differences
+        return self._as_input_type(weights, weight_differences)
     
-    def calculate_loss_rates(self, initial_loss_rate: float, weight_diffs: List[float]) -> List[float]:
-        loss_rates = [initial_loss_rate]
-        for i, diff in enumerate(weight_diffs[1:], start=1):
-            next_loss_rate = loss_rates[0] * (1 + diff)
-            if i == len(weight_diffs) - 1:
-                next_loss_rate = 100  
-            loss_rates.append(min(next_loss_rate, 100)) 
-        return loss_rates
+    def calculate_loss_rates(self, initial_loss_rate: float, weight_diffs: Union[List[float], np.ndarray]) -> Union[List[float], np.ndarray]:
+        diffs = np.asarray(weight_diffs, dtype=float)
+        loss_rates = np.empty(max(diffs.size, 1))
+        loss_rates[0] = initial_loss_rate
+        np.add(diffs[1:], 1, out=loss_rates[1:])
+        loss_rates[1:] *= initial_loss_rate
+        np.minimum(loss_rates[1:], 100, out=loss_rates[1:])
+        if diffs.size > 1:
+            loss_rates[-1] = 100
+        return self._as_input_type(weight_diffs, loss_rates)
+
+    def attainable_goal_range(self, weights: List[float]) -> Tuple[float, float]:
+        # Goals goal_seek_weighted_average() can meet lie strictly between the weighted
+        # averages at an initial loss rate of 0 and at the rate where the first row
+        # before the last reaches the 100 cap (or 100 itself); the average is linear
+        # in between.
+        diffs = np.asarray(self.weight_difference(weights), dtype=float)
+        ratios = diffs[1:-1] + 1
+        ceiling = float(np.min(100 / ratios[ratios > 0], initial=100))
+        bounds = [self.weighted_average(self.calculate_loss_rates(x, diffs), weights) for x in (0, ceiling)]
+        return min(bounds), max(bounds)
 
     def goal_seek(self, func, goal, args):
         def wrapper(x):
             return func(x, *args) - goal
-        result = root_scalar(wrapper, bracket=[0, 100], method='bisect')
+        result = root_scalar(wrapper, bracket=[0, 100], method='brentq')
         if not result.converged:
             raise ValueError("Goal seeking failed to converge.")
         return result.root
+
+    def pad_weight_matrix(self, weight_matrix: List[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        lengths = np.fromiter((len(row) for row in weight_matrix), dtype=np.intp, count=len(weight_matrix))
+        width = max(int(lengths.max(initial=0)), 1)
+        weights = np.zeros((len(weight_matrix), width))
+        weights[np.arange(width) < lengths[:, None]] = np.fromiter(chain.from_iterable(weight_matrix), dtype=float)
+        return weights, lengths
+
+    def weight_difference_batch(self, weights: np.ndarray) -> np.ndarray:
+        first = weights[:, :1]
+        weight_diffs = np.where(first == 0, np.nan, weights / np.where(first == 0, 1, first) - 1)
+        weight_diffs[:, 0] = 0
+        return weight_diffs
+
+    def calculate_loss_rates_batch(self, initial_loss_rates: np.ndarray, weight_diffs: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        cols = np.arange(weight_diffs.shape[1])
+        loss_rates = np.minimum(initial_loss_rates[:, None] * (1 + weight_diffs), 100)
+        loss_rates[:, 0] = initial_loss_rates
+        loss_rates[(cols == lengths[:, None] - 1) & (lengths[:, None] > 1)] = 100
+        loss_rates[cols >= lengths[:, None]] = 0
+        return loss_rates
+
+    def solve_initial_loss_rates(
+        self,
+        weights: np.ndarray,
+        lengths: np.ndarray,
+        goals: np.ndarray,
+        lower: float = 0,
+        upper: float = 100
+    ) -> Tuple[np.ndarray, List[Optional[str]]]:
+        # The weighted average of calculate_loss_rates() is piecewise linear in the
+        # initial loss rate x: row i (0 < i < n - 1) follows x * w_i / w_0 until it
+        # hits the 100 cap at x = 100 * w_0 / w_i, and the last row is pinned at 100.
+        # Walking the sorted kinks lets us solve each linear segment exactly, for
+        # every scenario (row of the padded weight matrix) at once.
+        n_rows, width = weights.shape
+        rows = np.arange(n_rows)
+        cols = np.arange(width)
+        goals = np.broadcast_to(np.asarray(goals, dtype=float), (n_rows,))
+
+        totals = weights.sum(axis=1)
+        safe_totals = np.where(totals == 0, 1, totals)
+        ratios = np.nan_to_num(self.weight_difference_batch(weights) + 1, nan=0)
+        is_last = (cols == lengths[:, None] - 1) & (lengths[:, None] > 1)
+        is_mid = (cols >= 1) & (cols < lengths[:, None] - 1)
+
+        base_slope = weights[:, 0] + np.where(is_mid, weights * ratios, 0).sum(axis=1)
+        base_intercept = 100 * np.where(is_last, weights, 0).sum(axis=1)
+
+        cappable = is_mid & (ratios > 0)
+        breakpoints = np.full(weights.shape, np.inf)
+        breakpoints[cappable] = 100 / ratios[cappable]
+        order = np.argsort(breakpoints, axis=1)
+        breakpoints = np.take_along_axis(breakpoints, order, axis=1)
+        zero_col = np.zeros((n_rows, 1))
+        capped_wr = np.hstack((zero_col, np.cumsum(np.take_along_axis(np.where(cappable, weights * ratios, 0), order, axis=1), axis=1)))
+        capped_w = np.hstack((zero_col, np.cumsum(np.take_along_axis(np.where(cappable, weights, 0), order, axis=1), axis=1)))
+
+        knots = np.hstack((np.full((n_rows, 1), lower), np.clip(breakpoints, lower, upper), np.full((n_rows, 1), upper)))
+        n_capped = np.clip(
+            np.arange(width + 2),
+            (breakpoints <= lower).sum(axis=1)[:, None],
+            (breakpoints <= upper).sum(axis=1)[:, None]
+        )
+        slopes = base_slope[:, None] - np.take_along_axis(capped_wr, n_capped, axis=1)
+        intercepts = base_intercept[:, None] + 100 * np.take_along_axis(capped_w, n_capped, axis=1)
+        residuals = (slopes * knots + intercepts) / safe_totals[:, None] - goals[:, None]
+
+        exact = residuals == 0
+        crossing = np.hstack((residuals[:, :-1] * residuals[:, 1:] < 0, np.zeros((n_rows, 1), dtype=bool)))
+        events = exact | crossing
+        segment = events.argmax(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            solved = (goals * totals - intercepts[rows, segment]) / slopes[rows, segment]
+        initial_loss_rates = np.where(exact[rows, segment], knots[rows, segment], solved)
+
+        errors: List[Optional[str]] = [None] * n_rows
+        failures = [
+            (~events.any(axis=1), "Goal seeking failed: the goal is outside the attainable weighted average range."),
+            (totals == 0, "The sum of weights cannot be zero."),
+            (weights[:, 0] == 0, "The weight of the first row cannot be zero."),
+            (lengths == 0, "Weights array cannot be empty."),
+        ]
+        for mask, message in failures:
+            for i in np.flatnonzero(mask):
+                errors[i] = message
+        initial_loss_rates[[i for i, error in enumerate(errors) if error]] = np.nan
+
+        return initial_loss_rates, errors
+
+    def solve_initial_loss_rate(self, weights: List[float], goal: float, lower: float = 0, upper: float = 100) -> float:
+        padded, lengths = self.pad_weight_matrix([weights])
+        initial_loss_rates, errors = self.solve_initial_loss_rates(padded, lengths, np.array([goal]), lower, upper)
+        if errors[0]:
+            raise ValueError(errors[0])
+        return float(initial_loss_rates[0])
+
+    def initial_loss_rates_batch(self, weights: np.ndarray, goals: np.ndarray) -> np.ndarray:
+        # Equal-length scenarios in, initial loss rates out, with NaN wherever
+        # goal_seek_weighted_average() would have raised.
+        lengths = np.full(len(weights), weights.shape[1])
+        initial_loss_rates, _ = self.solve_initial_loss_rates(weights, lengths, goals)
+        loss_rates = self.calculate_loss_rates_batch(initial_loss_rates, self.weight_difference_batch(weights), lengths)
+        initial_loss_rates[(loss_rates[:, :-1] >= 100).any(axis=1)] = np.nan
+        return initial_loss_rates
+
+    def goal_seek_batch(self, weight_matrix: List[List[float]], goals: List[float]) -> List[Dict[str, Any]]:
+        if len(goals) not in (1, len(weight_matrix)):
+            raise ValueError("The length of goals must be 1 or match the number of weight arrays.")
+
+        weights, lengths = self.pad_weight_matrix(weight_matrix)
+        initial_loss_rates, errors = self.solve_initial_loss_rates(weights, lengths, np.asarray(goals, dtype=float))
+
+        cols = np.arange(weights.shape[1])
+        loss_rates = self.calculate_loss_rates_batch(initial_loss_rates, self.weight_difference_batch(weights), lengths)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normal_averages = loss_rates.sum(axis=1) / lengths
+            weighted_averages = (loss_rates * weights).sum(axis=1) / weights.sum(axis=1)
+        exceeded = ((loss_rates >= 100) & (cols < lengths[:, None] - 1)).any(axis=1)
+
+        results = []
+        for i, length in enumerate(lengths):
+            error = errors[i] or ("Computed loss rates exceed 100 before the last period." if exceeded[i] else None)
+            if error:
+                results.append({
+                    "initial_loss_rate": None,
+                    "loss_rate_array": None,
+                    "normal_average": None,
+                    "weighted_average": None,
+                    "error": error,
+                })
+                continue
+            results.append({
+                "initial_loss_rate": float(initial_loss_rates[i]),
+                "loss_rate_array": loss_rates[i, :length].tolist(),
+                "normal_average": float(normal_averages[i]),
+                "weighted_average": float(weighted_averages[i]),
+                "error": None,
+            })
+        return results
     
-    def export_to_excel(self, values: List[float], weights: List[float], goal: float, file_name: str = "Results.xlsx"):
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Results"
+    def goal_seek_weighted_average(self, weights: List[float], goal: float) -> Dict[str, Any]:
+        weight_diffs = self.weight_difference(weights)
+
+        initial_loss_rate = self.solve_initial_loss_rate(weights, goal)
+
+        loss_rate_array = self.calculate_loss_rates(initial_loss_rate, weight_diffs)
+
+        normal_average = self.normal_average(loss_rate_array)
+        weighted_average = self.weighted_average(loss_rate_array, weights)
+
+        if any(rate >= 100 for rate in loss_rate_array[:-1]):
+            raise ValueError("Computed loss rates exceed 100 before the last period.")
+
+        return {
+            "initial_loss_rate": initial_loss_rate,
+            "loss_rate_array": loss_rate_array,
+            "normal_average": normal_average,
+            "weighted_average": weighted_average,
+        }
+
+    def export_to_excel(
+        self,
+        loss_rates: List[float],
+        weights: List[float],
+        summary: Dict[str, float],
+        output: Optional[BinaryIO] = None
+    ) -> BinaryIO:
+        # Write-only mode streams rows to the sheet instead of keeping cells in memory,
+        # and each export gets its own spooled file, so concurrent requests never share
+        # a path on disk.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Results")
 
-        ws.append(["Values", "Weights", "Weighted Average", "Goal Seek Result"])
+        ws.append(["Row", "Loss Rate", "Weight"])
+        for row, (loss_rate, weight) in enumerate(zip(loss_rates, weights), start=1):
+            ws.append([row, loss_rate, weight])
 
-        wa = self.weighted_average(values, weights)
-        gs = self.goal_seek(lambda x, v, w: self.weighted_average(v, [x] + w[1:]), goal, (values, weights))
+        ws.append([])
+        for label, value in summary.items():
+            ws.append([label, value])
 
-        ws.append([str(values), str(weights), wa, gs])
+        if output is None:
+            output = SpooledTemporaryFile(max_size=self.EXPORT_SPOOL_SIZE)
+        wb.save(output)
+        output.seek(0)
+        return output
 
-        file_path = f"/tmp/{file_name}" 
-        wb.save(file_path)
-        return file_path
\ No newline at end of file
+    def iter_file(self, file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        try:
+            while chunk := file.read(chunk_size):
+                yield chunk
+        finally:
+            file.close()
@@ -0,0 +1,118 @@
+import numpy as np
+from datetime import date
+from typing import List, Optional, Tuple
+
+class InternalRateOfReturnServices:
+    # Rates are solved as fractions internally and reported in %, like the other calculators.
+    BRACKET_GRID = np.array([-0.99, -0.9, -0.5, -0.2, 0, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 100])
+
+    def __init__(self):
+        pass
+
+    def pad_series(self, cash_flows: List[List[float]], dates: Optional[List[List[date]]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        lengths = np.fromiter((len(row) for row in cash_flows), dtype=np.intp, count=len(cash_flows))
+        width = max(int(lengths.max(initial=0)), 1)
+        mask = np.arange(width) < lengths[:, None]
+
+        flows = np.zeros((len(cash_flows), width))
+        flows[mask] = np.concatenate([np.asarray(row, dtype=float) for row in cash_flows] or [np.zeros(0)])
+
+        if dates is None:
+            times = np.broadcast_to(np.arange(width, dtype=float), flows.shape).copy()
+        else:
+            if len(dates) != len(cash_flows) or any(len(d) != n for d, n in zip(dates, lengths)):
+                raise ValueError("dates must have the same shape as cash_flows.")
+            days = np.zeros(flows.shape)
+            days[mask] = np.concatenate([
+                (np.array(row, dtype="datetime64[D]") - np.datetime64(row[0], "D")).astype(float) if row else np.zeros(0)
+                for row in dates
+            ] or [np.zeros(0)])
+            times = days / 365
+        times[~mask] = 0
+        return flows, times
+
+    def npv_and_derivative(self, rates: np.ndarray, cash_flows: np.ndarray, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            discounted = cash_flows * (1 + rates)[:, None] ** -times
+            npv = discounted.sum(axis=1)
+            derivative = -(times * discounted).sum(axis=1) / (1 + rates)
+        return npv, derivative
+
+    def solve(
+        self,
+        cash_flows: np.ndarray,
+        times: np.ndarray,
+        guess: float = 0.1,
+        tol: float = 1e-10,
+        max_iter: int = 50
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+        n_rows = len(cash_flows)
+        rates = np.full(n_rows, guess, dtype=float)
+        converged = np.zeros(n_rows, dtype=bool)
+        scale = np.abs(cash_flows).sum(axis=1)
+
+        errors: List[Optional[str]] = [None] * n_rows
+        valid = (cash_flows > 0).any(axis=1) & (cash_flows < 0).any(axis=1)
+        for i in np.flatnonzero(~valid):
+            errors[i] = "Cash flows must contain at least one positive and one negative value."
+
+        # Newton steps on every unconverged series at once; series that diverge or
+        # leave the (-100%, inf) domain drop out to the bracketed fallback below.
+        active = valid.copy()
+        for _ in range(max_iter):
+            rows = np.flatnonzero(active)
+            if not rows.size:
+                break
+            npv, derivative = self.npv_and_derivative(rates[rows], cash_flows[rows], times[rows])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stepped = rates[rows] - npv / derivative
+            diverged = ~np.isfinite(stepped) | (stepped <= -1)
+            settled = ~diverged & (np.abs(stepped - rates[rows]) <= tol * np.maximum(1, np.abs(rates[rows])))
+            rates[rows[~diverged]] = stepped[~diverged]
+            converged[rows[settled]] = True
+            active[rows[diverged | settled]] = False
+
+        npv, _ = self.npv_and_derivative(rates, cash_flows, times)
+        converged &= np.abs(npv) <= 1e-7 * np.maximum(scale, 1)
+
+        fallback = np.flatnonzero(valid & ~converged)
+        if fallback.size:
+            rates[fallback], converged[fallback] = self.bisect(cash_flows[fallback], times[fallback], tol)
+
+        for i in np.flatnonzero(valid & ~converged):
+            errors[i] = "IRR did not converge: NPV does not change sign between -99% and 10000%."
+        rates[~converged] = np.nan
+        return rates, converged, errors
+
+    def bisect(self, cash_flows: np.ndarray, times: np.ndarray, tol: float, max_iter: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        n_rows = len(cash_flows)
+        grid = np.broadcast_to(self.BRACKET_GRID, (n_rows, len(self.BRACKET_GRID)))
+        values = np.stack([self.npv_and_derivative(grid[:, k], cash_flows, times)[0] for k in range(grid.shape[1])], axis=1)
+
+        crossing = np.isfinite(values[:, :-1]) & np.isfinite(values[:, 1:]) & (np.sign(values[:, :-1]) != np.sign(values[:, 1:]))
+        bracketed = crossing.any(axis=1)
+        first = crossing.argmax(axis=1)
+        rows = np.arange(n_rows)
+        lower, upper = grid[rows, first].copy(), grid[rows, first + 1].copy()
+        lower_value = values[rows, first]
+
+        for _ in range(max_iter):
+            middle = (lower + upper) / 2
+            middle_value, _ = self.npv_and_derivative(middle, cash_flows, times)
+            same_side = np.sign(middle_value) == np.sign(lower_value)
+            lower = np.where(same_side, middle, lower)
+            lower_value = np.where(same_side, middle_value, lower_value)
+            upper = np.where(same_side, upper, middle)
+            if (upper - lower <= tol * np.maximum(1, np.abs(lower))).all():
+                break
+
+        return (lower + upper) / 2, bracketed
+
+    def irr(self, cash_flows: List[List[float]], dates: Optional[List[List[date]]] = None, guess: float = 10) -> Tuple[np.ndarray, np.ndarray, List[Optional[str]]]:
+        if not cash_flows:
+            raise ValueError("Cash flows cannot be empty.")
+        if guess <= -100:
+            raise ValueError("Guess must be greater than -100%.")
+        flows, times = self.pad_series(cash_flows, dates)
+        rates, converged, errors = self.solve(flows, times, guess / 100)
+        return rates * 100, converged, errors
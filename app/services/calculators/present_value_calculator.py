@@ -1,7 +1,81 @@
+import numpy as np
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from app.services.calculators.fixed_point import DEFAULT_SCALE, from_minor, round_to_minor, to_minor
+
 class PresentValueServices:
     def __init__(self):
         pass
 
-    def present_value(self, future_value, rate, period):
+    def present_value(self, future_value, rate, period, exact: bool = False, scale: int = DEFAULT_SCALE):
         rate_in_percentage = rate / 100
-        return future_value / (1 + rate_in_percentage) ** period
\ No newline at end of file
+        if exact:
+            return float(from_minor(round_to_minor(to_minor(future_value, scale) / (1 + rate_in_percentage) ** period), scale))
+        return future_value / (1 + rate_in_percentage) ** period
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def discount_factors(rate: float, horizon: int, start_period: int = 1) -> np.ndarray:
+        # Cached per (rate, horizon, start period) and shared across requests, so the
+        # array is frozen to keep one caller from corrupting another's factors.
+        if rate <= -100:
+            raise ValueError("Rate must be greater than -100%.")
+        factors = (1 + rate / 100) ** -np.arange(start_period, start_period + horizon, dtype=float)
+        factors.setflags(write=False)
+        return factors
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def curve_discount_factors(rate_curve: Tuple[float, ...], start_period: int = 1) -> np.ndarray:
+        rates = np.asarray(rate_curve, dtype=float)
+        if (rates <= -100).any():
+            raise ValueError("Rate must be greater than -100%.")
+        factors = (1 + rates / 100) ** -np.arange(start_period, start_period + len(rates), dtype=float)
+        factors.setflags(write=False)
+        return factors
+
+    def cash_flow_matrix(self, cash_flows: List[List[float]]) -> np.ndarray:
+        lengths = np.fromiter((len(row) for row in cash_flows), dtype=np.intp, count=len(cash_flows))
+        if not len(cash_flows) or not lengths.max(initial=0):
+            raise ValueError("Cash flows cannot be empty.")
+        matrix = np.zeros((len(cash_flows), int(lengths.max())))
+        matrix[np.arange(matrix.shape[1]) < lengths[:, None]] = np.concatenate([np.asarray(row, dtype=float) for row in cash_flows])
+        return matrix
+
+    def net_present_value(
+        self,
+        cash_flows: List[List[float]],
+        rate: Optional[float] = None,
+        rates: Optional[List[float]] = None,
+        rate_curve: Optional[List[float]] = None,
+        start_period: int = 1,
+        exact: bool = False,
+        scale: int = DEFAULT_SCALE
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if sum(option is not None for option in (rate, rates, rate_curve)) != 1:
+            raise ValueError("Provide exactly one of rate, rates or rate_curve.")
+
+        matrix = self.cash_flow_matrix(cash_flows)
+        n_rows, horizon = matrix.shape
+
+        if rate is not None:
+            factors = self.discount_factors(float(rate), horizon, start_period)
+        elif rates is not None:
+            if len(rates) != n_rows:
+                raise ValueError("rates must have one rate per cash flow row.")
+            unique_rates, inverse = np.unique(np.asarray(rates, dtype=float), return_inverse=True)
+            table = np.stack([self.discount_factors(float(r), horizon, start_period) for r in unique_rates])
+            factors = table[inverse]
+        else:
+            if len(rate_curve) != horizon:
+                raise ValueError("rate_curve must have one rate per cash flow period.")
+            factors = self.curve_discount_factors(tuple(float(r) for r in rate_curve), start_period)
+
+        if exact:
+            # Each discounted cash flow is rounded to minor units before summing, so the
+            # NPV equals the sum of the line items an auditor would tick.
+            discounted = round_to_minor(to_minor(matrix, scale) * factors)
+            return from_minor(discounted.sum(axis=1), scale), factors
+        if factors.ndim == 2:
+            return np.einsum("ij,ij->i", matrix, factors), factors
+        return matrix @ factors, factors
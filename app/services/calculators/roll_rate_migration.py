@@ -0,0 +1,135 @@
+import threading
+import uuid
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
+import numpy as np
+from app.services.calculators.expiring_store import ExpiringStore
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+Snapshot = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+class RollRateHistory:
+    # Snapshots are kept sorted by account id. flows[m] is the balance-weighted
+    # (bucket at month m) x (bucket at month m + 1) matrix, with one extra column for
+    # accounts that are gone the next month. Only the pairs touching a new or replaced
+    # month are rebuilt, so adding a month never reprocesses the older history.
+    # Account-level snapshots are kept only for the latest month and the
+    # REPLACEABLE_MONTHS before it; older months survive as their flows alone and can
+    # no longer be added or replaced.
+    REPLACEABLE_MONTHS = 12
+
+    def __init__(self, buckets: List[str]):
+        if len(buckets) < 2:
+            raise ValueError("At least two aging buckets are required.")
+        if len(set(buckets)) != len(buckets):
+            raise ValueError("Aging bucket names must be unique.")
+        self.buckets = list(buckets)
+        self.months: Set[int] = set()
+        self.snapshots: Dict[int, Snapshot] = {}
+        self.flows: Dict[int, np.ndarray] = {}
+        self.lock = threading.Lock()
+
+    def as_snapshot(self, account_ids: List[Any], buckets: List[int], balances: List[float]) -> Snapshot:
+        ids = np.asarray(account_ids)
+        bucket = np.asarray(buckets, dtype=np.int64)
+        balance = np.asarray(balances, dtype=float)
+        if not (ids.shape == bucket.shape == balance.shape) or ids.ndim != 1:
+            raise ValueError("account_ids, buckets and balances must have the same length.")
+        if ((bucket < 0) | (bucket >= len(self.buckets))).any():
+            raise ValueError(f"Bucket index must be between 0 and {len(self.buckets) - 1}.")
+        if (balance < 0).any():
+            raise ValueError("Balances must be non-negative.")
+
+        order = np.argsort(ids, kind="stable")
+        ids, bucket, balance = ids[order], bucket[order], balance[order]
+        if (ids[1:] == ids[:-1]).any():
+            raise ValueError("Account ids must be unique within a snapshot.")
+        return ids, bucket, balance
+
+    def transition(self, opening: Snapshot, closing: Snapshot) -> np.ndarray:
+        n_buckets = len(self.buckets)
+        ids, bucket, balance = opening
+        next_ids, next_bucket, _ = closing
+        if len(next_ids):
+            position = np.minimum(np.searchsorted(next_ids, ids), len(next_ids) - 1)
+            destination = np.where(next_ids[position] == ids, next_bucket[position], n_buckets)
+        else:
+            destination = np.full(len(ids), n_buckets)
+        flows = np.bincount(bucket * (n_buckets + 1) + destination, weights=balance, minlength=n_buckets * (n_buckets + 1))
+        return flows.reshape(n_buckets, n_buckets + 1)
+
+    def add_snapshot(self, month: date, account_ids: List[Any], buckets: List[int], balances: List[float]):
+        key = int(np.datetime64(month, "M").astype(np.int64))
+        if self.months and key < max(self.months) - self.REPLACEABLE_MONTHS:
+            raise ValueError(f"Only the latest month and the {self.REPLACEABLE_MONTHS} months before it can be added or replaced.")
+        snapshot = self.as_snapshot(account_ids, buckets, balances)
+        self.snapshots[key] = snapshot
+        self.months.add(key)
+        if key - 1 in self.snapshots:
+            self.flows[key - 1] = self.transition(self.snapshots[key - 1], snapshot)
+        if key + 1 in self.snapshots:
+            self.flows[key] = self.transition(snapshot, self.snapshots[key + 1])
+
+        oldest = max(self.months) - self.REPLACEABLE_MONTHS
+        for m in [m for m in self.snapshots if m < oldest]:
+            del self.snapshots[m]
+
+    def summary(self, months: Optional[int] = None) -> Dict[str, Any]:
+        if not self.months:
+            raise ValueError("No snapshots have been added yet.")
+        latest = max(self.months)
+        window = sorted(self.flows)
+        if months is not None:
+            window = [m for m in window if m >= latest - months]
+        n_buckets = len(self.buckets)
+        flows = sum((self.flows[m] for m in window), np.zeros((n_buckets, n_buckets + 1)))
+
+        opening = flows.sum(axis=1)
+        transition_matrix = np.divide(flows, opening[:, None], out=np.zeros_like(flows), where=opening[:, None] > 0)
+        # Share of each bucket that rolled to any later bucket the next month; the
+        # loss rate of a bucket is the chance of rolling all the way to the last one.
+        roll_forward = np.array([transition_matrix[i, i + 1:n_buckets].sum() for i in range(n_buckets - 1)])
+        loss_rates = np.append(np.cumprod(roll_forward[::-1])[::-1], 1) * 100
+
+        _, latest_bucket, latest_balance = self.snapshots[latest]
+        exposure = np.bincount(latest_bucket, weights=latest_balance, minlength=n_buckets)
+        weights = exposure / exposure.sum() * 100 if exposure.sum() > 0 else exposure
+
+        service = GoalSeekingWeightedAverage()
+        return {
+            "buckets": self.buckets,
+            "months": [str(np.datetime64(m, "M")) for m in sorted(self.months)],
+            "transitions_used": len(window),
+            "transition_matrix": transition_matrix.tolist(),
+            "roll_rates": (roll_forward * 100).tolist(),
+            "loss_rate_array": loss_rates.tolist(),
+            "weight_array": weights.tolist(),
+            "normal_average": float(service.normal_average(loss_rates)),
+            "weighted_average": float(service.weighted_average(loss_rates, weights)) if exposure.sum() > 0 else None,
+        }
+
+class RollRateHistoryStore(ExpiringStore[RollRateHistory]):
+    not_found_message = "Roll rate history not found"
+
+    def create(self, buckets: List[str]) -> Dict[str, Any]:
+        history = RollRateHistory(buckets)
+        return {"history_id": self._put(history), "buckets": history.buckets}
+
+    def add_snapshot(
+        self,
+        history_id: uuid.UUID,
+        month: date,
+        account_ids: List[Any],
+        buckets: List[int],
+        balances: List[float],
+        months: Optional[int] = None
+    ) -> Dict[str, Any]:
+        history = self.get(history_id)
+        with history.lock:
+            history.add_snapshot(month, account_ids, buckets, balances)
+            return {"history_id": history_id, **history.summary(months)}
+
+    def summary(self, history_id: uuid.UUID, months: Optional[int] = None) -> Dict[str, Any]:
+        history = self.get(history_id)
+        with history.lock:
+            return {"history_id": history_id, **history.summary(months)}
@@ -0,0 +1,98 @@
+import re
+import numpy as np
+from typing import Any, Dict, List
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+from app.services.calculators.present_value_calculator import PresentValueServices
+from app.services.calculators.tvm_calculator import TimeValueOfMoneyServices
+
+class SensitivityServices:
+    MAX_CELLS = 1_000_000
+    CALCULATORS = {
+        "present_value": ("present_value", ("future_value", "rate", "period")),
+        "tvm": ("result", ("rate", "nper", "pmt", "pv", "fv", "when")),
+        "goal_seeking": ("initial_loss_rate", ("goal", "weight_shift", "weight:<index>")),
+    }
+
+    def __init__(self):
+        self.present_value_service = PresentValueServices()
+        self.tvm_service = TimeValueOfMoneyServices()
+        self.goal_seeking_service = GoalSeekingWeightedAverage()
+
+    def grid_size(self, base: Dict[str, Any], x_values: List[float], y_values: List[float]) -> int:
+        # goal_seeking solves one weight profile per cell, so its grid holds
+        # len(weight_array) values per cell and the limit counts all of them.
+        weights = base.get("weight_array")
+        size = len(x_values) * len(y_values) * (len(weights) if isinstance(weights, list) else 1)
+        if size > self.MAX_CELLS:
+            raise ValueError(f"A sensitivity grid cannot have more than {self.MAX_CELLS} cells, counting every weight of a goal-seeking grid.")
+        return size
+
+    def grid(
+        self,
+        calculator: str,
+        base: Dict[str, Any],
+        x_name: str,
+        x_values: List[float],
+        y_name: str,
+        y_values: List[float]
+    ) -> np.ndarray:
+        if calculator not in self.CALCULATORS:
+            raise ValueError(f"Invalid calculator. Choose one of {', '.join(repr(name) for name in self.CALCULATORS)}.")
+        if x_name == y_name:
+            raise ValueError("The two axes must vary different inputs.")
+        if not x_values or not y_values:
+            raise ValueError("Axis values cannot be empty.")
+        self.grid_size(base, x_values, y_values)
+
+        _, parameters = self.CALCULATORS[calculator]
+        for name in (x_name, y_name):
+            if name not in parameters and not (calculator == "goal_seeking" and re.fullmatch(r"weight:\d+", name)):
+                raise ValueError(f"Invalid axis '{name}' for {calculator}. Choose one of {', '.join(parameters)}.")
+
+        # x varies down the rows and y across the columns, so every input broadcasts
+        # to the (len(x), len(y)) grid without materializing it per call.
+        x = np.asarray(x_values, dtype=float)[:, None]
+        y = np.asarray(y_values, dtype=float)[None, :]
+        grid = getattr(self, calculator)({**base, x_name: x, y_name: y}, x.shape[0], y.shape[1])
+        return np.broadcast_to(grid, (x.shape[0], y.shape[1]))
+
+    def present_value(self, inputs: Dict[str, Any], n_x: int, n_y: int) -> np.ndarray:
+        missing = [name for name in ("future_value", "rate", "period") if inputs.get(name) is None]
+        if missing:
+            raise ValueError(f"Missing base input: {', '.join(missing)}.")
+        rate = np.asarray(inputs["rate"], dtype=float)
+        if (rate <= -100).any():
+            raise ValueError("Rate must be greater than -100%.")
+        return self.present_value_service.present_value(
+            np.asarray(inputs["future_value"], dtype=float), rate, np.asarray(inputs["period"], dtype=float)
+        )
+
+    def tvm(self, inputs: Dict[str, Any], n_x: int, n_y: int) -> np.ndarray:
+        if "solve_for" not in inputs:
+            raise ValueError("Missing base input: solve_for.")
+        arguments = {name: inputs.get(name) for name in ("rate", "nper", "pmt", "pv", "fv")}
+        return self.tvm_service.solve(inputs["solve_for"], when=inputs.get("when", 0), guess=inputs.get("guess", 10), **arguments)
+
+    def goal_seeking(self, inputs: Dict[str, Any], n_x: int, n_y: int) -> np.ndarray:
+        if inputs.get("weight_array") is None or inputs.get("goal") is None:
+            raise ValueError("Missing base input: weight_array and goal are required.")
+        base_weights = np.asarray(inputs["weight_array"], dtype=float)
+        if base_weights.size == 0:
+            raise ValueError("Weights array cannot be empty.")
+
+        # One goal-seek scenario per cell: weights is (x, y, rows) before flattening.
+        weights = np.broadcast_to(base_weights, (n_x, n_y, base_weights.size)).copy()
+        for name, value in inputs.items():
+            if name.startswith("weight:"):
+                index = int(name.split(":", 1)[1])
+                if index >= base_weights.size:
+                    raise ValueError(f"Weight index {index} is out of range.")
+                weights[:, :, index] = value
+        # weight_shift scales every row after the first by (1 + shift / 100), moving
+        # the profile towards older buckets for positive shifts.
+        shift = np.asarray(inputs.get("weight_shift", 0), dtype=float)
+        weights[:, :, 1:] *= np.broadcast_to(1 + shift / 100, (n_x, n_y))[:, :, None]
+
+        goals = np.broadcast_to(np.asarray(inputs["goal"], dtype=float), (n_x, n_y)).ravel()
+        initial_loss_rates = self.goal_seeking_service.initial_loss_rates_batch(weights.reshape(n_x * n_y, -1), goals)
+        return initial_loss_rates.reshape(n_x, n_y)
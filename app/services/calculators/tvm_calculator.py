@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Any, Dict
+
+class TimeValueOfMoneyServices:
+    # Excel sign convention: pv * (1 + r)^n + pmt * (1 + r * when) * ((1 + r)^n - 1) / r + fv = 0,
+    # with rate in % per period and when = 0 (end of period) or 1 (beginning).
+    VARIABLES = ("rate", "nper", "pmt", "pv", "fv")
+    MAX_CELLS = 1_000_000
+
+    def __init__(self):
+        pass
+
+    def broadcast(self, **arguments) -> Dict[str, np.ndarray]:
+        names = list(arguments)
+        try:
+            arrays = np.broadcast_arrays(*(np.asarray(arguments[name], dtype=float) for name in names))
+        except ValueError:
+            raise ValueError("Arguments could not be broadcast to a common shape.")
+        return dict(zip(names, arrays))
+
+    def result_size(self, *arguments: Any) -> int:
+        try:
+            size = int(np.prod(np.broadcast_shapes(*(np.shape(argument) for argument in arguments if argument is not None))))
+        except ValueError:
+            return 0
+        if size > self.MAX_CELLS:
+            raise ValueError(f"A time value of money result cannot have more than {self.MAX_CELLS} cells.")
+        return size
+
+    def annuity_factor(self, r: np.ndarray, nper: np.ndarray, growth: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(r == 0, nper, (growth - 1) / np.where(r == 0, 1, r))
+
+    def present_value(self, r, nper, pmt, fv, when):
+        growth = (1 + r) ** nper
+        return -(fv + pmt * (1 + r * when) * self.annuity_factor(r, nper, growth)) / growth
+
+    def future_value(self, r, nper, pmt, pv, when):
+        growth = (1 + r) ** nper
+        return -(pv * growth + pmt * (1 + r * when) * self.annuity_factor(r, nper, growth))
+
+    def payment(self, r, nper, pv, fv, when):
+        growth = (1 + r) ** nper
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -(fv + pv * growth) / ((1 + r * when) * self.annuity_factor(r, nper, growth))
+
+    def number_of_periods(self, r, pmt, pv, fv, when):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            adjusted = pmt * (1 + r * when)
+            safe_r = np.where(r == 0, 1, r)
+            periods = np.log((adjusted - fv * safe_r) / (adjusted + pv * safe_r)) / np.log1p(safe_r)
+            return np.where(r == 0, -(fv + pv) / pmt, periods)
+
+    def rate(self, nper, pmt, pv, fv, when, guess: float = 0.1, tol: float = 1e-10, max_iter: int = 100):
+        # Vectorized Newton iterations; cells that don't settle are reported as NaN.
+        # growth - 1 comes from expm1/log1p so the annuity term stays accurate near
+        # r = 0, where g and g' take their limits instead of dividing by zero.
+        r = np.full(nper.shape, guess, dtype=float)
+        converged = np.zeros(nper.shape, dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for _ in range(max_iter):
+                zero = r == 0
+                safe_r = np.where(zero, 1, r)
+                growth_minus_one = np.expm1(nper * np.log1p(r))
+                growth = growth_minus_one + 1
+                growth_prev = (1 + r) ** (nper - 1)
+                timing = r * when + 1
+                g = np.where(zero, fv + pv + pmt * nper, fv + growth * pv + pmt * growth_minus_one * timing / safe_r)
+                g_prime = np.where(
+                    zero,
+                    nper * pv + pmt * nper * ((nper - 1) / 2 + when),
+                    nper * growth_prev * pv
+                    - pmt * growth_minus_one * timing / safe_r ** 2
+                    + nper * pmt * growth_prev * timing / safe_r
+                    + pmt * growth_minus_one * when / safe_r
+                )
+                stepped = np.where(converged, r, r - g / g_prime)
+                converged |= np.abs(stepped - r) <= tol * np.maximum(1, np.abs(r))
+                r = stepped
+                if converged.all() or not np.isfinite(r[~converged]).any():
+                    break
+        r = np.where(np.abs(r) <= tol, 0.0, r)
+        return np.where(converged & (r > -1), r, np.nan)
+
+    def solve(
+        self,
+        solve_for: str,
+        rate: Any = None,
+        nper: Any = None,
+        pmt: Any = None,
+        pv: Any = None,
+        fv: Any = None,
+        when: Any = 0,
+        guess: float = 10
+    ) -> np.ndarray:
+        if solve_for not in self.VARIABLES:
+            raise ValueError(f"solve_for must be one of {', '.join(self.VARIABLES)}.")
+        given = {"rate": rate, "nper": nper, "pmt": pmt, "pv": pv, "fv": fv}
+        if given[solve_for] is not None:
+            raise ValueError(f"{solve_for} is being solved for and must not be provided.")
+        for name in ("rate", "nper"):
+            if name != solve_for and given[name] is None:
+                raise ValueError(f"{name} is required unless it is being solved for.")
+
+        # Optional Excel arguments default to zero, like pmt in FV() or fv in PMT().
+        arguments = {name: 0 if value is None else value for name, value in given.items() if name != solve_for}
+        arrays = self.broadcast(when=when, **arguments)
+        if not np.isin(arrays["when"], (0, 1)).all():
+            raise ValueError("when must be 0 (end of period) or 1 (beginning of period).")
+        if "rate" in arrays:
+            if (arrays["rate"] <= -100).any():
+                raise ValueError("Rate must be greater than -100%.")
+            arrays["r"] = arrays.pop("rate") / 100
+
+        if solve_for == "pv":
+            return self.present_value(arrays["r"], arrays["nper"], arrays["pmt"], arrays["fv"], arrays["when"])
+        if solve_for == "fv":
+            return self.future_value(arrays["r"], arrays["nper"], arrays["pmt"], arrays["pv"], arrays["when"])
+        if solve_for == "pmt":
+            return self.payment(arrays["r"], arrays["nper"], arrays["pv"], arrays["fv"], arrays["when"])
+        if solve_for == "nper":
+            return self.number_of_periods(arrays["r"], arrays["pmt"], arrays["pv"], arrays["fv"], arrays["when"])
+        return self.rate(arrays["nper"], arrays["pmt"], arrays["pv"], arrays["fv"], arrays["when"], guess / 100) * 100
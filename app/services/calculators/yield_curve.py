@@ -0,0 +1,142 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Sequence, Tuple
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+INTERPOLATIONS = ("linear", "log_linear", "cubic")
+MAX_PERIODS = 1_000_000
+
+class YieldCurveServices:
+    # Zero-rate curves given as tenor points (years) and annually compounded rates
+    # in %, matching PresentValueServices. Between points the curve follows the
+    # chosen interpolation; beyond the last point the zero rate stays flat.
+    #
+    # Per-period discount factors are built once per curve version and kept in an
+    # LRU, so pricing against a stored curve is a lookup or a dot product. A
+    # version never changes, so its id is a safe cache key. The LRU is bounded by
+    # entries and by the total number of cached factors, since one vector can hold
+    # up to MAX_PERIODS of them.
+    def __init__(self, max_curves: int = 256, max_elements: int = 16_000_000):
+        self.max_curves = max_curves
+        self.max_elements = max_elements
+        self._factors: "OrderedDict[Tuple[Hashable, int], np.ndarray]" = OrderedDict()
+        self._elements = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, tenors: Sequence[float], rates: Sequence[float], interpolation: str) -> Tuple[np.ndarray, np.ndarray]:
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Invalid interpolation. Choose one of {', '.join(repr(name) for name in INTERPOLATIONS)}.")
+        tenors = np.asarray(tenors, dtype=float)
+        rates = np.asarray(rates, dtype=float)
+        if tenors.size == 0 or tenors.shape != rates.shape:
+            raise ValueError("A curve needs at least one point and one rate per tenor.")
+        if not (np.isfinite(tenors).all() and np.isfinite(rates).all()):
+            raise ValueError("Tenors and rates must be finite numbers.")
+        if tenors[0] <= 0 or (np.diff(tenors) <= 0).any():
+            raise ValueError("Tenors must be positive and strictly increasing.")
+        if (rates <= -100).any():
+            raise ValueError("Rate must be greater than -100%.")
+        return tenors, rates
+
+    def zero_rates(self, tenors: Sequence[float], rates: Sequence[float], interpolation: str, times: np.ndarray) -> np.ndarray:
+        tenors, rates = self.validate(tenors, rates, interpolation)
+        times = np.asarray(times, dtype=float)
+        if tenors.size == 1:
+            return np.full(times.shape, rates[0])
+        if interpolation == "linear":
+            return np.interp(times, tenors, rates)
+        if interpolation == "cubic":
+            return CubicSpline(tenors, rates, bc_type="natural")(np.clip(times, tenors[0], tenors[-1]))
+        # log_linear: ln(discount factor) is linear between points, i.e. forward
+        # rates are piecewise flat. Before the first tenor this is the first rate.
+        log_factors = -tenors * np.log1p(rates / 100)
+        inside = np.clip(times, tenors[0], tenors[-1])
+        log_inside = np.interp(inside, tenors, log_factors)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(times > tenors[0], np.expm1(-log_inside / inside) * 100, rates[0])
+
+    def discount_factors(self, tenors: Sequence[float], rates: Sequence[float], interpolation: str, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times, dtype=float)
+        return (1 + self.zero_rates(tenors, rates, interpolation, times) / 100) ** -times
+
+    def period_factors(
+        self,
+        key: Hashable,
+        tenors: Sequence[float],
+        rates: Sequence[float],
+        interpolation: str,
+        periods: int,
+        periods_per_year: int = 1
+    ) -> np.ndarray:
+        # Discount factors for periods 0..periods - 1 of length 1 / periods_per_year
+        # years. The cached vector covers at least the curve's last tenor and grows
+        # by doubling when a longer horizon is asked for.
+        if periods > MAX_PERIODS:
+            raise ValueError(f"The horizon cannot exceed {MAX_PERIODS:,} periods.")
+        cache_key = (key, periods_per_year)
+        with self._lock:
+            factors = self._factors.get(cache_key)
+            if factors is not None and factors.size >= periods:
+                self._factors.move_to_end(cache_key)
+                self.hits += 1
+                return factors[:periods]
+            self.misses += 1
+
+        size = max(periods, int(np.ceil(max(tenors) * periods_per_year)) + 1, 2 * (factors.size if factors is not None else 0))
+        size = max(periods, min(size, MAX_PERIODS))
+        factors = self.discount_factors(tenors, rates, interpolation, np.arange(size) / periods_per_year)
+        factors.setflags(write=False)
+        with self._lock:
+            current = self._factors.get(cache_key)
+            if current is None or current.size < factors.size:
+                self._factors[cache_key] = factors
+                self._elements += factors.size - (current.size if current is not None else 0)
+            self._factors.move_to_end(cache_key)
+            while len(self._factors) > 1 and (len(self._factors) > self.max_curves or self._elements > self.max_elements):
+                self._elements -= self._factors.popitem(last=False)[1].size
+        return factors[:periods]
+
+    def net_present_value(
+        self,
+        key: Hashable,
+        tenors: Sequence[float],
+        rates: Sequence[float],
+        interpolation: str,
+        matrix: np.ndarray,
+        start_period: int = 1,
+        periods_per_year: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        factors = self.period_factors(key, tenors, rates, interpolation, start_period + matrix.shape[1], periods_per_year)[start_period:]
+        return matrix @ factors, factors
+
+    def present_value(
+        self,
+        key: Hashable,
+        tenors: Sequence[float],
+        rates: Sequence[float],
+        interpolation: str,
+        future_value: List[float],
+        period: List[int],
+        periods_per_year: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        future_value = np.asarray(future_value, dtype=float)
+        period = np.asarray(period, dtype=np.int64)
+        if future_value.shape != period.shape:
+            raise ValueError("future_value and period must have the same length.")
+        if period.size and period.min() < 0:
+            raise ValueError("Period cannot be negative.")
+        factors = self.period_factors(key, tenors, rates, interpolation, int(period.max(initial=0)) + 1, periods_per_year)
+        factors = factors[period]
+        return future_value * factors, factors
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"curves": len(self._factors), "elements": self._elements, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._factors.clear()
+            self._elements = 0
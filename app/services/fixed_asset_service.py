@@ -0,0 +1,215 @@
+import uuid
+import calendar
+import numpy as np
+from uuid import UUID
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+from fastapi import HTTPException, status
+from app.repositories.company_repo import CompanyRepository
+from app.repositories.fixed_asset_repo import FixedAssetRepository
+from app.schema.fixed_asset_schema import FixedAssetInput, FixedAssetListResponse, FixedAssetResponse, PeriodDepreciationResponse, SyncFixedAssetsResponse
+from app.services.base_service import BaseService
+from app.services.calculators.calculation_graph import CalculationGraph
+from app.services.calculators.depreciation_calculator import PenyusutanCalculatorServices
+
+CALCULATION_FIELDS = (
+    "harga_perolehan",
+    "estimasi_umur",
+    "estimasi_nilai_sisa",
+    "metode",
+    "tanggal_perolehan",
+    "unit_per_tahun",
+    "estimasi_total_unit",
+)
+# Stored as NUMERIC(20, 2); rounded the same way before hashing and scheduling.
+MONEY_FIELDS = ("harga_perolehan", "estimasi_nilai_sisa")
+
+class FixedAssetService(BaseService):
+    SCHEDULE_CHUNK = 2000
+
+    def __init__(self, fixed_asset_repository: FixedAssetRepository, company_repository: CompanyRepository):
+        self.fixed_asset_repository = fixed_asset_repository
+        self.company_repository = company_repository
+        self.depreciation = PenyusutanCalculatorServices()
+        super().__init__(fixed_asset_repository)
+
+    def _persisted(self, asset: Dict[str, Any]) -> Dict[str, Any]:
+        return {**asset, **{field: round(asset[field], 2) for field in MONEY_FIELDS}}
+
+    def _input_hash(self, asset: Dict[str, Any]) -> str:
+        return CalculationGraph.input_hash("depreciation", {field: asset[field] for field in CALCULATION_FIELDS})
+
+    def _columns(self, assets: List[Dict[str, Any]]) -> Dict[str, list]:
+        return {field: [asset[field] for asset in assets] for field in CALCULATION_FIELDS}
+
+    def _validate(self, assets: List[Dict[str, Any]]) -> None:
+        if not assets:
+            return
+        columns = self._columns(assets)
+        unit_per_tahun = columns["unit_per_tahun"] if any(row is not None for row in columns["unit_per_tahun"]) else None
+        arrays = self.depreciation.as_batch_arrays(
+            columns["harga_perolehan"],
+            columns["estimasi_umur"],
+            columns["estimasi_nilai_sisa"],
+            columns["metode"],
+            unit_per_tahun,
+            columns["estimasi_total_unit"]
+        )
+        for asset, error in zip(assets, self.depreciation.validate_inputs_batch(*arrays)):
+            if error:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Asset '{asset['code']}': {error}")
+
+    def _schedule(self, assets: List[Dict[str, Any]], counter: List[int]) -> Iterator[List[Dict[str, Any]]]:
+        # Built lazily, a chunk of assets at a time, so a full register never holds
+        # every schedule row in memory at once.
+        for start in range(0, len(assets), self.SCHEDULE_CHUNK):
+            chunk = assets[start:start + self.SCHEDULE_CHUNK]
+            columns = self._columns(chunk)
+            unit_per_tahun = columns["unit_per_tahun"] if any(row is not None for row in columns["unit_per_tahun"]) else None
+            index, period, depreciation, accumulated, book_value = self.depreciation.schedule_entries(
+                columns["harga_perolehan"],
+                columns["estimasi_umur"],
+                columns["estimasi_nilai_sisa"],
+                columns["metode"],
+                columns["tanggal_perolehan"],
+                unit_per_tahun=unit_per_tahun,
+                estimasi_total_unit=columns["estimasi_total_unit"]
+            )
+            # Rounded to the sen like the NUMERIC(20, 2) columns: each month's charge is
+            # the step between rounded running totals, so charges add up to the stored
+            # accumulated depreciation and book value is cost less that total.
+            accumulated = np.round(accumulated, 2)
+            first = np.ones(len(index), dtype=bool)
+            first[1:] = index[1:] != index[:-1]
+            depreciation = np.round(np.where(first, accumulated, accumulated - np.roll(accumulated, 1)), 2)
+            book_value = np.round(np.asarray(columns["harga_perolehan"], dtype=float)[index] - accumulated, 2)
+            counter[0] += len(index)
+            yield [
+                {
+                    "id": uuid.uuid4(),
+                    "asset_id": chunk[i]["id"],
+                    "company_id": chunk[i]["company_id"],
+                    "period": p,
+                    "depreciation": d,
+                    "accumulated_depreciation": a,
+                    "book_value": b,
+                }
+                for i, p, d, a, b in zip(index.tolist(), period.tolist(), depreciation.tolist(), accumulated.tolist(), book_value.tolist())
+            ]
+
+    def _save(
+        self,
+        created: List[Dict[str, Any]],
+        updated: List[Dict[str, Any]],
+        replaced: List[UUID],
+        recompute: List[Dict[str, Any]]
+    ) -> int:
+        self._validate(recompute)
+        counter = [0]
+        try:
+            self.fixed_asset_repository.save_assets(created, updated, replaced, self._schedule(recompute, counter))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return counter[0]
+
+    def _get_asset(self, asset_id: UUID):
+        asset = self.fixed_asset_repository.get_asset(asset_id)
+        if asset is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fixed asset not found")
+        return asset
+
+    def _check_company(self, company_id: UUID) -> None:
+        if self.company_repository.get_company_by_options("id", company_id).result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+
+    def sync_assets(self, company_id: UUID, assets: List[FixedAssetInput]) -> SyncFixedAssetsResponse:
+        self._check_company(company_id)
+        codes = [asset.code for asset in assets]
+        if len(set(codes)) != len(codes):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Asset codes must be unique.")
+
+        existing = {asset.code: asset for asset in self.fixed_asset_repository.list_assets(company_id)}
+        created, updated, replaced, recompute = [], [], [], []
+        unchanged = 0
+        for asset in assets:
+            data = self._persisted(asset.model_dump())
+            digest = self._input_hash(data)
+            current = existing.get(asset.code)
+            if current is None:
+                row = {**data, "id": uuid.uuid4(), "company_id": company_id, "input_hash": digest}
+                created.append(row)
+                recompute.append(row)
+            elif current.input_hash != digest:
+                row = {**data, "id": current.id, "company_id": company_id, "input_hash": digest}
+                updated.append({key: value for key, value in row.items() if key != "company_id"})
+                replaced.append(current.id)
+                recompute.append(row)
+            else:
+                if current.name != asset.name:
+                    updated.append({"id": current.id, "name": asset.name})
+                unchanged += 1
+
+        schedule_rows = self._save(created, updated, replaced, recompute)
+        return SyncFixedAssetsResponse(
+            message="Fixed assets successfully synced",
+            meta={
+                "created": len(created),
+                "recomputed": len(replaced),
+                "unchanged": unchanged,
+                "schedule_rows": schedule_rows,
+            },
+        )
+
+    def list_assets(self, company_id: UUID) -> FixedAssetListResponse:
+        self._check_company(company_id)
+        return FixedAssetListResponse(
+            message="Fixed assets retrieved successfully",
+            result=self.fixed_asset_repository.list_assets(company_id),
+        )
+
+    def get_asset(self, asset_id: UUID) -> FixedAssetResponse:
+        return FixedAssetResponse(
+            message="Fixed asset retrieved successfully",
+            result=self._get_asset(asset_id),
+            meta=None,
+        )
+
+    def update_asset(self, asset_id: UUID, changes: Dict[str, Any]) -> FixedAssetResponse:
+        asset = self._get_asset(asset_id)
+        current = asset.model_dump()
+        data = self._persisted({**current, **{key: value for key, value in changes.items() if value is not None}})
+        row = {"id": asset_id, "name": data["name"]}
+        recompute = []
+        # Only inputs the caller actually changed count; the stored hash is not
+        # re-derived from values read back from the database.
+        if any(field in changes and data[field] != current[field] for field in CALCULATION_FIELDS):
+            row.update({field: data[field] for field in CALCULATION_FIELDS}, input_hash=self._input_hash(data))
+            recompute.append({**data, "id": asset_id, "company_id": asset.company_id})
+
+        schedule_rows = self._save([], [row], [asset_id] if recompute else [], recompute)
+        return FixedAssetResponse(
+            message="Fixed asset successfully updated",
+            result=self._get_asset(asset_id),
+            meta={"created": 0, "recomputed": len(recompute), "unchanged": 1 - len(recompute), "schedule_rows": schedule_rows},
+        )
+
+    def delete_asset(self, asset_id: UUID) -> FixedAssetResponse:
+        if not self.fixed_asset_repository.delete_asset(asset_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fixed asset not found")
+        return FixedAssetResponse(
+            message="Fixed asset deleted successfully",
+            result=None,
+            meta=None,
+        )
+
+    def period_depreciation(self, company_id: UUID, period_start: date, period_end: Optional[date] = None) -> PeriodDepreciationResponse:
+        # Schedule rows are stamped with the month end, so whole months are matched.
+        period_end = period_start if period_end is None else period_end
+        if period_end < period_start:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="period_end cannot be before period_start.")
+        lower = period_start.replace(day=1)
+        upper = period_end.replace(day=calendar.monthrange(period_end.year, period_end.month)[1])
+        return PeriodDepreciationResponse(
+            message="Period depreciation retrieved successfully",
+            result=self.fixed_asset_repository.get_period_depreciation(company_id, lower, upper),
+        )
@@ -0,0 +1,106 @@
+from typing import List, Optional
+from fastapi import HTTPException, status
+from app.repositories.yield_curve_repo import YieldCurveRepository
+from app.schema.yield_curve_schema import CurvePresentValueResponse, YieldCurve, YieldCurveListResponse, YieldCurveResponse
+from app.services.base_service import BaseService
+from app.services.calculators.present_value_calculator import PresentValueServices
+from app.services.calculators.yield_curve import YieldCurveServices
+
+class YieldCurveService(BaseService):
+    def __init__(self, yield_curve_repository: YieldCurveRepository, yield_curves: YieldCurveServices):
+        self.yield_curve_repository = yield_curve_repository
+        self.yield_curves = yield_curves
+        super().__init__(yield_curve_repository)
+
+    def _get_curve(self, name: str, version: Optional[int] = None) -> YieldCurve:
+        curve = self.yield_curve_repository.get_curve(name, version)
+        if curve is None:
+            detail = f"Yield curve '{name}' not found" if version is None else f"Version {version} of yield curve '{name}' not found"
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+        return curve
+
+    def create_curve(
+        self,
+        name: str,
+        tenors: List[float],
+        rates: List[float],
+        interpolation: str,
+        description: Optional[str] = None
+    ) -> YieldCurveResponse:
+        try:
+            self.yield_curves.validate(tenors, rates, interpolation)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        curve = self.yield_curve_repository.create_curve(name, interpolation, tenors, rates, description)
+        if curve is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Another version of yield curve '{name}' was uploaded at the same time. Please retry."
+            )
+        return YieldCurveResponse(
+            message="Yield curve successfully uploaded",
+            result=curve,
+            meta=None,
+        )
+
+    def get_curve(self, name: str, version: Optional[int] = None) -> YieldCurveResponse:
+        return YieldCurveResponse(
+            message="Yield curve retrieved successfully",
+            result=self._get_curve(name, version),
+            meta=None,
+        )
+
+    def list_curves(self) -> YieldCurveListResponse:
+        return YieldCurveListResponse(
+            message="Yield curves retrieved successfully",
+            result=self.yield_curve_repository.list_curves(),
+            meta=None,
+        )
+
+    def list_versions(self, name: str) -> YieldCurveListResponse:
+        versions = self.yield_curve_repository.list_versions(name)
+        if not versions:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Yield curve '{name}' not found")
+        return YieldCurveListResponse(
+            message="Yield curve versions retrieved successfully",
+            result=versions,
+            meta=None,
+        )
+
+    def present_value(
+        self,
+        name: str,
+        version: Optional[int] = None,
+        cash_flows: Optional[List[List[float]]] = None,
+        start_period: int = 1,
+        future_value: Optional[List[float]] = None,
+        period: Optional[List[int]] = None,
+        periods_per_year: int = 1
+    ) -> CurvePresentValueResponse:
+        if (cash_flows is None) == (future_value is None and period is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide either cash_flows or future_value with period."
+            )
+        curve = self._get_curve(name, version)
+        args = (curve.id, curve.tenors, curve.rates, curve.interpolation)
+
+        try:
+            if cash_flows is not None:
+                matrix = PresentValueServices().cash_flow_matrix(cash_flows)
+                npv, factors = self.yield_curves.net_present_value(*args, matrix, start_period, periods_per_year)
+                result = {"npv": npv.tolist(), "discount_factors": factors.tolist()}
+            else:
+                if future_value is None or period is None:
+                    raise ValueError("future_value and period must be provided together.")
+                present_value, factors = self.yield_curves.present_value(*args, future_value, period, periods_per_year)
+                result = {"present_value": present_value.tolist(), "discount_factors": factors.tolist()}
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return CurvePresentValueResponse(
+            message="Present value calculated successfully",
+            result=result,
+            meta={"name": curve.name, "version": curve.version, "interpolation": curve.interpolation},
+        )
@@ -0,0 +1,194 @@
+"""Offline micro-benchmarks for the calculator services.
+
+    python -m app.utils.benchmark --save                 # record a baseline
+    python -m app.utils.benchmark                        # compare against it
+    python -m app.utils.benchmark --only present_value --sizes 10,1000 --threshold 0.5
+
+Each benchmark is timed over a sweep of input sizes (rows). Inputs are built once
+per size, outside the timed region, from a fixed seed. Exits with status 1 when a
+benchmark's median latency regresses by more than the threshold against the
+baseline. Baselines are machine specific; record one on the box that compares.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from app.services.calculators.depreciation_calculator import PenyusutanCalculatorServices
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+from app.services.calculators.present_value_calculator import PresentValueServices
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_BASELINE = os.path.join("benchmarks", "calculators.json")
+DEFAULT_THRESHOLD = 0.25
+
+depreciation = PenyusutanCalculatorServices()
+present_value = PresentValueServices()
+goal_seeking = GoalSeekingWeightedAverage()
+
+def depreciation_case(metode: str) -> Callable[[int, np.random.Generator], Callable[[], Any]]:
+    def setup(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+        harga_perolehan = rng.uniform(1_000, 1_000_000, size).round(2).tolist()
+        estimasi_umur = rng.integers(1, 20, size).astype(float).tolist()
+        estimasi_nilai_sisa = [0.0] * size
+        methods = [metode] * size
+        return lambda: depreciation.calculate_batch(harga_perolehan, estimasi_umur, estimasi_nilai_sisa, methods)
+    return setup
+
+def present_value_case(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+    future_value = rng.uniform(1_000, 1_000_000, size)
+    rate = rng.uniform(0, 20, size)
+    period = rng.integers(0, 30, size)
+    return lambda: present_value.present_value(future_value, rate, period)
+
+def weight_array(size: int, rng: np.random.Generator) -> np.ndarray:
+    # Increasing weights keep every row's loss rate under the 100 cap for goal seeks.
+    return np.sort(rng.uniform(1, 100, size))
+
+def weighted_average_case(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+    values = rng.uniform(0, 100, size)
+    weights = weight_array(size, rng)
+    return lambda: goal_seeking.weighted_average(values, weights)
+
+def weight_difference_case(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+    weights = weight_array(size, rng)
+    return lambda: goal_seeking.weight_difference(weights)
+
+def calculate_loss_rates_case(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+    weight_diffs = goal_seeking.weight_difference(weight_array(size, rng))
+    return lambda: goal_seeking.calculate_loss_rates(5.0, weight_diffs)
+
+def goal_seek_case(size: int, rng: np.random.Generator) -> Callable[[], Any]:
+    weights = weight_array(size, rng)
+    # Aim for the weighted average reached halfway to the point where the second to
+    # last row would hit the cap, so every size has a solution.
+    initial_loss_rate = 50 * weights[0] / weights[max(size - 2, 0)]
+    loss_rates = goal_seeking.calculate_loss_rates(initial_loss_rate, goal_seeking.weight_difference(weights))
+    goal = goal_seeking.weighted_average(loss_rates, weights)
+    weights = weights.tolist()
+    return lambda: goal_seeking.goal_seek_weighted_average(weights, goal)
+
+BENCHMARKS: Dict[str, Callable[[int, np.random.Generator], Callable[[], Any]]] = {
+    "straight_line": depreciation_case("straight_line"),
+    "double_declining": depreciation_case("double_declining"),
+    "present_value": present_value_case,
+    "weighted_average": weighted_average_case,
+    "weight_difference": weight_difference_case,
+    "calculate_loss_rates": calculate_loss_rates_case,
+    "goal_seek": goal_seek_case,
+}
+
+def measure(func: Callable[[], Any], min_time: float, min_repeats: int, max_repeats: int) -> List[float]:
+    func()
+    timings: List[float] = []
+    start = time.perf_counter()
+    while len(timings) < max_repeats and (len(timings) < min_repeats or time.perf_counter() - start < min_time):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+def run(
+    names: List[str],
+    sizes: List[int],
+    min_time: float = 0.5,
+    min_repeats: int = 5,
+    max_repeats: int = 1_000,
+    seed: int = 0
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            func = BENCHMARKS[name](size, np.random.default_rng(seed))
+            timings = np.asarray(measure(func, min_time, min_repeats, max_repeats))
+            p50, p99 = np.percentile(timings, [50, 99])
+            results[name][str(size)] = {
+                "p50_ms": float(p50 * 1e3),
+                "p99_ms": float(p99 * 1e3),
+                "rows_per_second": float(size / p50),
+                "repeats": int(timings.size),
+            }
+            print(
+                f"{name:<22}{size:>10,}  p50 {p50 * 1e3:>10.3f} ms  p99 {p99 * 1e3:>10.3f} ms  "
+                f"{size / p50:>14,.0f} rows/s  ({timings.size} runs)",
+                flush=True
+            )
+    return results
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float,
+    metric: str = "p50_ms"
+) -> List[Tuple[str, str, float, float]]:
+    regressions = []
+    for name, by_size in results.items():
+        for size, current in by_size.items():
+            previous = baseline.get(name, {}).get(size)
+            if previous and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append((name, size, previous[metric], current[metric]))
+    return regressions
+
+def environment() -> Dict[str, Any]:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the calculator services over a sweep of input sizes.")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help="Comma-separated benchmarks to run")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated row counts")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against or save to")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD)),
+                        help="Allowed slowdown as a fraction of the baseline (0.25 = 25%%)")
+    parser.add_argument("--metric", choices=("p50_ms", "p99_ms"), default="p50_ms", help="Latency compared against the baseline")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds spent timing each case")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}. Choose from {', '.join(BENCHMARKS)}")
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    if not sizes or min(sizes) < 1:
+        parser.error("sizes must be positive integers")
+    if args.threshold < 0:
+        parser.error("threshold cannot be negative")
+
+    results = run(names, sizes, min_time=args.min_time, seed=args.seed)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to record one.")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+
+    regressions = compare(results, baseline, args.threshold, args.metric)
+    for name, size, previous, current in regressions:
+        print(f"REGRESSION {name} @ {size}: {args.metric} {previous:.3f} -> {current:.3f} ({current / previous - 1:+.0%})")
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
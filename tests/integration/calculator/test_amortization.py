@@ -0,0 +1,79 @@
+import json
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, fmt, expected_status, expected_rows",
+    [
+        (
+            {"principal": [1000], "rate": [12], "tenor": [12]},
+            "ndjson",
+            200,
+            12,
+        ),
+        (
+            {"principal": [1200, 1000], "rate": [12, 0], "tenor": [12, 10], "structure": ["flat", "annuity"]},
+            "ndjson",
+            200,
+            22,
+        ),
+        (
+            {"principal": [10000], "rate": [9], "tenor": [36], "structure": ["balloon"], "balloon": [4000]},
+            "csv",
+            200,
+            36,
+        ),
+        (
+            {"principal": [10000], "rate": [9], "tenor": [36], "structure": ["balloon"], "balloon": [10000]},
+            "ndjson",
+            400,
+            None,
+        ),
+        (
+            {"principal": [1000], "rate": [12], "tenor": [10**9]},
+            "ndjson",
+            400,
+            None,
+        ),
+        (
+            {"principal": [1000], "rate": [12], "tenor": [12], "structure": ["bullet"]},
+            "ndjson",
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_amortization_usecases(
+    client,
+    payload,
+    fmt,
+    expected_status,
+    expected_rows,
+):
+    response = client.post("/api/v1/calculations/amortization", params={"format": fmt}, json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    if expected_status != 200:
+        assert "detail" in response.json(), "Expected an error detail in the response."
+        return
+
+    lines = response.text.splitlines()
+    if fmt == "csv":
+        assert lines[0] == "index,period,payment,interest,principal,balance"
+        rows = [{k: float(v) for k, v in zip(lines[0].split(","), line.split(","))} for line in lines[1:]]
+    else:
+        rows = [json.loads(line) for line in lines]
+
+    assert len(rows) == expected_rows
+    for index, principal in enumerate(payload["principal"]):
+        loan = [row for row in rows if row["index"] == index]
+        assert sum(row["principal"] for row in loan) == pytest.approx(principal)
+        assert loan[-1]["balance"] == pytest.approx(0)
+        for row in loan:
+            assert row["payment"] == pytest.approx(row["interest"] + row["principal"])
+
+    if payload.get("structure", ["annuity"]) == ["annuity"]:
+        assert rows[0]["payment"] == pytest.approx(88.8487886783417)
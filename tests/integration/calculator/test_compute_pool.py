@@ -0,0 +1,49 @@
+import pytest
+from app.core.compute_pool import ComputePool
+from app.core.dependencies import get_compute_pool
+
+@pytest.fixture
+def offload_everything(client):
+    pool = ComputePool(max_workers=1, max_pending=1, threshold=0, retry_after=7)
+    client.app.dependency_overrides[get_compute_pool] = lambda: pool
+    yield pool
+    client.app.dependency_overrides.pop(get_compute_pool, None)
+    pool.shutdown()
+
+@pytest.mark.parametrize(
+    "path, payload",
+    [
+        (
+            "/api/v1/calculations/depreciation/batch",
+            {"harga_perolehan": [1200, 1000], "estimasi_umur": [2, 4], "metode": ["straight_line", "double_declining"]},
+        ),
+        (
+            "/api/v1/calculations/present-value/npv",
+            {"cash_flows": [[110], [0, 121]], "rate": 10},
+        ),
+        (
+            "/api/v1/goal-seeking/weighted-average/batch",
+            {"weight_matrix": [[10, 20, 30, 40], [25, 25, 50]], "goals": [50]},
+        ),
+    ]
+)
+
+def test_compute_pool_offload_usecases(
+    client,
+    offload_everything,
+    path,
+    payload,
+):
+    offloaded = client.post(path, json=payload)
+    assert offloaded.status_code == 200
+
+    # Hold the only slot so the next large request is turned away.
+    with offload_everything.slot():
+        rejected = client.post(path, json=payload)
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == "7"
+
+    client.app.dependency_overrides.pop(get_compute_pool)
+    inline = client.post(path, json=payload)
+    assert inline.status_code == 200
+    assert offloaded.json() == inline.json()
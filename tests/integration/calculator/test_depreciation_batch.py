@@ -0,0 +1,93 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected_offsets, expected_errors",
+    [
+        (
+            {
+                "harga_perolehan": [1200, 1000],
+                "estimasi_umur": [4, 5],
+                "estimasi_nilai_sisa": [200, 0],
+                "metode": ["straight_line", "double_declining"],
+            },
+            200,
+            [0, 4, 9],
+            [],
+        ),
+        (
+            {
+                "harga_perolehan": [1200, -1, 1000],
+                "estimasi_umur": [4, 5, 5],
+                "metode": ["double_declining"],
+            },
+            200,
+            [0, 4, 4, 9],
+            [{"index": 1, "detail": "Harga Perolehan must be a positive number."}],
+        ),
+        (
+            {
+                "harga_perolehan": [1200],
+                "estimasi_umur": [4],
+                "metode": ["sum_of_years"],
+            },
+            200,
+            [0, 0],
+            [{
+                "index": 0,
+                "detail": (
+                    "Invalid depreciation method. Choose one of 'straight_line', 'double_declining', "
+                    "'sum_of_years_digits', 'declining_balance_150', 'declining_balance_200', 'units_of_production'."
+                ),
+            }],
+        ),
+        (
+            {
+                "harga_perolehan": [1200, 1000],
+                "estimasi_umur": [4],
+                "metode": ["straight_line"],
+            },
+            400,
+            None,
+            None,
+        ),
+    ]
+)
+
+def test_depreciation_batch_usecases(
+    client,
+    payload,
+    expected_status,
+    expected_offsets,
+    expected_errors,
+):
+    response = client.post("/api/v1/calculations/depreciation/batch", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["offsets"] == expected_offsets
+    assert data["errors"] == expected_errors
+
+    failed = {error["index"] for error in expected_errors}
+    for i, metode in enumerate(data["metode"]):
+        if i in failed:
+            continue
+
+        params = {
+            "harga_perolehan": payload["harga_perolehan"][i],
+            "estimasi_umur": payload["estimasi_umur"][i],
+            "estimasi_nilai_sisa": payload.get("estimasi_nilai_sisa", [0] * len(data["metode"]))[i],
+            "metode": metode,
+        }
+        single = client.post("/api/v1/calculations/depreciation", params=params).json()
+        schedule = data["biaya_per_tahun"][data["offsets"][i]:data["offsets"][i + 1]]
+        if metode == "straight_line":
+            assert schedule == pytest.approx([single["biaya_per_tahun"]] * len(schedule))
+        else:
+            assert schedule == pytest.approx(single["biaya_per_tahun"])
@@ -0,0 +1,75 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "params, expected_status, expected_biaya_per_tahun, expected_nilai_buku",
+    [
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 5, "metode": "double_declining", "year": 3},
+            200,
+            [144],
+            [216],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 5, "metode": "double_declining", "year": 4, "year_to": 6},
+            200,
+            [86.4, 51.84, 0],
+            [129.6, 77.76, 77.76],
+        ),
+        (
+            {"harga_perolehan": 1200, "estimasi_umur": 4, "estimasi_nilai_sisa": 200, "metode": "straight_line", "year": 2, "year_to": 3},
+            200,
+            [250, 250],
+            [700, 450],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 5, "metode": "declining_balance_200", "year": 4},
+            200,
+            [108],
+            [108],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 5, "metode": "double_declining", "year": 4, "year_to": 2},
+            400,
+            None,
+            None,
+        ),
+    ]
+)
+
+def test_depreciation_by_year_usecases(
+    client,
+    params,
+    expected_status,
+    expected_biaya_per_tahun,
+    expected_nilai_buku,
+):
+    response = client.post("/api/v1/calculations/depreciation", params=params)
+
+    assert response.status_code == expected_status, (
+        f"For params {params}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["tahun"] == list(range(params["year"], params.get("year_to", params["year"]) + 1))
+    assert data["biaya_per_tahun"] == pytest.approx(expected_biaya_per_tahun)
+    assert data["nilai_buku"] == pytest.approx(expected_nilai_buku)
+
+def test_depreciation_batch_by_year(client):
+    payload = {
+        "harga_perolehan": [1000, -1, 1200],
+        "estimasi_umur": [5, 5, 4],
+        "estimasi_nilai_sisa": [0, 0, 200],
+        "metode": ["double_declining", "double_declining", "straight_line"],
+    }
+    response = client.post("/api/v1/calculations/depreciation/batch/years", params={"year": 3}, json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tahun"] == [3]
+    assert data["biaya_per_tahun"][0] == pytest.approx([144, None, 250])
+    assert data["nilai_buku"][0] == pytest.approx([216, None, 450])
+    assert data["errors"] == [{"index": 1, "detail": "Harga Perolehan must be a positive number."}]
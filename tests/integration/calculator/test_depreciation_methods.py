@@ -0,0 +1,73 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "params, expected_status, expected_biaya_per_tahun",
+    [
+        (
+            {"harga_perolehan": 1200, "estimasi_umur": 4, "estimasi_nilai_sisa": 200, "metode": "straight_line"},
+            200,
+            250,
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 150, "metode": "straight_line"},
+            200,
+            1000 / 150,
+        ),
+        (
+            {"harga_perolehan": 1500, "estimasi_umur": 5, "metode": "sum_of_years_digits"},
+            200,
+            [500, 400, 300, 200, 100],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 5, "metode": "declining_balance_200"},
+            200,
+            [400, 240, 144, 108, 108],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 4, "metode": "declining_balance_150"},
+            200,
+            [375, 234.375, 195.3125, 195.3125],
+        ),
+        (
+            {
+                "harga_perolehan": 1000,
+                "estimasi_umur": 4,
+                "estimasi_nilai_sisa": 200,
+                "metode": "units_of_production",
+                "unit_per_tahun": [10, 30, 40, 20],
+            },
+            200,
+            [80, 240, 320, 160],
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 4, "metode": "units_of_production"},
+            400,
+            None,
+        ),
+        (
+            {"harga_perolehan": 1000, "estimasi_umur": 4, "metode": "annuity"},
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_depreciation_methods_usecases(
+    client,
+    params,
+    expected_status,
+    expected_biaya_per_tahun,
+):
+    response = client.post("/api/v1/calculations/depreciation", params=params)
+
+    assert response.status_code == expected_status, (
+        f"For params {params}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["metode"] == params["metode"]
+    assert data["biaya_per_tahun"] == pytest.approx(expected_biaya_per_tahun)
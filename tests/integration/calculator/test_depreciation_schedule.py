@@ -0,0 +1,85 @@
+import json
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, fmt, expected_status, expected_rows",
+    [
+        (
+            {
+                "harga_perolehan": [1200],
+                "estimasi_umur": [2],
+                "metode": ["straight_line"],
+                "tanggal_perolehan": ["2024-01-01"],
+            },
+            "ndjson",
+            200,
+            24,
+        ),
+        (
+            {
+                "harga_perolehan": [1200],
+                "estimasi_umur": [2],
+                "metode": ["straight_line"],
+                "tanggal_perolehan": ["2024-01-16"],
+            },
+            "ndjson",
+            200,
+            25,
+        ),
+        (
+            {
+                "harga_perolehan": [1200, 1000],
+                "estimasi_umur": [2, 3],
+                "estimasi_nilai_sisa": [0, 100],
+                "metode": ["straight_line", "double_declining"],
+                "tanggal_perolehan": ["2024-01-01", "2024-03-16"],
+                "period_start": "2024-06-01",
+                "period_end": "2024-08-31",
+            },
+            "csv",
+            200,
+            6,
+        ),
+        (
+            {
+                "harga_perolehan": [1200, -1],
+                "estimasi_umur": [2, 3],
+                "metode": ["straight_line"],
+                "tanggal_perolehan": ["2024-01-01", "2024-01-01"],
+            },
+            "ndjson",
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_depreciation_schedule_usecases(
+    client,
+    payload,
+    fmt,
+    expected_status,
+    expected_rows,
+):
+    response = client.post("/api/v1/calculations/depreciation/schedule", params={"format": fmt}, json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    if expected_status != 200:
+        assert "detail" in response.json(), "Expected an error detail in the response."
+        return
+
+    lines = response.text.splitlines()
+    if fmt == "csv":
+        assert lines[0] == "index,period,depreciation,accumulated_depreciation,book_value"
+        rows = [dict(zip(lines[0].split(","), line.split(","))) for line in lines[1:]]
+        assert {row["period"] for row in rows} == {"2024-06", "2024-07", "2024-08"}
+    else:
+        rows = [json.loads(line) for line in lines]
+        total = payload["harga_perolehan"][0] - payload.get("estimasi_nilai_sisa", [0])[0]
+        assert sum(row["depreciation"] for row in rows) == pytest.approx(total)
+        assert rows[-1]["book_value"] == pytest.approx(payload["harga_perolehan"][0] - total)
+
+    assert len(rows) == expected_rows
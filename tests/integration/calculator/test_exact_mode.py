@@ -0,0 +1,86 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "path, params, payload, expected_status, expected",
+    [
+        (
+            "/api/v1/calculations/depreciation",
+            {"harga_perolehan": 1000, "estimasi_umur": 3, "metode": "straight_line", "exact": True},
+            None,
+            200,
+            {"biaya_per_tahun": 333.33, "biaya_per_bulan": 27.78, "biaya_bulan_terakhir": 27.75},
+        ),
+        (
+            "/api/v1/calculations/depreciation",
+            {"harga_perolehan": 1e9, "estimasi_umur": 5e6, "metode": "straight_line", "exact": True},
+            None,
+            200,
+            {"biaya_per_tahun": 200, "biaya_per_bulan": 16.67, "biaya_bulan_terakhir": 16.63},
+        ),
+        (
+            "/api/v1/calculations/depreciation/batch",
+            {"exact": True},
+            {"harga_perolehan": [1000, 100], "estimasi_umur": [3, 3], "metode": ["straight_line", "sum_of_years_digits"]},
+            200,
+            {"biaya_per_tahun": [333.33, 333.34, 333.33, 50, 33.33, 16.67], "biaya_per_bulan": [27.78, 27.78, 27.78, 4.17, 2.78, 1.39],
+             "biaya_bulan_terakhir": [27.75, 27.76, 27.75, 4.13, 2.75, 1.38]},
+        ),
+        (
+            "/api/v1/calculations/depreciation/batch",
+            {"exact": True, "scale": 1},
+            {"harga_perolehan": [1000], "estimasi_umur": [3], "metode": ["straight_line"]},
+            200,
+            {"biaya_per_tahun": [333, 334, 333]},
+        ),
+        (
+            "/api/v1/calculations/present-value",
+            {"future_value": 1000, "rate": 10, "period": 3, "exact": True},
+            None,
+            200,
+            {"present_value": 751.31},
+        ),
+        (
+            "/api/v1/calculations/present-value/npv",
+            {"exact": True},
+            {"cash_flows": [[100, 100, 100]], "rate": 10},
+            200,
+            {"npv": [90.91 + 82.64 + 75.13]},
+        ),
+        (
+            "/api/v1/calculations/weighted-average",
+            {"loss_rate_array": [10 / 3, 20 / 3], "weight_array": [1, 2], "n_total": 2, "exact": True},
+            None,
+            200,
+            {"weighted_average": 5.5556, "normal_average": 5},
+        ),
+        (
+            "/api/v1/calculations/depreciation",
+            {"harga_perolehan": 1000, "estimasi_umur": 3, "metode": "straight_line", "exact": True, "year": 2},
+            None,
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_exact_mode_usecases(
+    client,
+    path,
+    params,
+    payload,
+    expected_status,
+    expected,
+):
+    response = client.post(path, params=params, json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For {path} with {params}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    for key, value in expected.items():
+        assert data[key] == pytest.approx(value, abs=1e-9)
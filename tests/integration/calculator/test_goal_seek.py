@@ -0,0 +1,203 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected_value",
+    [
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"future_value": 1000, "period": 5},
+                "variable": "rate",
+                "output": "present_value",
+                "target": 800,
+            },
+            200,
+            (1000 / 800) ** (1 / 5) * 100 - 100,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"rate": 10, "period": 3},
+                "variable": "future_value",
+                "output": "present_value",
+                "target": 1000,
+            },
+            200,
+            1331,
+        ),
+        (
+            {
+                "calculator": "depreciation",
+                "inputs": {"harga_perolehan": 1200, "estimasi_nilai_sisa": 200, "metode": "straight_line"},
+                "variable": "estimasi_umur",
+                "output": "biaya_per_tahun",
+                "target": 125,
+            },
+            200,
+            8,
+        ),
+        (
+            {
+                "calculator": "depreciation",
+                "inputs": {"estimasi_umur": 5, "metode": "double_declining"},
+                "variable": "harga_perolehan",
+                "output": "jadwal_per_tahun:0",
+                "target": 400,
+            },
+            200,
+            1000,
+        ),
+        (
+            {
+                "calculator": "net_present_value",
+                "inputs": {"cash_flows": [-1000, 600, 600]},
+                "variable": "rate",
+                "output": "npv",
+                "target": 0,
+                "guess": 5,
+            },
+            200,
+            None,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"future_value": 1000, "period": 5},
+                "variable": "rate",
+                "output": "present_value",
+                "target": -5,
+            },
+            400,
+            None,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"future_value": 1000},
+                "variable": "rate",
+                "output": "npv",
+                "target": 800,
+            },
+            400,
+            None,
+        ),
+        (
+            {
+                "calculator": "depreciation",
+                "inputs": {"harga_perolehan": 1200, "estimasi_umur": 5, "metode": "double_declining"},
+                "variable": "estimasi_nilai_sisa",
+                "output": "jadwal_per_tahun",
+                "target": 100,
+            },
+            400,
+            None,
+        ),
+        (
+            {
+                "calculator": "goal_seeking",
+                "inputs": {"weight_array": [10, 20, 30, 40]},
+                "variable": "goal",
+                "output": "initial_loss_rate",
+                "target": 30,
+            },
+            200,
+            82,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"future_value": "abc", "period": 5},
+                "variable": "rate",
+                "output": "present_value",
+                "target": 800,
+            },
+            400,
+            None,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "inputs": {"future_value": [1000, 2000], "period": 5},
+                "variable": "rate",
+                "output": "present_value",
+                "target": 800,
+            },
+            400,
+            None,
+        ),
+        (
+            {
+                "calculator": "irr",
+                "inputs": {},
+                "variable": "rate",
+                "output": "irr",
+                "target": 0,
+            },
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_goal_seek_usecases(
+    client,
+    payload,
+    expected_status,
+    expected_value,
+):
+    response = client.post("/api/v1/calculations/goal-seek", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["achieved"] == pytest.approx(payload["target"], abs=1e-6)
+    assert data["bracket"][0] <= data["value"] <= data["bracket"][1]
+    if expected_value is not None:
+        assert data["value"] == pytest.approx(expected_value, rel=1e-8)
+
+@pytest.mark.parametrize(
+    "targets",
+    [
+        [900, 850, 900],
+        [500, 500, 500],
+    ]
+)
+
+def test_goal_seek_reuses_brackets(
+    client,
+    targets,
+):
+    payload = {"calculator": "present_value", "inputs": {"future_value": 1000, "period": 4}, "variable": "rate", "output": "present_value"}
+    evaluations = []
+    for target in targets:
+        response = client.post("/api/v1/calculations/goal-seek", json={**payload, "target": target})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["value"] == pytest.approx((1000 / target) ** (1 / 4) * 100 - 100, rel=1e-8)
+        evaluations.append(data["evaluations"])
+
+    response = client.post("/api/v1/calculations/goal-seek", json={**payload, "target": targets[-1]})
+    data = response.json()
+    assert data["cached_bracket"] is True
+    assert data["evaluations"] <= 5
+    assert data["evaluations"] <= evaluations[0]
+
+def test_goal_seek_keys_tight_brackets_by_fixed_inputs(client):
+    # A tight bracket learned for one input set must not be reused for another;
+    # that seek should cost no more than a cold one.
+    payload = {"calculator": "present_value", "variable": "future_value", "output": "present_value", "target": 800}
+    assert client.post("/api/v1/calculations/goal-seek", json={**payload, "inputs": {"rate": 5, "period": 4}}).status_code == 200
+
+    other = {**payload, "inputs": {"rate": 20, "period": 30}}
+    response = client.post("/api/v1/calculations/goal-seek", json=other)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["value"] == pytest.approx(800 * 1.2 ** 30, rel=1e-8)
+    cold = client.post("/api/v1/calculations/goal-seek", json={**other, "guess": 1}).json()
+    assert data["evaluations"] <= cold["evaluations"]
@@ -0,0 +1,45 @@
+import io
+import pytest
+from openpyxl import load_workbook # type: ignore
+
+@pytest.mark.parametrize(
+    "n_total, goal, weight_array, expected_status",
+    [
+        (4, 50, [10, 20, 30, 40], 200),
+        (1, 12.5, [100], 200),
+        (4, 150, [10, 20, 30, 40], 400),
+        (3, 50, [10, 20, 30, 40], 400),
+    ]
+)
+
+def test_goal_seeking_export_usecases(
+    client,
+    n_total,
+    goal,
+    weight_array,
+    expected_status,
+):
+    params = {"n_total": n_total, "goal": goal, "weight_array": weight_array}
+    response = client.post("/api/v1/goal-seeking/weighted-average/export", params=params)
+
+    assert response.status_code == expected_status, (
+        f"For params {params}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    if expected_status != 200:
+        assert "detail" in response.json(), "Expected an error detail in the response."
+        return
+
+    result = client.post("/api/v1/goal-seeking/weighted-average", params=params).json()
+    rows = list(load_workbook(io.BytesIO(response.content), read_only=True)["Results"].values)
+
+    assert rows[0] == ("Row", "Loss Rate", "Weight")
+    for i, (row, loss_rate, weight) in enumerate(rows[1:n_total + 1]):
+        assert row == i + 1
+        assert loss_rate == pytest.approx(result["loss_rate_array"][i])
+        assert weight == pytest.approx(weight_array[i])
+
+    summary = {row[0]: row[1] for row in rows[n_total + 1:] if row and row[0] is not None}
+    assert summary["Goal"] == pytest.approx(goal)
+    assert summary["Initial Loss Rate"] == pytest.approx(result["initial_loss_rate"])
+    assert summary["Weighted Average"] == pytest.approx(result["weighted_average"])
@@ -0,0 +1,66 @@
+import pytest
+
+@pytest.fixture
+def scenario(client):
+    payload = {"weight_array": [10, 20, 30, 40], "goal": 50}
+    response = client.post("/api/v1/goal-seeking/weighted-average/scenarios", json=payload)
+    assert response.status_code == 201
+    data = response.json()
+    yield data
+    client.delete(f"/api/v1/goal-seeking/weighted-average/scenarios/{data['scenario_id']}")
+
+@pytest.mark.parametrize(
+    "update, weight_array, goal, expected_status",
+    [
+        ({"index": 1, "weight": 25}, [10, 25, 30, 40], 50, 200),
+        ({"index": 0, "weight": 15}, [15, 20, 30, 40], 50, 200),
+        ({"goal": 45}, [10, 20, 30, 40], 45, 200),
+        ({"index": 1, "weight": 25, "goal": 55}, [10, 25, 30, 40], 55, 200),
+        ({"index": 7, "weight": 25}, None, None, 400),
+        ({"index": 1}, None, None, 400),
+        ({"goal": 150}, None, None, 400),
+    ]
+)
+
+def test_update_goal_seeking_scenario_usecases(
+    client,
+    scenario,
+    update,
+    weight_array,
+    goal,
+    expected_status,
+):
+    response = client.patch(f"/api/v1/goal-seeking/weighted-average/scenarios/{scenario['scenario_id']}", json=update)
+
+    assert response.status_code == expected_status, (
+        f"For update {update}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    full = client.post(
+        "/api/v1/goal-seeking/weighted-average",
+        params={"n_total": len(weight_array), "goal": goal, "weight_array": weight_array},
+    ).json()
+    assert data["initial_loss_rate"] == pytest.approx(full["initial_loss_rate"])
+    assert data["loss_rate_array"] == pytest.approx(full["loss_rate_array"])
+    assert data["normal_average"] == pytest.approx(full["normal_average"])
+    assert data["weighted_average"] == pytest.approx(full["weighted_average"])
+
+def test_rejected_update_keeps_goal_seeking_scenario(client, scenario):
+    url = f"/api/v1/goal-seeking/weighted-average/scenarios/{scenario['scenario_id']}"
+    assert client.patch(url, json={"index": 1, "weight": 1000, "goal": 150}).status_code == 400
+
+    response = client.patch(url, json={"goal": 50})
+    assert response.status_code == 200
+    assert response.json()["loss_rate_array"] == pytest.approx(scenario["loss_rate_array"])
+
+def test_unknown_goal_seeking_scenario(client):
+    response = client.patch(
+        "/api/v1/goal-seeking/weighted-average/scenarios/00000000-0000-0000-0000-000000000000",
+        json={"goal": 50},
+    )
+    assert response.status_code == 404
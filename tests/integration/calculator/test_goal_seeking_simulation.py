@@ -0,0 +1,41 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status",
+    [
+        ({"weight_array": [10, 20, 30, 40], "goal": 50, "draws": 2000, "seed": 7}, 200),
+        ({"weight_array": [10, 20, 30, 40], "goal": 50, "draws": 25000, "goal_sd": 1, "seed": 7}, 200),
+        ({"weight_array": [10, 20, 30, 40], "goal": 50, "draws": 500, "weight_sd": 0, "seed": 1}, 200),
+        ({"weight_array": [1] * 2000, "goal": 50, "draws": 1200, "weight_sd": 0, "seed": 3}, 200),
+        ({"weight_array": [10, 20, 30, 40], "goal": 150, "draws": 100}, 400),
+        ({"weight_array": [1] * 10_001, "goal": 50, "draws": 100}, 400),
+        ({"weight_array": [0, 20, 30, 40], "goal": 50, "draws": 100}, 400),
+        ({"weight_array": [10, 20, 30, 40], "goal": 50, "draws": 0}, 422),
+    ]
+)
+
+def test_goal_seeking_simulation_usecases(
+    client,
+    payload,
+    expected_status,
+):
+    response = client.post("/api/v1/goal-seeking/weighted-average/simulations", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["completed_draws"] == payload["draws"]
+    assert not data["timed_out"]
+    assert sum(data["histogram"]["counts"]) == data["completed_draws"] - data["failed_draws"]
+    assert data["percentiles"]["p5"] <= data["percentiles"]["p50"] <= data["percentiles"]["p95"]
+    if payload.get("weight_sd") == 0:
+        assert data["percentiles"]["p50"] == pytest.approx(data["base_initial_loss_rate"])
+
+    # Same seed, same draws.
+    assert client.post("/api/v1/goal-seeking/weighted-average/simulations", json=payload).json() == data
@@ -0,0 +1,91 @@
+import io
+import pytest
+from openpyxl import Workbook, load_workbook # type: ignore
+
+def build_upload(filename, rows):
+    if filename.endswith(".csv"):
+        return "\n".join(",".join("" if cell is None else str(cell) for cell in row) for row in rows).encode()
+    wb = Workbook()
+    for row in rows:
+        wb.active.append(row)
+    output = io.BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+@pytest.mark.parametrize(
+    "filename, rows, expected_status",
+    [
+        (
+            "tables.xlsx",
+            [
+                ["Segment", "Goal", "Weight"],
+                ["Retail", 50, 10], ["Retail", None, 20], ["Retail", None, 30], ["Retail", None, 40],
+                ["SME", 12.5, 100],
+                ["Corporate", 150, 10], ["Corporate", 150, 20],
+            ],
+            200,
+        ),
+        (
+            "tables.csv",
+            [
+                ["Weight", "Segment", "Goal"],
+                [10, "A", 50], [20, "A", None], [30, "A", None], [40, "A", None],
+                [],
+                [25, "B", 30], [25, "B", 30], [50, "B", None],
+            ],
+            200,
+        ),
+        ("tables.csv", [["Segment", "Weight"], ["A", 10]], 400),
+        ("tables.csv", [["Segment", "Goal", "Weight"], ["A", 50, 10], ["B", 50, 10], ["A", None, 10]], 400),
+        ("tables.csv", [["Segment", "Goal", "Weight"], ["A", 50, "ten"]], 400),
+        ("tables.csv", [["Segment", "Goal", "Weight"], ["A", None, 10]], 400),
+        ("tables.txt", [["Segment", "Goal", "Weight"], ["A", 50, 10]], 400),
+    ]
+)
+
+def test_goal_seeking_upload_usecases(
+    client,
+    filename,
+    rows,
+    expected_status,
+):
+    files = {"file": (filename, build_upload(filename, rows))}
+    response = client.post("/api/v1/goal-seeking/weighted-average/upload", files=files)
+
+    assert response.status_code == expected_status, (
+        f"For {filename} rows {rows}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    if expected_status != 200:
+        assert "detail" in response.json(), "Expected an error detail in the response."
+        return
+
+    header = [str(cell).lower() for cell in rows[0]]
+    segment_col, goal_col, weight_col = (header.index(name) for name in ("segment", "goal", "weight"))
+    tables = {}
+    for row in rows[1:]:
+        if not row:
+            continue
+        table = tables.setdefault(row[segment_col], {"goal": None, "weights": []})
+        table["goal"] = table["goal"] if row[goal_col] is None else row[goal_col]
+        table["weights"].append(row[weight_col])
+
+    workbook = load_workbook(io.BytesIO(response.content), read_only=True)
+    # Read-only sheets drop trailing empty cells, so pad rows back to the header width.
+    summary = [row + (None,) * (6 - len(row)) for row in workbook["Summary"].values]
+    details = list(workbook["Loss Rates"].values)
+    assert summary[0] == ("Segment", "Goal", "Initial Loss Rate", "Normal Average", "Weighted Average", "Error")
+    assert [row[0] for row in summary[1:]] == list(tables)
+    assert len(details) == 1 + sum(len(table["weights"]) for table in tables.values())
+
+    for segment, goal, initial_loss_rate, _, weighted_average, error in summary[1:]:
+        params = {"n_total": len(tables[segment]["weights"]), "goal": tables[segment]["goal"], "weight_array": tables[segment]["weights"]}
+        expected = client.post("/api/v1/goal-seeking/weighted-average", params=params)
+        if expected.status_code != 200:
+            assert error and initial_loss_rate is None
+            continue
+        assert error is None
+        assert initial_loss_rate == pytest.approx(expected.json()["initial_loss_rate"])
+        assert weighted_average == pytest.approx(expected.json()["weighted_average"])
+        loss_rates = [row[3] for row in details[1:] if row[0] == segment]
+        assert loss_rates == pytest.approx(expected.json()["loss_rate_array"])
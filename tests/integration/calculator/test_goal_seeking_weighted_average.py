@@ -0,0 +1,36 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "n_total, goal, weight_array, expected_status, expected_initial_loss_rate",
+    [
+        (4, 50, [10, 20, 30, 40], 200, 50 / 7),
+        (3, 60, [50, 30, 20], 200, 40 / 0.68),
+        (1, 12.5, [100], 200, 12.5),
+        (4, 150, [10, 20, 30, 40], 400, None),
+        (3, 50, [10, 20, 30, 40], 400, None),
+        (2, 50, [0, 10], 400, None),
+    ]
+)
+
+def test_goal_seeking_weighted_average_usecases(
+    client,
+    n_total,
+    goal,
+    weight_array,
+    expected_status,
+    expected_initial_loss_rate,
+):
+    params = {"n_total": n_total, "goal": goal, "weight_array": weight_array}
+    response = client.post("/api/v1/goal-seeking/weighted-average", params=params)
+
+    assert response.status_code == expected_status, (
+        f"For params {params}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status == 200:
+        assert data["initial_loss_rate"] == pytest.approx(expected_initial_loss_rate)
+        assert data["weighted_average"] == pytest.approx(goal)
+        assert len(data["loss_rate_array"]) == n_total
+    else:
+        assert "detail" in data, "Expected an error detail in the response."
@@ -0,0 +1,69 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "weight_matrix, goals, expected_status, expected_errors",
+    [
+        (
+            [[10, 20, 30, 40], [50, 30, 20], [100]],
+            [50, 60, 12.5],
+            200,
+            [None, None, None],
+        ),
+        (
+            [[10, 20, 30, 40], [50, 30, 20]],
+            [50],
+            200,
+            [None, None],
+        ),
+        (
+            [[10, 20, 30, 40], [0, 10], [], [10, 20, 30, 40]],
+            [150, 50, 50, 50],
+            200,
+            [
+                "Goal seeking failed: the goal is outside the attainable weighted average range.",
+                "The weight of the first row cannot be zero.",
+                "Weights array cannot be empty.",
+                None,
+            ],
+        ),
+        (
+            [[10, 20, 30, 40], [50, 30, 20]],
+            [50, 60, 70],
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_goal_seeking_weighted_average_batch_usecases(
+    client,
+    weight_matrix,
+    goals,
+    expected_status,
+    expected_errors,
+):
+    payload = {"weight_matrix": weight_matrix, "goals": goals}
+    response = client.post("/api/v1/goal-seeking/weighted-average/batch", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert [result["error"] for result in data["results"]] == expected_errors
+    for i, result in enumerate(data["results"]):
+        if result["error"] is not None:
+            continue
+
+        goal = goals[i] if len(goals) > 1 else goals[0]
+        single = client.post(
+            "/api/v1/goal-seeking/weighted-average",
+            params={"n_total": len(weight_matrix[i]), "goal": goal, "weight_array": weight_matrix[i]},
+        ).json()
+        assert result["initial_loss_rate"] == pytest.approx(single["initial_loss_rate"])
+        assert result["loss_rate_array"] == pytest.approx(single["loss_rate_array"])
+        assert result["weighted_average"] == pytest.approx(goal)
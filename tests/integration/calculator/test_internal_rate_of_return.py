@@ -0,0 +1,62 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected_irr, expected_converged",
+    [
+        (
+            {"cash_flows": [[-100, 110], [-100, 0, 121]]},
+            200,
+            [10, 10],
+            [True, True],
+        ),
+        (
+            {"cash_flows": [[-1000, 300, 400, 500]], "guess": 50},
+            200,
+            [8.896],
+            [True],
+        ),
+        (
+            {"cash_flows": [[-100, 110], [100, 50]]},
+            200,
+            [10, None],
+            [True, False],
+        ),
+        (
+            {"cash_flows": [[-100, 110]], "dates": [["2024-01-01", "2024-12-31"]]},
+            200,
+            [10],
+            [True],
+        ),
+        (
+            {"cash_flows": [[-100, 110]], "dates": [["2024-01-01"]]},
+            400,
+            None,
+            None,
+        ),
+    ]
+)
+
+def test_internal_rate_of_return_usecases(
+    client,
+    payload,
+    expected_status,
+    expected_irr,
+    expected_converged,
+):
+    response = client.post("/api/v1/calculations/irr", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["converged"] == expected_converged
+    for irr, expected in zip(data["irr"], expected_irr):
+        if expected is None:
+            assert irr is None
+        else:
+            assert irr == pytest.approx(expected, abs=1e-3)
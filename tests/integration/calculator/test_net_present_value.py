@@ -0,0 +1,57 @@
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected_npv",
+    [
+        (
+            {"cash_flows": [[110], [0, 121]], "rate": 10},
+            200,
+            [100, 100],
+        ),
+        (
+            {"cash_flows": [[110, 121], [105, 110.25]], "rates": [10, 5]},
+            200,
+            [200, 200],
+        ),
+        (
+            {"cash_flows": [[100, 100]], "rate_curve": [10, 10], "start_period": 0},
+            200,
+            [100 + 100 / 1.1],
+        ),
+        (
+            {"cash_flows": [[100, 100]], "rate": 10, "rates": [10]},
+            400,
+            None,
+        ),
+        (
+            {"cash_flows": [[100, 100]], "rate_curve": [10]},
+            400,
+            None,
+        ),
+        (
+            {"cash_flows": [[100, 100]], "rate": -100},
+            400,
+            None,
+        ),
+    ]
+)
+
+def test_net_present_value_usecases(
+    client,
+    payload,
+    expected_status,
+    expected_npv,
+):
+    response = client.post("/api/v1/calculations/present-value/npv", json={**payload, "include_discount_factors": True})
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["npv"] == pytest.approx(expected_npv)
+    assert "discount_factors" in data
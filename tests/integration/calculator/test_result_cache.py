@@ -0,0 +1,68 @@
+import pytest
+
+@pytest.fixture
+def auth_token(client):
+    login_payload = {"email": "usertest1@gmail.com", "password": "Password123!"}
+    login_response = client.post("/api/v1/auth/login", json=login_payload)
+    assert login_response.status_code == 200
+    access_token = login_response.cookies.get("access_token")
+    return access_token
+
+@pytest.mark.parametrize(
+    "path, params, changed",
+    [
+        ("/api/v1/calculations/depreciation", {"harga_perolehan": 1200, "estimasi_umur": 3, "metode": "sum_of_years_digits"}, {"estimasi_umur": 4}),
+        ("/api/v1/calculations/present-value", {"future_value": 1000, "rate": 10, "period": 3}, {"rate": 11}),
+        ("/api/v1/calculations/weighted-average", {"n_total": 2, "loss_rate_array": [10, 20], "weight_array": [1, 3]}, {"weight_array": [1, 4]}),
+        ("/api/v1/goal-seeking/weighted-average", {"n_total": 4, "goal": 50, "weight_array": [10, 20, 30, 40]}, {"goal": 55}),
+    ]
+)
+
+def test_result_cache_usecases(
+    client,
+    auth_token,
+    path,
+    params,
+    changed,
+):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    before = client.get("/api/v1/calculations/cache/stats", headers=headers).json()
+
+    first = client.post(path, params=params)
+    second = client.post(path, params=params)
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+    revalidated = client.post(path, params=params, headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == first.headers["ETag"]
+
+    # "*" and ETags of results never computed do not short-circuit the calculation.
+    wildcard = client.post(path, params={**params, **changed}, headers={"If-None-Match": "*"})
+    assert wildcard.status_code == 200
+
+    other = client.post(path, params={**params, **changed})
+    assert other.status_code == 200
+    assert other.headers["ETag"] != first.headers["ETag"]
+    assert other.json() == wildcard.json()
+
+    after = client.get("/api/v1/calculations/cache/stats", headers=headers).json()
+    assert after["hits"] - before["hits"] >= 1
+    assert after["not_modified"] - before["not_modified"] == 1
+
+def test_result_cache_requires_auth(client):
+    assert client.get("/api/v1/calculations/cache/stats").status_code in (401, 403)
+
+def test_result_cache_skips_errors(client):
+    params = {"loss_rate_array": [1], "weight_array": [0]}
+    for _ in range(2):
+        response = client.post("/api/v1/calculations/weighted-average", params=params)
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+
+def test_result_cache_validates_before_not_modified(client):
+    # An ETag for inputs that never produced a result is not answered with 304.
+    params = {"loss_rate_array": [1], "weight_array": [0]}
+    response = client.post("/api/v1/calculations/weighted-average", params=params, headers={"If-None-Match": "*"})
+    assert response.status_code == 400
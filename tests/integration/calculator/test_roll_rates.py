@@ -0,0 +1,65 @@
+import pytest
+
+JANUARY = {"month": "2024-01-31", "account_ids": ["a", "b", "c", "d"], "buckets": [0, 0, 1, 2], "balances": [100, 100, 50, 10]}
+FEBRUARY = {"month": "2024-02-29", "account_ids": ["a", "b", "c", "e"], "buckets": [0, 1, 2, 0], "balances": [100, 100, 50, 30]}
+
+@pytest.fixture
+def history(client):
+    response = client.post("/api/v1/goal-seeking/roll-rates", json={"buckets": ["current", "30", "60+"]})
+    assert response.status_code == 201
+    data = response.json()
+    yield data
+    client.delete(f"/api/v1/goal-seeking/roll-rates/{data['history_id']}")
+
+@pytest.mark.parametrize(
+    "snapshots, expected_status, expected_loss_rates, expected_weights",
+    [
+        ([JANUARY], 200, [0, 0, 100], [200 / 260 * 100, 50 / 260 * 100, 10 / 260 * 100]),
+        ([JANUARY, FEBRUARY], 200, [50, 100, 100], [130 / 280 * 100, 100 / 280 * 100, 50 / 280 * 100]),
+        ([FEBRUARY, JANUARY], 200, [50, 100, 100], [130 / 280 * 100, 100 / 280 * 100, 50 / 280 * 100]),
+        ([{**JANUARY, "buckets": [0, 0, 1, 3]}], 400, None, None),
+        ([{**JANUARY, "account_ids": ["a", "a", "c", "d"]}], 400, None, None),
+    ]
+)
+
+def test_roll_rate_history_usecases(
+    client,
+    history,
+    snapshots,
+    expected_status,
+    expected_loss_rates,
+    expected_weights,
+):
+    for snapshot in snapshots:
+        response = client.put(f"/api/v1/goal-seeking/roll-rates/{history['history_id']}/snapshots", json=snapshot)
+
+    assert response.status_code == expected_status, (
+        f"For snapshots {snapshots}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["loss_rate_array"] == pytest.approx(expected_loss_rates)
+    assert data["weight_array"] == pytest.approx(expected_weights)
+    assert data == client.get(f"/api/v1/goal-seeking/roll-rates/{history['history_id']}").json()
+
+def test_roll_rate_history_folds_old_months(client, history):
+    url = f"/api/v1/goal-seeking/roll-rates/{history['history_id']}/snapshots"
+    months = [f"{2024 + (m - 1) // 12}-{(m - 1) % 12 + 1:02d}-01" for m in range(1, 16)]
+    for month in months:
+        response = client.put(url, json={**JANUARY, "month": month})
+        assert response.status_code == 200
+
+    # Months past the replacement window still count through their transitions.
+    data = response.json()
+    assert len(data["months"]) == 15
+    assert data["transitions_used"] == 14
+    assert client.put(url, json={**FEBRUARY, "month": months[0]}).status_code == 400
+    assert client.put(url, json={**FEBRUARY, "month": months[-13]}).status_code == 200
+
+def test_unknown_roll_rate_history(client):
+    response = client.get("/api/v1/goal-seeking/roll-rates/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 404
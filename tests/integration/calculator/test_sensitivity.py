@@ -0,0 +1,137 @@
+import pytest
+from app.services.calculators.goal_seeking_weighted_average import GoalSeekingWeightedAverage
+
+def expected_cell(payload, x, y):
+    inputs = {**payload["base"], payload["x_axis"]["name"]: x, payload["y_axis"]["name"]: y}
+    if payload["calculator"] == "present_value":
+        return inputs["future_value"] / (1 + inputs["rate"] / 100) ** inputs["period"]
+    if payload["calculator"] == "goal_seeking":
+        weights = list(inputs["weight_array"])
+        for name, value in inputs.items():
+            if name.startswith("weight:"):
+                weights[int(name.split(":")[1])] = value
+        shift = 1 + inputs.get("weight_shift", 0) / 100
+        weights = weights[:1] + [weight * shift for weight in weights[1:]]
+        try:
+            return GoalSeekingWeightedAverage().solve_initial_loss_rate(weights, inputs["goal"])
+        except ValueError:
+            return None
+    return None
+
+@pytest.mark.parametrize(
+    "payload, expected_status",
+    [
+        (
+            {
+                "calculator": "present_value",
+                "base": {"future_value": 1000000},
+                "x_axis": {"name": "rate", "values": [0, 5, 10]},
+                "y_axis": {"name": "period", "values": [1, 2, 3, 4]},
+            },
+            200,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "base": {"rate": 8},
+                "x_axis": {"name": "future_value", "values": [100, 200]},
+                "y_axis": {"name": "period", "values": [0, 10]},
+            },
+            200,
+        ),
+        (
+            {
+                "calculator": "goal_seeking",
+                "base": {"weight_array": [10, 20, 30, 40]},
+                "x_axis": {"name": "goal", "values": [20, 40, 60]},
+                "y_axis": {"name": "weight_shift", "values": [-10, 0, 10]},
+            },
+            200,
+        ),
+        (
+            {
+                "calculator": "goal_seeking",
+                "base": {"weight_array": [10, 20, 30, 40], "goal": 50},
+                "x_axis": {"name": "weight:0", "values": [0, 10, 20]},
+                "y_axis": {"name": "weight:3", "values": [40, 80]},
+            },
+            200,
+        ),
+        (
+            {
+                "calculator": "tvm",
+                "base": {"solve_for": "pmt", "pv": 200000},
+                "x_axis": {"name": "rate", "values": [0.5, 1]},
+                "y_axis": {"name": "nper", "values": [120, 240, 360]},
+            },
+            200,
+        ),
+        (
+            {
+                "calculator": "goal_seeking",
+                "base": {"weight_array": [1] * 1000},
+                "x_axis": {"name": "goal", "values": list(range(1, 101))},
+                "y_axis": {"name": "weight_shift", "values": list(range(11))},
+            },
+            400,
+        ),
+        (
+            {
+                "calculator": "present_value",
+                "base": {"future_value": 1000},
+                "x_axis": {"name": "rate", "values": [5]},
+                "y_axis": {"name": "rate", "values": [1]},
+            },
+            400,
+        ),
+        (
+            {
+                "calculator": "goal_seeking",
+                "base": {"weight_array": [10, 20, 30, 40], "goal": 50},
+                "x_axis": {"name": "weight:9", "values": [1]},
+                "y_axis": {"name": "weight_shift", "values": [0]},
+            },
+            400,
+        ),
+        (
+            {
+                "calculator": "irr",
+                "base": {},
+                "x_axis": {"name": "rate", "values": [1]},
+                "y_axis": {"name": "period", "values": [1]},
+            },
+            400,
+        ),
+    ]
+)
+
+def test_sensitivity_usecases(
+    client,
+    payload,
+    expected_status,
+):
+    response = client.post("/api/v1/calculations/sensitivity", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    x_values = payload["x_axis"]["values"]
+    y_values = payload["y_axis"]["values"]
+    assert len(data["matrix"]) == len(x_values)
+    assert all(len(row) == len(y_values) for row in data["matrix"])
+    if payload["calculator"] == "tvm":
+        assert data["matrix"][0][2] == pytest.approx(-1199.10105, abs=1e-4)
+        return
+    for i, x in enumerate(x_values):
+        for j, y in enumerate(y_values):
+            expected = expected_cell(payload, x, y)
+            if expected is None:
+                assert data["matrix"][i][j] is None
+            else:
+                assert data["matrix"][i][j] == pytest.approx(expected, rel=1e-6)
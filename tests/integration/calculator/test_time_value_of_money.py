@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected_shape, expected_result",
+    [
+        (
+            {"solve_for": "pmt", "rate": 0.5, "nper": 360, "pv": 200000},
+            200,
+            [],
+            -1199.10105,
+        ),
+        (
+            {"solve_for": "fv", "rate": [0, 5], "nper": 10, "pmt": -100, "pv": -1000, "when": 1},
+            200,
+            [2],
+            [2000, 2949.57334],
+        ),
+        (
+            {"solve_for": "nper", "rate": [[0], [1]], "pmt": [-100, -200], "pv": 1000},
+            200,
+            [2, 2],
+            [[10, 5], [10.58864, 5.15493]],
+        ),
+        (
+            {"solve_for": "rate", "nper": 360, "pmt": -1199.10105, "pv": 200000},
+            200,
+            [],
+            0.5,
+        ),
+        (
+            {"solve_for": "rate", "nper": [10, 10], "pmt": [-100, 100], "pv": 800},
+            200,
+            [2],
+            [4.27750, None],
+        ),
+        (
+            {"solve_for": "rate", "nper": [10, 10], "pmt": -100, "pv": [1000, 800], "guess": 0},
+            200,
+            [2],
+            [0, 4.27750],
+        ),
+        (
+            {"solve_for": "pv", "rate": 10, "nper": [1, 2, 3], "fv": [1, 2]},
+            400,
+            None,
+            None,
+        ),
+        (
+            {"solve_for": "pv", "rate": [[5]] * 1001, "nper": list(range(1, 1001)), "fv": 100},
+            400,
+            None,
+            None,
+        ),
+        (
+            {"solve_for": "pv", "nper": 10, "fv": 100},
+            400,
+            None,
+            None,
+        ),
+        (
+            {"solve_for": "pv", "rate": 10, "nper": 10, "pv": 100},
+            400,
+            None,
+            None,
+        ),
+    ]
+)
+
+def test_time_value_of_money_usecases(
+    client,
+    payload,
+    expected_status,
+    expected_shape,
+    expected_result,
+):
+    response = client.post("/api/v1/calculations/tvm", json=payload)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert data["shape"] == expected_shape
+    result = np.array(data["result"], dtype=object).ravel()
+    expected_result = np.array(expected_result, dtype=object).ravel()
+    for value, expected in zip(result, expected_result):
+        if expected is None:
+            assert value is None
+        else:
+            assert value == pytest.approx(expected, abs=1e-4)
@@ -0,0 +1,106 @@
+import pytest
+from sqlalchemy import text
+
+TEST_PREFIX = "TEST-FA-"
+
+ASSETS = [
+    {"code": f"{TEST_PREFIX}1", "name": "Truck", "harga_perolehan": 1200, "estimasi_umur": 1, "metode": "straight_line", "tanggal_perolehan": "2025-01-16"},
+    {"code": f"{TEST_PREFIX}2", "name": "Server", "harga_perolehan": 2400, "estimasi_umur": 2, "metode": "double_declining", "tanggal_perolehan": "2024-02-01"},
+]
+
+@pytest.fixture
+def register(client):
+    login_payload = {"email": "usertest1@gmail.com", "password": "Password123!"}
+    login_response = client.post("/api/v1/auth/login", json=login_payload)
+    assert login_response.status_code == 200
+    headers = {"Authorization": f"Bearer {login_response.cookies.get('access_token')}"}
+    company_id = client.get("/api/v1/companies/", headers=headers).json()["result"][0]["id"]
+
+    response = client.put(f"/api/v1/fixed-assets/companies/{company_id}", json={"assets": ASSETS}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["meta"] == {"created": 2, "recomputed": 0, "unchanged": 0, "schedule_rows": 37}
+    return company_id, headers
+
+@pytest.mark.parametrize(
+    "assets, expected_status, expected_meta",
+    [
+        (ASSETS, 200, {"created": 0, "recomputed": 0, "unchanged": 2, "schedule_rows": 0}),
+        ([{**ASSETS[0], "name": "Pickup"}], 200, {"created": 0, "recomputed": 0, "unchanged": 1, "schedule_rows": 0}),
+        ([{**ASSETS[0], "harga_perolehan": 1200.004}], 200, {"created": 0, "recomputed": 0, "unchanged": 1, "schedule_rows": 0}),
+        ([{**ASSETS[0], "harga_perolehan": 2400}], 200, {"created": 0, "recomputed": 1, "unchanged": 0, "schedule_rows": 13}),
+        ([{**ASSETS[0], "code": f"{TEST_PREFIX}3"}, ASSETS[1]], 200, {"created": 1, "recomputed": 0, "unchanged": 1, "schedule_rows": 13}),
+        ([{**ASSETS[0], "estimasi_umur": -1}], 400, None),
+        ([ASSETS[0], ASSETS[0]], 400, None),
+    ]
+)
+
+def test_sync_fixed_assets_usecases(
+    client,
+    register,
+    assets,
+    expected_status,
+    expected_meta,
+):
+    company_id, headers = register
+    response = client.put(f"/api/v1/fixed-assets/companies/{company_id}", json={"assets": assets}, headers=headers)
+
+    assert response.status_code == expected_status, (
+        f"For assets {assets}, expected status {expected_status} but got {response.status_code}"
+    )
+    if expected_status == 200:
+        assert response.json()["meta"] == expected_meta
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"period_start": "2025-03-15"}, [("2025-03-31", 100, 2)]),
+        ({"period_start": "2025-01-01", "period_end": "2025-02-28"}, [("2025-01-31", 100 * 16 / 31 + 200, 2), ("2025-02-28", 100, 2)]),
+        ({"period_start": "2026-03-01"}, []),
+    ]
+)
+
+def test_period_depreciation_usecases(
+    client,
+    register,
+    params,
+    expected,
+):
+    company_id, headers = register
+    response = client.get(f"/api/v1/fixed-assets/companies/{company_id}/depreciation", params=params, headers=headers)
+    assert response.status_code == 200
+
+    result = response.json()["result"]
+    assert [row["period"] for row in result] == [period for period, _, _ in expected]
+    assert [row["depreciation"] for row in result] == pytest.approx([total for _, total, _ in expected], abs=0.01)
+    assert [row["asset_count"] for row in result] == [count for _, _, count in expected]
+
+def test_update_fixed_asset_recomputes_only_on_input_change(client, register):
+    company_id, headers = register
+    asset_id = client.get(f"/api/v1/fixed-assets/companies/{company_id}", headers=headers).json()["result"][1]["id"]
+
+    response = client.patch(f"/api/v1/fixed-assets/{asset_id}", json={"name": "Server room"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["meta"]["recomputed"] == 0
+
+    response = client.patch(f"/api/v1/fixed-assets/{asset_id}", json={"estimasi_umur": 3, "metode": "straight_line"}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["meta"]["recomputed"] == 1
+    schedule = data["result"]["schedule"]
+    assert len(schedule) == 36
+    assert schedule[-1]["book_value"] == pytest.approx(0)
+    # Stored to the sen, with monthly charges adding up to the accumulated total.
+    assert all(row["depreciation"] == round(row["depreciation"], 2) for row in schedule)
+    assert sum(row["depreciation"] for row in schedule) == pytest.approx(schedule[-1]["accumulated_depreciation"], abs=1e-9)
+    assert all(row["book_value"] == pytest.approx(2400 - row["accumulated_depreciation"], abs=1e-9) for row in schedule)
+
+    assert client.delete(f"/api/v1/fixed-assets/{asset_id}", headers=headers).status_code == 200
+    assert client.get(f"/api/v1/fixed-assets/{asset_id}", headers=headers).status_code == 404
+
+@pytest.fixture(scope="function", autouse=True)
+def cleanup_fixed_asset_data(session):
+    yield
+    assets = "SELECT id FROM fixed_assets WHERE code LIKE :prefix"
+    session.execute(text(f"DELETE FROM depreciation_schedules WHERE asset_id IN ({assets})"), {"prefix": f"{TEST_PREFIX}%"})
+    session.execute(text("DELETE FROM fixed_assets WHERE code LIKE :prefix"), {"prefix": f"{TEST_PREFIX}%"})
+    session.commit()
@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy import text
+
+TEST_YEAR = 2999
+
+@pytest.fixture
+def auth_token(client):
+    login_payload = {"email": "usertest1@gmail.com", "password": "Password123!"}
+    login_response = client.post("/api/v1/auth/login", json=login_payload)
+    assert login_response.status_code == 200
+    access_token = login_response.cookies.get("access_token")
+    return access_token
+
+@pytest.fixture
+def workspace(client, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    company_id = client.get("/api/v1/companies/", headers=headers).json()["result"][0]["id"]
+    response = client.post("/api/v1/workspaces/", json={"company_id": company_id, "year": TEST_YEAR}, headers=headers)
+    assert response.status_code == 201
+    workspace_id = response.json()["result"]["id"]
+
+    nodes = [
+        {"name": "depreciation", "calculator": "depreciation", "inputs": {"harga_perolehan": 1000, "estimasi_umur": 4, "metode": "straight_line"}},
+        {"name": "tax_shield", "calculator": "net_present_value", "inputs": {"rate": 10, "factor": 0.22}},
+        {"name": "loss_rates", "calculator": "goal_seeking", "inputs": {"weight_array": [10, 20, 30, 40], "goal": 50}},
+        {"name": "provision", "calculator": "provision", "inputs": {"exposure": [100, 100, 100, 100]}},
+    ]
+    edges = [
+        {"source": "depreciation", "output": "jadwal_per_tahun", "target": "tax_shield", "input": "cash_flows"},
+        {"source": "loss_rates", "output": "loss_rate_array", "target": "provision", "input": "loss_rate_array"},
+    ]
+    for node in nodes:
+        assert client.post(f"/api/v1/workspaces/{workspace_id}/nodes", json=node, headers=headers).status_code == 201
+    for edge in edges:
+        assert client.post(f"/api/v1/workspaces/{workspace_id}/edges", json=edge, headers=headers).status_code == 201
+    return workspace_id, headers
+
+@pytest.mark.parametrize(
+    "name, inputs, expected_status, expected_recomputed",
+    [
+        ("depreciation", {"harga_perolehan": 2000}, 200, ["depreciation", "tax_shield"]),
+        ("provision", {"exposure": [1, 2, 3, 4]}, 200, ["provision"]),
+        ("loss_rates", {"goal": 50}, 200, []),
+        ("loss_rates", {"goal": 150}, 200, ["loss_rates", "provision"]),
+        ("loss_rates", {"rate": 5}, 400, None),
+        ("missing", {"goal": 50}, 404, None),
+    ]
+)
+
+def test_calculation_workspace_update_usecases(
+    client,
+    workspace,
+    name,
+    inputs,
+    expected_status,
+    expected_recomputed,
+):
+    workspace_id, headers = workspace
+    response = client.patch(f"/api/v1/workspaces/{workspace_id}/nodes/{name}", json={"inputs": inputs}, headers=headers)
+
+    assert response.status_code == expected_status, (
+        f"For node {name} inputs {inputs}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    assert sorted(data["meta"]["recomputed"]) == sorted(expected_recomputed)
+    nodes = {node["name"]: node for node in data["result"]["nodes"]}
+    harga_perolehan = nodes["depreciation"]["inputs"]["harga_perolehan"]
+    assert nodes["tax_shield"]["output"]["npv"] == pytest.approx(harga_perolehan / 4 * 0.22 * sum(1.1 ** -t for t in range(1, 5)))
+    if nodes["loss_rates"].get("output") is None:
+        assert nodes["provision"].get("error") is not None
+    else:
+        exposure = nodes["provision"]["inputs"]["exposure"]
+        loss_rates = nodes["loss_rates"]["output"]["loss_rate_array"]
+        assert nodes["provision"]["output"]["provision"] == pytest.approx(sum(e * r / 100 for e, r in zip(exposure, loss_rates)))
+
+def test_calculation_workspace_rejects_cycles(client, workspace):
+    workspace_id, headers = workspace
+    edge = {"source": "tax_shield", "output": "npv", "target": "depreciation", "input": "harga_perolehan"}
+    response = client.post(f"/api/v1/workspaces/{workspace_id}/edges", json=edge, headers=headers)
+    assert response.status_code == 400
+
+@pytest.mark.parametrize("future_value", ["abc", [1, 2], None])
+def test_calculation_workspace_type_checks_node_inputs(client, workspace, future_value):
+    workspace_id, headers = workspace
+    node = {"name": "present_value", "calculator": "present_value", "inputs": {"future_value": future_value, "rate": 10}}
+    response = client.post(f"/api/v1/workspaces/{workspace_id}/nodes", json=node, headers=headers)
+    if future_value is not None:
+        assert response.status_code == 400
+        assert "future_value" in response.json()["detail"]
+        return
+
+    # A list output wired into a numeric input fails the node, not the request.
+    assert response.status_code == 201
+    edge = {"source": "depreciation", "output": "jadwal_per_tahun", "target": "present_value", "input": "future_value"}
+    response = client.post(f"/api/v1/workspaces/{workspace_id}/edges", json=edge, headers=headers)
+    assert response.status_code == 201
+    nodes = {node["name"]: node for node in response.json()["result"]["nodes"]}
+    assert nodes["present_value"].get("output") is None
+    assert "future_value" in nodes["present_value"]["error"]
+
+@pytest.fixture(scope="function", autouse=True)
+def cleanup_workspace_data(session):
+    yield
+    workspaces = "SELECT id FROM calculation_workspaces WHERE year = :year"
+    for table in ("calculation_edges", "calculation_nodes"):
+        session.execute(text(f"DELETE FROM {table} WHERE workspace_id IN ({workspaces})"), {"year": TEST_YEAR})
+    session.execute(text("DELETE FROM calculation_workspaces WHERE year = :year"), {"year": TEST_YEAR})
+    session.commit()
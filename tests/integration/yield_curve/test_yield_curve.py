@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import text
+
+TEST_CURVE = "test-curve"
+
+@pytest.fixture
+def headers(client):
+    login_payload = {"email": "usertest1@gmail.com", "password": "Password123!"}
+    login_response = client.post("/api/v1/auth/login", json=login_payload)
+    assert login_response.status_code == 200
+    return {"Authorization": f"Bearer {login_response.cookies.get('access_token')}"}
+
+@pytest.fixture
+def curve(client, headers):
+    versions = [
+        {"name": TEST_CURVE, "tenors": [1, 2, 5], "rates": [4, 5, 6], "interpolation": "linear"},
+        {"name": TEST_CURVE, "tenors": [1, 2, 5], "rates": [5, 5, 5], "interpolation": "log_linear"},
+    ]
+    for payload in versions:
+        assert client.post("/api/v1/yield-curves/", json=payload, headers=headers).status_code == 201
+    return versions
+
+@pytest.mark.parametrize(
+    "payload, expected_status",
+    [
+        ({"name": TEST_CURVE, "tenors": [0.5, 1, 10], "rates": [3, 3.5, 4.5], "interpolation": "cubic"}, 201),
+        ({"name": TEST_CURVE, "tenors": [2, 1], "rates": [3, 3], "interpolation": "linear"}, 400),
+        ({"name": TEST_CURVE, "tenors": [1, 2], "rates": [3], "interpolation": "linear"}, 400),
+        ({"name": TEST_CURVE, "tenors": [1], "rates": [-100], "interpolation": "linear"}, 400),
+        ({"name": TEST_CURVE, "tenors": [1], "rates": [3], "interpolation": "spline"}, 400),
+    ]
+)
+
+def test_create_yield_curve_usecases(
+    client,
+    headers,
+    payload,
+    expected_status,
+):
+    response = client.post("/api/v1/yield-curves/", json=payload, headers=headers)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+    if expected_status == 201:
+        assert response.json()["result"]["version"] == 1
+
+def test_yield_curve_versions(client, headers, curve):
+    versions = client.get(f"/api/v1/yield-curves/{TEST_CURVE}/versions", headers=headers).json()["result"]
+    assert [version["version"] for version in versions] == [1, 2]
+
+    latest = client.get(f"/api/v1/yield-curves/{TEST_CURVE}", headers=headers).json()["result"]
+    assert latest["version"] == 2
+    assert latest["interpolation"] == "log_linear"
+
+    first = client.get(f"/api/v1/yield-curves/{TEST_CURVE}", params={"version": 1}, headers=headers).json()["result"]
+    assert first["rates"] == curve[0]["rates"]
+
+    assert client.get(f"/api/v1/yield-curves/{TEST_CURVE}", params={"version": 9}, headers=headers).status_code == 404
+
+@pytest.mark.parametrize(
+    "payload, expected_status, expected",
+    [
+        ({"version": 1, "cash_flows": [[100, 100, 100]]}, 200, [100 / 1.04 + 100 / 1.05 ** 2 + 100 / 1.0533333333333333 ** 3]),
+        ({"cash_flows": [[100, 100, 100], [50]]}, 200, [100 * sum(1.05 ** -t for t in (1, 2, 3)), 50 / 1.05]),
+        ({"version": 1, "future_value": [100, 100], "period": [0, 18], "periods_per_year": 12}, 200, [100, 100 / 1.045 ** 1.5]),
+        ({"future_value": [100], "period": [-1]}, 400, None),
+        ({"future_value": [100]}, 400, None),
+        ({}, 400, None),
+    ]
+)
+
+def test_yield_curve_present_value_usecases(
+    client,
+    headers,
+    curve,
+    payload,
+    expected_status,
+    expected,
+):
+    response = client.post(f"/api/v1/yield-curves/{TEST_CURVE}/present-value", json=payload, headers=headers)
+
+    assert response.status_code == expected_status, (
+        f"For payload {payload}, expected status {expected_status} but got {response.status_code}"
+    )
+
+    data = response.json()
+    if expected_status != 200:
+        assert "detail" in data, "Expected an error detail in the response."
+        return
+
+    values = data["result"]["npv"] if "cash_flows" in payload else data["result"]["present_value"]
+    assert values == pytest.approx(expected)
+    assert data["meta"]["version"] == payload.get("version", 2)
+
+@pytest.fixture(scope="function", autouse=True)
+def cleanup_yield_curve_data(session):
+    yield
+    session.execute(text("DELETE FROM yield_curves WHERE name = :name"), {"name": TEST_CURVE})
+    session.commit()